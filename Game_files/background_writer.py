@@ -0,0 +1,49 @@
+import threading
+from collections import OrderedDict
+
+class BackgroundWriter:
+    """
+    Runs write jobs on a worker thread so the game loop never waits on storage.
+    Jobs are keyed: submitting a key that is still queued replaces that job and
+    moves it to the back, so a burst of writes collapses into one. The thread
+    exits once the queue drains and the next submit starts a new one.
+    """
+    def __init__(self, name="writer"):
+        self.name = name
+        self.jobs = OrderedDict()  # key -> callable, oldest first
+        self.condition = threading.Condition()
+        self.thread = None
+        self.error = None
+
+    def submit(self, key, job):
+        with self.condition:
+            self.jobs.pop(key, None)
+            self.jobs[key] = job
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name=self.name, daemon=True)
+                self.thread.start()
+
+    def run(self):
+        while True:
+            with self.condition:
+                if not self.jobs:
+                    self.thread = None
+                    self.condition.notify_all()
+                    return
+                _, job = self.jobs.popitem(last=False)
+            try:
+                job()
+            except Exception as error:
+                # Keep going so later results still get written; flush() reports it.
+                with self.condition:
+                    if self.error is None:
+                        self.error = error
+
+    def flush(self, timeout=None):
+        # Waits until every submitted job has run, then raises the first error any of them hit.
+        with self.condition:
+            if not self.condition.wait_for(lambda: self.thread is None, timeout):
+                raise TimeoutError(f"{self.name} still busy after {timeout} s")
+            error, self.error = self.error, None
+        if error is not None:
+            raise error
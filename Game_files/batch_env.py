@@ -0,0 +1,266 @@
+import numpy as np
+from settings import (SCREEN_WIDTH, SCREEN_HEIGHT, LANE_WIDTH, PLAYER_CAR_SPEED,
+                      ENEMY_CAR_SPEED, ENEMY_SPAWN_CURVE, COIN_SPAWN_CURVE)
+from settings import CarDimensions as cd
+from .simulation import Input
+from .rng import RandomStreams
+from .spawn_scheduler import SpawnScheduler
+
+PLAYER_WIDTH = cd.PLAYER_CAR_WIDTH.value
+PLAYER_HEIGHT = cd.PLAYER_CAR_HEIGHT.value
+ENEMY_WIDTH = cd.ENEMY_CAR_WIDTH.value
+ENEMY_HEIGHT = cd.ENEMY_CAR_HEIGHT.value
+
+# Strategy ids, in the order GameModel.create_enemy_car picks them from.
+STRAIGHT, ZIGZAG, CHASE = 0, 1, 2
+STRATEGIES = (STRAIGHT, ZIGZAG, CHASE)
+LANE_CHANGE_COIN_COUNT = 5
+
+class BatchEnv:
+    """
+    Steps many independent games in lockstep, with enemies and coins stored in
+    NumPy arrays of shape (num_envs, capacity). Game number env draws from
+    RandomStreams(seed + env) in the same order the single game draws from its
+    streams, so a GameModel seeded the same way is reproduced tick for tick.
+    Checkpoints are not part of the batch rules: a crash ends the episode and
+    the game is reset.
+    """
+    def __init__(self, num_envs, seed=0, capacity=32):
+        self.num_envs = num_envs
+        self.rngs = [RandomStreams(seed + env) for env in range(num_envs)]
+        self.player_x = np.zeros(num_envs)
+        self.player_y = np.zeros(num_envs)
+        self.coin_count = np.zeros(num_envs, dtype=np.int64)
+        self.near_miss_count = np.zeros(num_envs, dtype=np.int64)
+
+        self.enemy_count = np.zeros(num_envs, dtype=np.int64)
+        self.enemy_x = np.zeros((num_envs, capacity))
+        self.enemy_y = np.zeros((num_envs, capacity))
+        self.enemy_strategy = np.zeros((num_envs, capacity), dtype=np.int8)
+        self.enemy_check = np.zeros((num_envs, capacity), dtype=bool)  # Still eligible for a near miss
+
+        self.coin_total = np.zeros(num_envs, dtype=np.int64)
+        self.coin_x = np.zeros((num_envs, capacity))
+        self.coin_y = np.zeros((num_envs, capacity))
+
+        # Only the spawn timing and queue of these are used; lanes are found from the arrays.
+        self.enemy_spawners = [SpawnScheduler(ENEMY_SPAWN_CURVE, ENEMY_WIDTH, ENEMY_HEIGHT) for _ in range(num_envs)]
+        self.coin_spawners = [SpawnScheduler(COIN_SPAWN_CURVE, PLAYER_WIDTH, PLAYER_HEIGHT) for _ in range(num_envs)]
+        self.reset()
+
+    def reset(self, envs=None):
+        envs = slice(None) if envs is None else envs
+        self.player_x[envs] = SCREEN_WIDTH // 2 - PLAYER_WIDTH // 2
+        self.player_y[envs] = SCREEN_HEIGHT - PLAYER_HEIGHT - 10
+        self.coin_count[envs] = 0
+        self.near_miss_count[envs] = 0
+        self.enemy_count[envs] = 0
+        self.coin_total[envs] = 0
+        for env in np.arange(self.num_envs)[envs]:
+            self.enemy_spawners[env].reset()
+            self.coin_spawners[env].reset()
+        return self.observe()
+
+    def step(self, actions):
+        actions = np.broadcast_to(np.asarray(actions, dtype=np.int64), (self.num_envs,))
+        self.move_players(actions)
+        near_misses = self.check_near_misses()
+        self.remove_off_screen_enemy_cars()
+        self.add_new_enemy_cars()
+        dones = self.move_enemy_cars()
+        coins = self.move_coins(~dones)
+        rewards = coins + near_misses
+        if dones.any():
+            self.reset(np.nonzero(dones)[0])
+        return self.observe(), rewards, dones, {"coins": coins, "near_misses": near_misses}
+
+    def observe(self):
+        enemies = np.where(self.enemy_live()[..., None],
+                           np.stack([self.enemy_x, self.enemy_y], axis=-1), np.nan)
+        coins = np.where(self.coin_live()[..., None],
+                         np.stack([self.coin_x, self.coin_y], axis=-1), np.nan)
+        return {
+            "player": np.stack([self.player_x, self.player_y], axis=1),
+            "coin_count": self.coin_count.copy(),
+            "enemies": enemies,
+            "coins": coins
+        }
+
+    def enemy_live(self):
+        return np.arange(self.enemy_x.shape[1]) < self.enemy_count[:, None]
+
+    def coin_live(self):
+        return np.arange(self.coin_x.shape[1]) < self.coin_total[:, None]
+
+    def move_players(self, actions):
+        # Same order and bounds as the movement commands.
+        px, py = self.player_x, self.player_y
+        np.subtract(px, PLAYER_CAR_SPEED, out=px, where=((actions & Input.LEFT) != 0) & (px > 0))
+        np.add(px, PLAYER_CAR_SPEED, out=px, where=((actions & Input.RIGHT) != 0) & (px < SCREEN_WIDTH - PLAYER_WIDTH))
+        np.subtract(py, PLAYER_CAR_SPEED, out=py, where=((actions & Input.UP) != 0) & (py > 0))
+        np.add(py, PLAYER_CAR_SPEED, out=py, where=((actions & Input.DOWN) != 0) & (py < SCREEN_HEIGHT - PLAYER_HEIGHT))
+
+    def check_near_misses(self):
+        near_misses = np.zeros(self.num_envs, dtype=np.int64)
+        checked = self.enemy_live() & self.enemy_check
+        if not checked.any():
+            return near_misses
+        dx = np.abs(self.player_x[:, None] - self.enemy_x)
+        dy = np.abs(self.player_y[:, None] - self.enemy_y)
+        band = (checked & (dx < PLAYER_WIDTH + 1) & (dy < PLAYER_HEIGHT + 1) &
+                ~((dx < PLAYER_WIDTH) & (dy < PLAYER_HEIGHT)))
+        # Each car counts once, like a car leaving EnemyCars.tracked.
+        near_misses = band.sum(axis=1)
+        self.near_miss_count += near_misses
+        self.enemy_check &= ~band
+        return near_misses
+
+    def remove_off_screen_enemy_cars(self):
+        # Same order as EntityStore.remove_below: the last car fills each hole.
+        off_screen = self.enemy_live() & (self.enemy_y >= SCREEN_HEIGHT)
+        for env in np.nonzero(off_screen.any(axis=1))[0]:
+            columns = (self.enemy_x[env], self.enemy_y[env], self.enemy_strategy[env], self.enemy_check[env])
+            ys = self.enemy_y[env]
+            count = self.enemy_count[env]
+            index = 0
+            while index < count:
+                if ys[index] >= SCREEN_HEIGHT:
+                    count -= 1
+                    for column in columns:
+                        column[index] = column[count]
+                else:
+                    index += 1
+            self.enemy_count[env] = count
+
+    def add_new_enemy_cars(self):
+        for env, rng in enumerate(self.rngs):
+            spawner = self.enemy_spawners[env]
+            if spawner.due(rng.spawn) and self.create_enemy_car(env, rng):
+                spawner.spawned()
+
+    def free_lanes(self, env, spawner):
+        # Same rule as SpawnScheduler.free_lanes, on one game's arrays.
+        count = self.enemy_count[env]
+        xs, ys = self.enemy_x[env, :count], self.enemy_y[env, :count]
+        in_band = np.abs(ys - spawner.y) < spawner.height
+        blocked = (np.abs(xs[in_band, None] - np.asarray(spawner.lane_xs)) < spawner.width).any(axis=0)
+        return np.nonzero(~blocked)[0].tolist()
+
+    def create_enemy_car(self, env, rng):
+        spawner = self.enemy_spawners[env]
+        lanes = self.free_lanes(env, spawner)
+        if not lanes:
+            return False
+        x = spawner.lane_xs[rng.spawn.choice(lanes)]
+        strategy = rng.spawn.choice(STRATEGIES)
+        count = self.enemy_count[env]
+        if count == self.enemy_x.shape[1]:
+            self.enemy_x = self.widen(self.enemy_x)
+            self.enemy_y = self.widen(self.enemy_y)
+            self.enemy_strategy = self.widen(self.enemy_strategy)
+            self.enemy_check = self.widen(self.enemy_check)
+        self.enemy_x[env, count] = x
+        self.enemy_y[env, count] = spawner.y
+        self.enemy_strategy[env, count] = strategy
+        self.enemy_check[env, count] = True
+        self.enemy_count[env] += 1
+        return True
+
+    def move_enemy_cars(self):
+        live = self.enemy_live()
+        lane_changing = self.coin_count >= LANE_CHANGE_COIN_COUNT
+        old_y = self.enemy_y.copy() if lane_changing.any() else None
+        self.enemy_y[live] += ENEMY_CAR_SPEED
+        if old_y is not None:
+            self.change_lanes(np.nonzero(lane_changing)[0], old_y)
+        return (live & self.hits_player(self.enemy_x, self.enemy_y)).any(axis=1)
+
+    def roll_lane_changes(self, envs):
+        # The strategy stream's draws, car by car in the single game's order:
+        # the lane for zig-zag cars, and whether chase cars turn.
+        directions = np.zeros((len(envs), self.enemy_x.shape[1]), dtype=np.int64)
+        chasing = np.zeros(directions.shape, dtype=bool)
+        for row, env in enumerate(envs):
+            rng = self.rngs[env].strategy
+            for car, strategy in enumerate(self.enemy_strategy[env, :self.enemy_count[env]].tolist()):
+                if strategy == ZIGZAG:
+                    if rng.random() < 0.02:
+                        directions[row, car] = rng.choice([-1, 1])
+                elif strategy == CHASE:
+                    chasing[row, car] = rng.random() < 0.01
+        return directions, chasing
+
+    def change_lanes(self, envs, old_y):
+        # ZigZagMovement and ChaseMovement for the given games, after every car
+        # has moved down. The single game moves cars one at a time, so a
+        # turning car sees the cars before it moved and the cars after it not
+        # yet; turning cars are taken in rounds, the n-th of every game at once.
+        # After a crash the single game stops drawing, but the batch game is
+        # reset then, so the extra draws never show.
+        directions, chasing = self.roll_lane_changes(envs)
+        xs = self.enemy_x[envs]
+        directions[chasing] = np.where(self.player_x[envs, None] > xs, 1, -1)[chasing]
+        target_x = xs + directions * LANE_WIDTH
+        rows, cars = np.nonzero((directions != 0) & (target_x >= 0) & (target_x <= SCREEN_WIDTH - ENEMY_WIDTH))
+        if not len(rows):
+            return
+        live = np.arange(xs.shape[1]) < self.enemy_count[envs, None]
+        new_y, old_y = self.enemy_y[envs], old_y[envs]
+        turn = np.arange(len(rows)) - np.searchsorted(rows, rows)  # n-th turning car of its game
+        for number in range(turn.max() + 1):
+            chosen = turn == number
+            row, car = rows[chosen], cars[chosen]
+            ys = np.where(np.arange(xs.shape[1]) < car[:, None], new_y[row], old_y[row])
+            ys[np.arange(len(car)), car] = new_y[row, car]
+            current_x = self.enemy_x[envs[row]]
+            targets = target_x[row, car]
+            blocked = (live[row] & (np.abs(current_x - targets[:, None]) < ENEMY_WIDTH) &
+                       (np.abs(ys - new_y[row, car][:, None]) < ENEMY_HEIGHT))
+            blocked[np.arange(len(car)), car] = False
+            free = ~blocked.any(axis=1)
+            self.enemy_x[envs[row[free]], car[free]] += (targets[free] - current_x[free, car[free]]) * 0.25
+
+    def hits_player(self, xs, ys):
+        px, py = self.player_x[:, None], self.player_y[:, None]
+        return ((py < ys + ENEMY_HEIGHT) & (py + PLAYER_HEIGHT > ys) &
+                (px < xs + ENEMY_WIDTH) & (px + PLAYER_WIDTH > xs))
+
+    def move_coins(self, active):
+        live = self.coin_live()
+        moving = live & active[:, None]
+        self.coin_y[moving] += ENEMY_CAR_SPEED
+        px, py = self.player_x[:, None], self.player_y[:, None]
+        collected = moving & ((py < self.coin_y + PLAYER_HEIGHT // 2) & (py + PLAYER_HEIGHT > self.coin_y) &
+                              (px < self.coin_x + PLAYER_WIDTH // 2) & (px + PLAYER_WIDTH > self.coin_x))
+        coins = collected.sum(axis=1)
+        self.coin_count += coins
+        keep = live & ~collected & (self.coin_y < SCREEN_HEIGHT)
+        if (live & ~keep).any():
+            order = np.argsort(~keep, axis=1, kind="stable")
+            self.coin_x = np.take_along_axis(self.coin_x, order, axis=1)
+            self.coin_y = np.take_along_axis(self.coin_y, order, axis=1)
+            self.coin_total = keep.sum(axis=1)
+        for env in np.nonzero(active)[0]:
+            spawner = self.coin_spawners[env]
+            if spawner.due(self.rngs[env].coin) and self.create_coin(env, self.rngs[env]):
+                spawner.spawned()
+        return coins
+
+    def create_coin(self, env, rng):
+        spawner = self.coin_spawners[env]
+        lanes = self.free_lanes(env, spawner)
+        if not lanes:
+            return False
+        total = self.coin_total[env]
+        if total == self.coin_x.shape[1]:
+            self.coin_x = self.widen(self.coin_x)
+            self.coin_y = self.widen(self.coin_y)
+        self.coin_x[env, total] = spawner.lane_xs[rng.coin.choice(lanes)]
+        self.coin_y[env, total] = spawner.y
+        self.coin_total[env] += 1
+        return True
+
+    def widen(self, array, fill=0):
+        wider = np.full((array.shape[0], array.shape[1] * 2), fill, dtype=array.dtype)
+        wider[:, :array.shape[1]] = array
+        return wider
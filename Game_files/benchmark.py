@@ -0,0 +1,195 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from settings import BENCHMARK_BASELINE, BENCHMARK_THRESHOLD, SCREEN_WIDTH, SCREEN_HEIGHT
+from .car_factory import CarFactory
+from .headless import HeadlessRunner
+from .leaderboard import Leaderboard
+from .leaderboard_storage import JsonLinesStorage
+from .memento import Memento
+from .model import GameModel
+from .rng import RandomStreams
+from .simulation import Simulation
+
+def make_model(directory, seed=0):
+    # A model whose leaderboard lives in the scratch directory, with the player immune.
+    leaderboard = Leaderboard(JsonLinesStorage(os.path.join(directory, "leaderboard.jsonl")))
+    model = GameModel(RandomStreams(seed), leaderboard=leaderboard)
+    model.game_state.detach(leaderboard)
+    model.checkpoint_loaded_time = float("inf")
+    return model
+
+def tick_workload(directory, enemies):
+    runner = HeadlessRunner(make_model(directory), stress_enemies=enemies)
+    def tick():
+        runner.fill_traffic()
+        runner.simulation.step()
+    return tick
+
+def spawn_workload(directory, spawns=20):
+    # Every tick tries to spawn a burst of cars above the screen, so most
+    # attempts find the spawn band crowded or full.
+    model = make_model(directory)
+    simulation = Simulation(model)
+    def tick():
+        for _ in range(spawns):
+            car = model.create_enemy_car()
+            if car:
+                model.game_objects.enemy_cars.append(car)
+                model.game_objects.enemy_cars.track(car)
+        simulation.step()
+    return tick
+
+def near_miss_workload(directory, enemies=200):
+    # Dense traffic where every car stays tracked for near misses.
+    runner = HeadlessRunner(make_model(directory), stress_enemies=enemies)
+    model = runner.model
+    def tick():
+        enemy_cars = model.game_objects.enemy_cars
+        before = len(enemy_cars)
+        runner.fill_traffic()
+        for car in enemy_cars[before:]:
+            enemy_cars.track(car)
+        runner.simulation.step()
+    return tick
+
+def render_workload(directory, enemies):
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from .UI import UI
+    from .game_controller import GameController
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    ui = UI(screen)
+    controller = GameController(make_model(directory), ui, record_replays=False, threaded=False)
+    controller.model.player.selected_car = CarFactory.create_car("ferrari")
+    runner = HeadlessRunner(controller.model, stress_enemies=enemies)
+    runner.simulation = controller.simulation
+    def frame():
+        runner.fill_traffic()
+        controller.simulation.step()
+        controller.render()
+    return frame
+
+def leaderboard_workload(directory, results=100_000):
+    path = os.path.join(directory, "leaderboard-bench.jsonl")
+    JsonLinesStorage(path).rewrite((f"player{number}", number % 500) for number in range(results))
+    leaderboard = Leaderboard(JsonLinesStorage(path))
+    scores = iter(range(10 ** 9))
+    def update():
+        score = next(scores) % 500
+        leaderboard.update("bench", score)
+        leaderboard.rank(score)
+    return update
+
+def checkpoint_workload(directory, enemies=200):
+    runner = HeadlessRunner(make_model(directory), stress_enemies=enemies)
+    runner.fill_traffic()
+    model = runner.model
+    def save_and_restore():
+        Memento.capture(model, 0).restore(model, restore_scores=False)
+    return save_and_restore
+
+# name -> (unit, operations per run, factory(directory) -> operation)
+WORKLOADS = {
+    "tick_10_enemies": ("ticks", 3000, lambda directory: tick_workload(directory, 10)),
+    "tick_100_enemies": ("ticks", 1000, lambda directory: tick_workload(directory, 100)),
+    "tick_1000_enemies": ("ticks", 100, lambda directory: tick_workload(directory, 1000)),
+    "spawn_heavy": ("ticks", 300, spawn_workload),
+    "near_miss_heavy": ("ticks", 300, near_miss_workload),
+    "render_100_enemies": ("frames", 300, lambda directory: render_workload(directory, 100)),
+    "leaderboard_update": ("updates", 3000, leaderboard_workload),
+    "checkpoint_save_restore": ("checkpoints", 300, checkpoint_workload)
+}
+
+def measure(operation, count, repeat=3):
+    # Best of repeat timed runs, then one pass under tracemalloc for memory.
+    for _ in range(max(count // 10, 1)):
+        operation()
+    best = float("inf")
+    retained_blocks = None
+    for _ in range(repeat):
+        blocks = sys.getallocatedblocks()
+        start = time.perf_counter()
+        for _ in range(count):
+            operation()
+        best = min(best, time.perf_counter() - start)
+        if retained_blocks is None:
+            retained_blocks = (sys.getallocatedblocks() - blocks) / count
+    peaks = 0
+    samples = max(count // 10, 1)
+    tracemalloc.start()
+    try:
+        for _ in range(samples):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            operation()
+            peaks += tracemalloc.get_traced_memory()[1] - current
+    finally:
+        tracemalloc.stop()
+    return {
+        "ops_per_second": count / best,
+        "peak_kib_per_op": peaks / samples / 1024,
+        "retained_blocks_per_op": retained_blocks
+    }
+
+def run(names=None, scale=1.0, repeat=3):
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for name in names or WORKLOADS:
+            unit, count, factory = WORKLOADS[name]
+            stats = measure(factory(directory), max(int(count * scale), 1), repeat)
+            stats["unit"] = unit
+            results[name] = stats
+    return {"python": platform.python_version(), "machine": platform.machine(), "results": results}
+
+def compare(report, baseline, threshold=BENCHMARK_THRESHOLD):
+    # Workloads whose throughput fell more than threshold below the baseline.
+    regressions = []
+    for name, stats in report["results"].items():
+        old = baseline["results"].get(name)
+        if old and stats["ops_per_second"] < old["ops_per_second"] * (1 - threshold):
+            regressions.append((name, old["ops_per_second"], stats["ops_per_second"]))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the model tick and render paths.")
+    parser.add_argument("workloads", nargs="*", help=f"any of {', '.join(WORKLOADS)}; default: all")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiply every workload's operation count")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save", nargs="?", const=BENCHMARK_BASELINE, help="write the results as the baseline")
+    parser.add_argument("--compare", nargs="?", const=BENCHMARK_BASELINE, help="fail on regressions against a baseline")
+    parser.add_argument("--threshold", type=float, default=BENCHMARK_THRESHOLD, help="allowed slowdown, 0.2 = 20%%")
+    args = parser.parse_args()
+    unknown = [name for name in args.workloads if name not in WORKLOADS]
+    if unknown:
+        parser.error(f"unknown workloads: {', '.join(unknown)}")
+    report = run(args.workloads, args.scale, args.repeat)
+    baseline = None
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+    print(f"{'workload':26} {'ops/s':>12} {'unit':>11} {'peak KiB/op':>12} {'blocks/op':>10} {'vs base':>8}")
+    for name, stats in report["results"].items():
+        old = baseline["results"].get(name) if baseline else None
+        change = f"{stats['ops_per_second'] / old['ops_per_second'] - 1:+8.1%}" if old else f"{'':>8}"
+        print(f"{name:26} {stats['ops_per_second']:12.0f} {stats['unit']:>11} {stats['peak_kib_per_op']:12.2f} "
+              f"{stats['retained_blocks_per_op']:10.2f} {change}")
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump(report, file, indent=2)
+        print(f"baseline written to {args.save}")
+    if baseline is not None:
+        regressions = compare(report, baseline, args.threshold)
+        for name, old, new in regressions:
+            print(f"REGRESSION {name}: {old:.0f} -> {new:.0f} ops/s")
+        if regressions:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
+from .entity_store import EntityView, Column, EncodedColumn
+from .pool import ObjectPool
 
 class Car(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def drive(self):
         pass
@@ -26,22 +30,34 @@ class Lambo(Car):
     def get_image(self):
         return "assets/lambo.png"
     
-class Enemy(Car):
-    def __init__(self, x, y, speed, strategy, car_type='enemy'):
+class Enemy(Car, EntityView):
+    # Fields live in the EnemyCars columns while the car is on the road.
+    x = Column()
+    y = Column()
+    speed = Column()
+    strategy = EncodedColumn()
+    entity_id = Column()  # Assigned by EnemyCars when None
+    __slots__ = ('_x', '_y', '_speed', '_strategy', '_entity_id', 'car_type')
+
+    def __init__(self, x, y, speed, strategy, car_type='enemy', entity_id=None):
+        super().__init__()
         self.x = x
         self.y = y
         self.speed = speed
         self.strategy = strategy
+        self.entity_id = entity_id
         self.car_type = car_type
 
     def move(self, player_x, enemy_cars, coin_count):
         self.strategy.move(self, player_x, enemy_cars, coin_count)
 
     def draw(self, ui):
-        ui.draw_car(self.x, self.y, self)
+        return ui.draw_car(self.x, self.y, self)
     
     def drive(self):
         return "I am an enemy"
     
     def get_image(self):
-        return "assets/enemy.png"
\ No newline at end of file
+        return "assets/enemy.png"
+
+Enemy.pool = ObjectPool(Enemy)
@@ -10,6 +10,6 @@ class CarFactory:
         elif car_type == "lambo":
             return Lambo()
         elif car_type == "enemy":
-            return Enemy(**params)
+            return Enemy.pool.acquire(**params)
         else:
             raise ValueError(f"Unknown car type: {car_type}")
\ No newline at end of file
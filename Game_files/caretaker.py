@@ -1,7 +1,22 @@
 # caretaker.py
+import zlib
+from settings import REWIND_CAPACITY, REWIND_KEYFRAME_INTERVAL
+from .memento import Memento
+
 class Caretaker:
-    def __init__(self):
+    """
+    Holds the checkpoint memento, plus a fixed-size ring buffer of recent
+    mementos for rewinding. Every keyframe_interval-th memento in the ring is
+    stored whole; the others are stored as an XOR delta against the latest
+    keyframe, so each restore touches at most two entries. All entries are
+    zlib-compressed. Deltas whose keyframe has been overwritten cannot be
+    decoded, so the buffer starts at the oldest keyframe still held.
+    """
+    def __init__(self, capacity=REWIND_CAPACITY, keyframe_interval=REWIND_KEYFRAME_INTERVAL):
         self.memento = None
+        self.capacity = capacity
+        self.keyframe_interval = keyframe_interval
+        self.clear()
 
     def save_memento(self, memento):
         self.memento = memento
@@ -9,4 +24,82 @@ class Caretaker:
     def get_last_memento(self):
         temp = self.memento
         self.memento = None
-        return temp
\ No newline at end of file
+        return temp
+
+    def clear(self):
+        self.memento = None
+        self.entries = [None] * self.capacity  # (tick, keyframe slot, keyframe tick, field sizes, data)
+        self.recorded = 0
+        self.keyframe = None  # (slot, memento)
+
+    def record(self, memento):
+        slot = self.recorded % self.capacity
+        sizes = tuple(len(field) for field in memento.fields)
+        if self.recorded % self.keyframe_interval == 0:
+            self.keyframe = (slot, memento)
+            self.entries[slot] = (memento.tick, None, None, sizes, zlib.compress(b"".join(memento.fields), 1))
+        else:
+            key_slot, key = self.keyframe
+            delta = b"".join(xor(field, base) for field, base in zip(memento.fields, key.fields))
+            self.entries[slot] = (memento.tick, key_slot, key.tick, sizes, zlib.compress(delta, 1))
+        self.recorded += 1
+
+    def start(self):
+        # Index of the oldest keyframe still in the ring.
+        oldest = self.recorded - min(self.recorded, self.capacity)
+        return min(-(-oldest // self.keyframe_interval) * self.keyframe_interval, self.recorded)
+
+    def ticks(self):
+        # Ticks that can be rewound to, oldest first.
+        start = self.start()
+        return [self.entries[index % self.capacity][0] for index in range(start, self.recorded)]
+
+    def rewind(self, tick):
+        # The newest memento recorded at or before tick, or None.
+        start = self.start()
+        low, high = start, self.recorded
+        while low < high:
+            middle = (low + high) // 2
+            if self.entries[middle % self.capacity][0] <= tick:
+                low = middle + 1
+            else:
+                high = middle
+        if low == start:
+            return None
+        return self.decode((low - 1) % self.capacity)
+
+    def decode(self, slot):
+        tick, key_slot, key_tick, sizes, data = self.entries[slot]
+        fields = split(zlib.decompress(data), sizes)
+        if key_slot is None:
+            return Memento(tick, fields)
+        key = self.entries[key_slot]
+        if key[0] != key_tick or key[1] is not None:
+            return None
+        base = split(zlib.decompress(key[4]), key[3])
+        return Memento(tick, (xor(field, base_field) for field, base_field in zip(fields, base)))
+
+    def nbytes(self):
+        return sum(len(entry[4]) for entry in self.entries if entry is not None)
+
+    def get_stats(self):
+        entries = [entry for entry in self.entries if entry is not None]
+        return {
+            "entries": len(entries),
+            "keyframes": sum(1 for entry in entries if entry[1] is None),
+            "bytes": self.nbytes(),
+            "raw_bytes": sum(sum(entry[3]) for entry in entries)
+        }
+
+def xor(data, base):
+    # XOR against the base, zero-padded or cut to len(data); applying it twice gives data back.
+    size = len(data)
+    base = base[:size].ljust(size, b"\0")
+    return (int.from_bytes(data, "little") ^ int.from_bytes(base, "little")).to_bytes(size, "little")
+
+def split(data, sizes):
+    fields, offset = [], 0
+    for size in sizes:
+        fields.append(data[offset:offset + size])
+        offset += size
+    return fields
@@ -1,7 +1,14 @@
-import pygame
 from settings import CarDimensions as cd
-class Coin:
+from .entity_store import EntityView, Column
+from .pool import ObjectPool
+
+class Coin(EntityView):
+    x = Column()
+    y = Column()
+    __slots__ = ('_x', '_y')
+
     def __init__(self, x, y):
+        super().__init__()
         self.x = x
         self.y = y
 
@@ -9,9 +16,11 @@ class Coin:
         self.y += speed
 
     def draw(self, ui):
-        ui.draw_coin(self.x, self.y)
+        return ui.draw_coin(self.x, self.y)
     def check_collision(self, player):
         return (player.car_y < self.y + cd.PLAYER_CAR_HEIGHT.value // 2 and
                 player.car_y + cd.PLAYER_CAR_HEIGHT.value > self.y and
                 player.car_x < self.x + cd.PLAYER_CAR_WIDTH.value // 2 and
-                player.car_x + cd.PLAYER_CAR_WIDTH.value > self.x)
\ No newline at end of file
+                player.car_x + cd.PLAYER_CAR_WIDTH.value > self.x)
+
+Coin.pool = ObjectPool(Coin)
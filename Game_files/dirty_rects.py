@@ -0,0 +1,37 @@
+import pygame
+
+class DirtyRectTracker:
+    def __init__(self, screen_rect):
+        self.screen_rect = pygame.Rect(screen_rect)
+        self.previous = []
+        self.full_redraw = True
+        self.last_fraction = 1.0
+        self.total_fraction = 0.0
+        self.frames = 0
+
+    def invalidate(self):
+        # Something other than the game loop drew the screen; push all of it next frame.
+        self.full_redraw = True
+
+    def collect(self, rects):
+        current = [self.screen_rect.clip(rect) for rect in rects if rect]
+        current = [rect for rect in current if rect.width and rect.height]
+        if self.full_redraw:
+            pushed = [self.screen_rect]
+            self.full_redraw = False
+        else:
+            # Last frame's rects must be repainted too, to erase what moved away.
+            pushed = self.previous + current
+        self.previous = current
+        self.record(pushed)
+        return pushed
+
+    def record(self, rects):
+        # Overlapping rects are counted twice, so this is an upper bound.
+        area = sum(rect.width * rect.height for rect in rects)
+        self.last_fraction = min(1.0, area / (self.screen_rect.width * self.screen_rect.height))
+        self.total_fraction += self.last_fraction
+        self.frames += 1
+
+    def average_fraction(self):
+        return self.total_fraction / self.frames if self.frames else 0.0
@@ -0,0 +1,262 @@
+from array import array
+from .spatial_index import SpatialIndex
+
+class Column:
+    """
+    Field of an EntityView. While the view is in a store the value lives in the
+    store's column of the same name; otherwise it is kept on the view itself.
+    """
+    def __set_name__(self, owner, name):
+        self.name = name
+        self.local = "_" + name
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        store = view.store
+        if store is None:
+            return getattr(view, self.local)
+        return store.columns[self.name][store.dense[view.handle]]
+
+    def __set__(self, view, value):
+        store = view.store
+        if store is None:
+            setattr(view, self.local, value)
+        else:
+            store.columns[self.name][store.dense[view.handle]] = value
+
+class EncodedColumn(Column):
+    # For values such as strategies that are stored as small integer ids.
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        store = view.store
+        if store is None:
+            return getattr(view, self.local)
+        return store.decode(self.name, store.columns[self.name][store.dense[view.handle]])
+
+    def __set__(self, view, value):
+        store = view.store
+        if store is None:
+            setattr(view, self.local, value)
+        else:
+            store.columns[self.name][store.dense[view.handle]] = store.encode(self.name, value)
+
+class EntityView:
+    # Subclasses declare slots for the local copies of their columns ("_x", ...).
+    __slots__ = ('store', 'handle')
+    pool = None  # ObjectPool that despawned views go back to
+
+    def __init__(self):
+        self.store = None
+        self.handle = None
+
+    def bind(self, store, handle):
+        self.store = store
+        self.handle = handle
+        # Drop the local copies; the store's columns hold the values now.
+        for name in store.columns:
+            delattr(self, "_" + name)
+
+    def unbind(self):
+        # Copy the current values out so the object stays usable after removal.
+        values = {name: getattr(self, name) for name in self.store.columns}
+        self.store = None
+        self.handle = None
+        for name, value in values.items():
+            setattr(self, name, value)
+
+class EntityStore:
+    """
+    Struct-of-arrays storage for game entities. Live entities are packed at the
+    front of each column; removing one moves the last entity into its place.
+    Each entity has a handle that stays fixed while it is stored, and handles
+    of removed entities are reused through a free list.
+    """
+    fields = ()  # (name, array typecode)
+
+    def __init__(self, views=()):
+        self.columns = {name: array(typecode) for name, typecode in self.fields}
+        for name, column in self.columns.items():
+            setattr(self, name, column)
+        self.handles = array('l')  # dense index -> handle
+        self.dense = array('l')  # handle -> dense index, -1 when free
+        self.views = []  # handle -> view
+        self.free = []
+        self.extend(views)
+
+    def __len__(self):
+        return len(self.handles)
+
+    def __iter__(self):
+        views = self.views
+        for handle in self.handles:
+            yield views[handle]
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [self.views[handle] for handle in self.handles[key]]
+        return self.views[self.handles[key]]
+
+    def __setitem__(self, key, views):
+        if key != slice(None):
+            raise TypeError("only whole-store assignment ([:] = ...) is supported")
+        views = list(views)
+        self.clear()
+        self.extend(views)
+
+    def encode(self, name, value):
+        return value
+
+    def decode(self, name, value):
+        return value
+
+    def append(self, view):
+        if view.store is not None:
+            raise ValueError("entity is already in a store")
+        if self.free:
+            handle = self.free.pop()
+            self.views[handle] = view
+            self.dense[handle] = len(self.handles)
+        else:
+            handle = len(self.views)
+            self.views.append(view)
+            self.dense.append(len(self.handles))
+        self.handles.append(handle)
+        for name, column in self.columns.items():
+            column.append(self.encode(name, getattr(view, name)))
+        view.bind(self, handle)
+        self.added(view)
+
+    def extend(self, views):
+        for view in views:
+            self.append(view)
+
+    def remove(self, view):
+        if view.store is not self:
+            raise ValueError("entity is not in this store")
+        self.remove_at(self.dense[view.handle])
+
+    def remove_at(self, index):
+        handle = self.handles[index]
+        view = self.views[handle]
+        self.removed(view)
+        view.unbind()
+        last = len(self.handles) - 1
+        if index != last:
+            for column in self.columns.values():
+                column[index] = column[last]
+            moved = self.handles[last]
+            self.handles[index] = moved
+            self.dense[moved] = index
+        for column in self.columns.values():
+            column.pop()
+        self.handles.pop()
+        self.dense[handle] = -1
+        self.views[handle] = None
+        self.free.append(handle)
+
+    def despawn_at(self, index):
+        # remove_at for an entity leaving the game: its view goes back to the
+        # class's pool, so callers must not keep it.
+        view = self.views[self.handles[index]]
+        self.remove_at(index)
+        if view.pool is not None:
+            view.pool.release(view)
+
+    def remove_below(self, limit):
+        # Despawn every entity whose y has reached the limit.
+        ys = self.columns["y"]
+        index = 0
+        while index < len(ys):
+            if ys[index] >= limit:
+                self.despawn_at(index)
+            else:
+                index += 1
+
+    def clear(self):
+        for view in self:
+            self.removed(view)
+            view.unbind()
+        for column in self.columns.values():
+            del column[:]
+        del self.handles[:]
+        del self.dense[:]
+        self.views.clear()
+        self.free.clear()
+
+    def despawn_all(self):
+        # clear() for a store that is being replaced.
+        views = list(self)
+        self.clear()
+        for view in views:
+            if view.pool is not None:
+                view.pool.release(view)
+
+    def added(self, view):
+        pass
+
+    def removed(self, view):
+        pass
+
+class EnemyCars(EntityStore):
+    """
+    Enemy cars with a SpatialIndex kept in step with the store. Strategies are
+    stateless, so one shared instance per strategy class is stored by id.
+    Code that moves a car in place must call moved(car) afterwards.
+
+    Each car gets an entity_id when it is first added, which never changes
+    and is never reused, unlike its handle. tracked holds the ids of cars
+    still eligible for a near miss; a car leaves it when it despawns.
+    """
+    fields = (("x", "d"), ("y", "d"), ("speed", "d"), ("strategy", "b"), ("entity_id", "q"))
+
+    def __init__(self, cars=(), next_id=0):
+        self.index = SpatialIndex()
+        self.strategies = [None]
+        self.strategy_ids = {type(None): 0}
+        self.next_id = next_id
+        self.tracked = set()
+        super().__init__(cars)
+
+    def append(self, car):
+        if car.entity_id is None:
+            car.entity_id = self.next_id
+        self.next_id = max(self.next_id, car.entity_id + 1)
+        super().append(car)
+
+    def track(self, car):
+        self.tracked.add(car.entity_id)
+
+    def encode(self, name, value):
+        if name != "strategy":
+            return value
+        strategy_id = self.strategy_ids.get(type(value))
+        if strategy_id is None:
+            strategy_id = len(self.strategies)
+            self.strategies.append(value)
+            self.strategy_ids[type(value)] = strategy_id
+        return strategy_id
+
+    def decode(self, name, value):
+        return self.strategies[value] if name == "strategy" else value
+
+    def added(self, car):
+        self.index.insert(car)
+
+    def removed(self, car):
+        self.index.remove(car)
+        self.tracked.discard(car.entity_id)
+
+    def moved(self, car):
+        index = self.dense[car.handle]
+        self.index.update(car, self.x[index], self.y[index])
+
+    def is_overlap(self, x, y, width, height, exclude=None):
+        return self.index.is_overlap(x, y, width, height, exclude)
+
+    def query(self, x, y, width, height, exclude=None):
+        return self.index.query(x, y, width, height, exclude)
+
+class Coins(EntityStore):
+    fields = (("x", "d"), ("y", "d"))
@@ -1,45 +1,97 @@
+import gc
 import pygame
 from settings import *
 from .UI import UI
+from .texture_cache import TextureCache
+from .text_cache import FontRegistry, TextCache
+from .dirty_rects import DirtyRectTracker
 from .model import GameModel
 from .game_controller import GameController
+from .profiler import FrameProfiler
+from .pool import objects_created
 from settings import CarDimensions as cd
 
 class Game:
-    def __init__(self):
+    def __init__(self, dirty_rects=DIRTY_RECT_RENDERING):
         pygame.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
         pygame.display.set_caption("2D Car Game")
-        self.font = pygame.font.Font(None, 36)
-        self.ui = UI(self.screen, self.font)
+        self.fonts = FontRegistry()
+        self.text = TextCache(self.fonts)
+        self.textures = TextureCache()
+        self.textures.preload("assets/*.png")
+        self.ui = UI(self.screen, self.textures, self.text)
         self.model = GameModel()
-        self.controller = GameController(self.model, self.ui)
+        self.profiler = FrameProfiler()
+        self.controller = GameController(self.model, self.ui, profiler=self.profiler)
         self.clock = pygame.time.Clock()
+        self.dirty_rects = DirtyRectTracker(self.screen.get_rect()) if dirty_rects else None
+        self.instrument()
+        if GC_FREEZE_AFTER_LOAD:
+            # Assets, fonts and caches live for the whole run; keeping them out
+            # of collection passes leaves the collector only per-frame garbage.
+            gc.collect()
+            gc.freeze()
+
+    def instrument(self):
+        # No-ops unless the profiler is enabled.
+        simulation = self.controller.simulation
+        self.profiler.instrument(self.controller, "update_game_state")
+        self.profiler.instrument(self.model, "check_near_misses")
+        self.profiler.instrument(simulation, "move_enemy_cars")
+        self.profiler.instrument(simulation, "move_coins")
+        self.profiler.instrument(self.controller, "draw_enemy_cars")
+        self.profiler.instrument(self.controller, "draw_coins")
+        self.profiler.instrument(self.ui, "draw_road")
+        self.profiler.watch_gc()
 
     def run(self):
         self.model.player.name = self.model.game_state.player_name
         name_entered = bool(self.model.player.name)
 
+        # Menus sleep in the controller until there is input, so only game frames are paced and profiled.
         while not name_entered and self.model.game_state.is_running:
             self.ui.draw_name_input(self.model.player.name)
-            name_entered = self.controller.handle_name_input()
             pygame.display.flip()
-            self.clock.tick(60)
+            name_entered = self.controller.handle_name_input()
 
         while self.model.game_state.is_running:
-            self.screen.fill(WHITE)
             if not self.model.player.selected_car:
-                self.controller.handle_car_selection()
-            else:
-                self.update_game_state()
-            pygame.display.flip()
+                if self.controller.handle_car_selection():
+                    self.present()
+                continue
+            self.screen.fill(WHITE)
+            self.present(self.update_game_state())
+            self.profiler.end_frame(enemy_cars=len(self.model.game_objects.enemy_cars),
+                                    coins=len(self.model.game_objects.coins),
+                                    allocated=objects_created())
             self.clock.tick(60)
 
+        self.controller.stop_simulation()
+        self.controller.finish_recording()
+        self.model.leaderboard.flush()
+        if self.profiler.enabled:
+            self.profiler.unwatch_gc()
+            self.profiler.export(PROFILER_TRACE_FILE)
         pygame.quit()
 
     def update_game_state(self):
-        self.ui.draw_road(self.model.game_objects.road_offset)
-        self.ui.draw_car(self.model.player.car_x, self.model.player.car_y, self.model.player.selected_car)
         self.controller.update_game_state()
-        self.ui.draw_coin_count(self.model.game_state.coin_count)
-        self.ui.draw_near_miss_count(self.model.near_miss_interceptor.get_near_miss_count())
\ No newline at end of file
+        if not (self.model.game_state.is_running and self.model.player.selected_car):
+            return None
+        self.textures.validate()
+        rects = self.controller.render()
+        if self.profiler.overlay_visible:
+            rects.append(self.ui.draw_profiler(self.profiler.overlay))
+        if self.dirty_rects:
+            return self.dirty_rects.collect(rects)
+        return None
+
+    def present(self, rects=None):
+        with self.profiler.scope("flip"):
+            if rects is None:
+                pygame.display.flip()
+                if self.dirty_rects:
+                    self.dirty_rects.invalidate()
+            else:
+                pygame.display.update(rects)
\ No newline at end of file
@@ -1,24 +1,50 @@
+import os
+import time
 import pygame
 from .car_factory import CarFactory
-from .command import MoveLeftCommand, MoveRightCommand, MoveUpCommand, MoveDownCommand, CheckPointCommand
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, ENEMY_CAR_SPEED, NEW_COIN_PROBABILITY
-from settings import CarDimensions as cd
-import random
+from .simulation import Simulation, Input
+from .keyboard_input import KeyboardInput
+from .replay import Recording
+from .profiler import FrameProfiler
+from .threaded_simulation import SimulationThread, SnapshotBuffer, WorldSnapshot, interpolate
+from settings import (SCREEN_WIDTH, SCREEN_HEIGHT, RANDOM_SEED, RECORD_REPLAYS, REPLAY_DIRECTORY, THREADED_SIMULATION,
+                      MENU_IDLE_TIMEOUT, CURSOR_BLINK_INTERVAL)
+
+# Event types each screen reacts to; SDL drops the rest before they are queued.
+GAME_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP, pygame.WINDOWFOCUSLOST)
+# TEXTINPUT stays allowed on the name screen: pygame fills KEYDOWN's unicode from it.
+NAME_INPUT_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.TEXTINPUT, pygame.WINDOWEXPOSED)
+MENU_EVENTS = (pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEMOTION, pygame.WINDOWEXPOSED)
+
+def cursor_blink_timeout():
+    # Milliseconds until the name-entry cursor next turns on or off.
+    return int((CURSOR_BLINK_INTERVAL - time.time() % CURSOR_BLINK_INTERVAL) * 1000) + 1
 
 class GameController:
-    def __init__(self, model, view):
+    def __init__(self, model, view, record_replays=RECORD_REPLAYS, threaded=THREADED_SIMULATION, profiler=None):
         self.model = model
         self.view = view
-        self.commands = self.initialize_commands()
+        self.profiler = profiler if profiler is not None else FrameProfiler()
+        self.simulation = Simulation(model)
+        self.record_replays = record_replays
+        self.recording = None
+        self.threaded = threaded
+        self.simulation_thread = None
+        self.snapshots = SnapshotBuffer()
+        self.enemy_image = CarFactory.create_car('enemy', x=0, y=0, speed=0, strategy=None)
+        self.key_bindings = self.initialize_key_bindings()
+        self.keyboard = KeyboardInput(self.key_bindings)
+        self.allowed_events = None
+        self.menu_screen = None
         self.car_selection = self.initialize_car_selection()
 
-    def initialize_commands(self):
+    def initialize_key_bindings(self):
         return {
-            pygame.K_LEFT: MoveLeftCommand(),
-            pygame.K_RIGHT: MoveRightCommand(),
-            pygame.K_UP: MoveUpCommand(),
-            pygame.K_DOWN: MoveDownCommand(),
-            pygame.K_s: CheckPointCommand()
+            pygame.K_LEFT: Input.LEFT,
+            pygame.K_RIGHT: Input.RIGHT,
+            pygame.K_UP: Input.UP,
+            pygame.K_DOWN: Input.DOWN,
+            pygame.K_s: Input.CHECKPOINT
         }
 
     def initialize_car_selection(self):
@@ -28,8 +54,40 @@ class GameController:
             pygame.K_3: "porsche"
         }
 
+    def allow_events(self, types):
+        # Blocking a type flushes it from the queue, so only the types that
+        # are no longer wanted are blocked when switching screens.
+        if types == self.allowed_events:
+            return
+        if self.allowed_events is None:
+            pygame.event.set_blocked(None)
+        else:
+            dropped = [kind for kind in self.allowed_events if kind not in types]
+            if dropped:
+                pygame.event.set_blocked(dropped)
+        pygame.event.set_allowed(list(types))
+        self.allowed_events = types
+
+    def wait_for_events(self, timeout):
+        # Sleeps until an event arrives or timeout ms pass; [] on a timeout.
+        event = pygame.event.wait(timeout)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
+
+    def menu_events(self, screen, allowed, timeout):
+        # Events for a menu screen, or None when nothing happened. The first
+        # call for a screen returns at once so it gets drawn; later calls
+        # sleep until there is input or timeout ms have passed.
+        self.allow_events(allowed)
+        if self.menu_screen != screen:
+            self.menu_screen = screen
+            return pygame.event.get()
+        return self.wait_for_events(timeout) or None
+
     def handle_name_input(self):
-        for event in pygame.event.get():
+        # Returns after a key press or at the next cursor blink; True once a name is entered.
+        for event in self.menu_events("name input", NAME_INPUT_EVENTS, cursor_blink_timeout()) or ():
             if event.type == pygame.QUIT:
                 self.model.game_state.stop_game()
                 return False
@@ -44,8 +102,11 @@ class GameController:
         return False
 
     def handle_car_selection(self):
-        self.view.draw_car_selection()
-        for event in pygame.event.get():
+        # Returns True when the screen was redrawn and needs presenting.
+        events = self.menu_events("car selection", MENU_EVENTS, MENU_IDLE_TIMEOUT)
+        if events is None:
+            return False
+        for event in events:
             if event.type == pygame.QUIT:
                 self.model.game_state.stop_game()
             elif event.type == pygame.KEYDOWN:
@@ -55,72 +116,53 @@ class GameController:
                 car_name = self.view.handle_car_selection_click(event.pos)
                 if car_name:
                     self.model.player.selected_car = CarFactory.create_car(car_name)
+        if self.model.player.selected_car or not self.model.game_state.is_running:
+            if self.model.player.selected_car:
+                self.keyboard.sync(pygame.key.get_pressed())
+            return False
+        self.view.draw_car_selection()
+        return True
 
     def handle_events(self):
+        # One pass over the event queue; returns the Input snapshot for this tick.
+        self.allow_events(GAME_EVENTS)
+        self.menu_screen = None
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.model.game_state.stop_game()
             elif event.type == pygame.KEYDOWN:
                 if event.key in self.car_selection:
                     self.model.player.selected_car = CarFactory.create_car(self.car_selection[event.key])
-                elif event.key in self.commands and self.model.player.selected_car:
-                    self.commands[event.key].execute(model=self.model, player=self.model.player)
-            elif event.type == pygame.KEYUP:
-                if event.key in self.commands and self.model.player.selected_car:
-                    self.commands[event.key].reset()
-
-        keys = pygame.key.get_pressed()
-        if self.model.player.selected_car:
-            for key, command in self.commands.items():
-                if keys[key] and key not in self.car_selection:
-                    command.execute(player=self.model.player, game=self)
-
-    def move_and_draw_enemy_cars(self):
-        immunity_active, _ = self.model.is_immunity_active()
-        for enemy_car in self.model.game_objects.enemy_cars:
-            enemy_car.move(self.model.player.car_x, self.model.game_objects.enemy_cars, self.model.game_state.coin_count)
-            enemy_car.draw(self.view)
-            if self.check_collision(enemy_car, immunity_active):
-                if not self.model.load_checkpoint():
-                    self.handle_collision()
-
-    def check_collision(self, enemy_car, immunity_active):
-        if not immunity_active:
-            return (self.model.player.car_y < enemy_car.y + cd.ENEMY_CAR_HEIGHT.value and
-                    self.model.player.car_y + cd.PLAYER_CAR_HEIGHT.value > enemy_car.y and
-                    self.model.player.car_x < enemy_car.x + cd.ENEMY_CAR_WIDTH.value and
-                    self.model.player.car_x + cd.PLAYER_CAR_WIDTH.value > enemy_car.x)
-        return False
+                elif event.key == pygame.K_F3:
+                    self.profiler.toggle_overlay()
+            self.keyboard.handle(event)
+        return self.keyboard.snapshot()
+
+    def draw_enemy_cars(self):
+        return [enemy_car.draw(self.view) for enemy_car in self.model.game_objects.enemy_cars]
+
+    def draw_coins(self):
+        return [coin.draw(self.view) for coin in self.model.game_objects.coins]
 
     def handle_collision(self):
-        self.model.game_state.stop_game()
-        waiting_for_input = True
-        while waiting_for_input:
-            self.view.display_leaderboard(self.model.leaderboard, self.model.game_state.coin_count)
-            self.view.draw_replay_quit_buttons()
-            pygame.display.flip()
-            for event in pygame.event.get():
+        # The simulation has already stopped the game and notified the observers.
+        # The screen is only redrawn when there is input, so waiting costs no CPU.
+        while True:
+            events = self.menu_events("game over", MENU_EVENTS, MENU_IDLE_TIMEOUT)
+            if events is None:
+                continue
+            for event in events:
                 if event.type == pygame.QUIT:
-                    waiting_for_input = False
+                    return
                 elif event.type == pygame.MOUSEBUTTONDOWN:
                     if self.is_replay_button_clicked(event.pos):
                         self.model.reset_game()
-                        waiting_for_input = False
+                        return
                     elif self.is_quit_button_clicked(event.pos):
-                        self.model.game_state.stop_game()
-                        waiting_for_input = False
                         return
-
-    def move_and_draw_coins(self):
-        for coin in self.model.game_objects.coins:
-            coin.move(ENEMY_CAR_SPEED)
-            coin.draw(self.view)
-            if coin.check_collision(self.model.player):
-                self.model.game_objects.coins.remove(coin)
-                self.model.game_state.add_coin()
-        self.model.game_objects.coins[:] = [coin for coin in self.model.game_objects.coins if coin.y < SCREEN_HEIGHT]
-        if random.randint(1, NEW_COIN_PROBABILITY) == 1:
-            self.model.game_objects.coins.append(self.model.create_coin())
+            self.view.display_leaderboard(self.model.leaderboard, self.model.game_state.coin_count)
+            self.view.draw_replay_quit_buttons()
+            pygame.display.flip()
 
     def is_replay_button_clicked(self, mouse_pos):
         button_width = 200
@@ -138,13 +180,84 @@ class GameController:
         return (quit_button_x <= mouse_pos[0] <= quit_button_x + button_width and
                 button_y <= mouse_pos[1] <= button_y + button_height)
         
+    def start_recording(self):
+        # Reseed so the replay can rebuild the same traffic from the seed alone.
+        self.model.rng.reseed(RANDOM_SEED)
+        for command in self.simulation.commands.values():
+            command.reset()
+        self.recording = Recording(self.model.rng.seed, self.simulation.tick_rate)
+
+    def finish_recording(self):
+        if self.recording:
+            self.recording.save(os.path.join(REPLAY_DIRECTORY, time.strftime("replay-%Y%m%d-%H%M%S.rpl")))
+        self.recording = None
+
     def update_game_state(self):
-        self.model.check_near_misses()
-        self.model.remove_off_screen_enemy_cars()
-        self.model.add_new_enemy_cars()
-        self.move_and_draw_enemy_cars()
-        self.move_and_draw_coins()
+        inputs = self.handle_events()
+        if self.threaded:
+            self.update_threaded(inputs)
+            return
+        if not self.model.game_state.is_running:
+            return
+        if self.record_replays and self.recording is None:
+            self.start_recording()
+        if self.recording is not None:
+            self.recording.append(inputs)
+        if not self.simulation.step(inputs):
+            self.finish_recording()
+            self.handle_collision()
+
+    def update_threaded(self, inputs):
+        # The model belongs to the simulation thread while it runs; this thread
+        # only feeds it inputs, and takes the model back after a crash.
+        thread = self.simulation_thread
+        if thread is not None and thread.crashed:
+            self.stop_simulation()
+            self.finish_recording()
+            self.handle_collision()
+            return
+        if not self.model.game_state.is_running:
+            self.stop_simulation()
+            return
+        if thread is None:
+            if self.record_replays and self.recording is None:
+                self.start_recording()
+            self.snapshots = SnapshotBuffer()
+            self.snapshots.publish(WorldSnapshot.capture(self.model, self.simulation.tick))
+            thread = self.simulation_thread = SimulationThread(self.simulation, self.snapshots, recording=self.recording)
+            thread.start()
+        thread.inputs.push(inputs)
+
+    def stop_simulation(self):
+        if self.simulation_thread is not None:
+            self.simulation_thread.stop()
+            self.simulation_thread = None
+
+    def render(self):
+        if self.threaded:
+            previous, latest = self.snapshots.latest()
+            # Drawn one tick behind, moving from the previous snapshot to the latest.
+            alpha = (time.perf_counter() - latest.published) * self.simulation.tick_rate
+            return self.render_snapshot(interpolate(previous, latest, alpha))
+        # Read-only pass over the model; returns the screen rects that were drawn.
+        rects = self.view.draw_road(self.model.game_objects.road_offset)
+        rects.append(self.view.draw_car(self.model.player.car_x, self.model.player.car_y, self.model.player.selected_car))
+        rects.extend(self.draw_enemy_cars())
+        rects.extend(self.draw_coins())
         immunity_active, remaining_time = self.model.is_immunity_active()
         if immunity_active:
-            self.view.draw_immunity_timer(remaining_time)
-        self.handle_events()
\ No newline at end of file
+            rects.append(self.view.draw_immunity_timer(remaining_time))
+        rects.append(self.view.draw_coin_count(self.model.game_state.coin_count))
+        rects.append(self.view.draw_near_miss_count(self.model.near_miss_interceptor.get_near_miss_count()))
+        return rects
+
+    def render_snapshot(self, snapshot):
+        rects = self.view.draw_road(snapshot.road_offset)
+        rects.append(self.view.draw_car(*snapshot.player, self.model.player.selected_car))
+        rects.extend(self.view.draw_car(x, y, self.enemy_image) for _, x, y in snapshot.enemy_cars)
+        rects.extend(self.view.draw_coin(x, y) for _, x, y in snapshot.coins)
+        if snapshot.immunity_remaining is not None:
+            rects.append(self.view.draw_immunity_timer(snapshot.immunity_remaining))
+        rects.append(self.view.draw_coin_count(snapshot.coin_count))
+        rects.append(self.view.draw_near_miss_count(snapshot.near_miss_count))
+        return rects
@@ -1,14 +1,14 @@
 class GameState:
-    _instance = None
-
-    def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(GameState, cls).__new__(cls)
-            cls._instance.coin_count = 0
-            cls._instance.is_running = True
-            cls._instance.observers = []
-            cls._instance.player_name = ""
-        return cls._instance
+    """
+    Coin count, run flag and observers of one game session. Every GameModel
+    owns its own, so several games can run side by side in one process.
+    """
+    def __init__(self, session_id=None):
+        self.session_id = session_id
+        self.coin_count = 0
+        self.is_running = True
+        self.observers = []
+        self.player_name = ""
 
     def set_player_name(self, name):
         self.player_name = name
@@ -33,4 +33,4 @@ class GameState:
     def reset(self):
         self.is_running = True
         # Do not reset the player's name to retain it across sessions
-        self.coin_count = 0
\ No newline at end of file
+        self.coin_count = 0
@@ -0,0 +1,69 @@
+import argparse
+import time
+from settings import NUM_LANES, LANE_WIDTH, ENEMY_CAR_SPEED
+from settings import CarDimensions as cd
+from .car_factory import CarFactory
+from .model import GameModel
+from .pool import pool_stats
+from .rng import RandomStreams
+from .simulation import Simulation, Input
+
+class HeadlessRunner:
+    """
+    Steps a GameModel without a window for soak and balance testing. After a
+    crash the game is reset and the run carries on. With stress_enemies set,
+    the road is topped up every tick with cars queued above the screen.
+    """
+    def __init__(self, model=None, policy=None, persist_scores=False, stress_enemies=0, seed=None):
+        self.model = model if model is not None else GameModel(RandomStreams(seed))
+        self.simulation = Simulation(self.model)
+        self.policy = policy if policy is not None else (lambda model: Input.NONE)
+        self.crashes = 0
+        self.stress_enemies = stress_enemies
+        if not persist_scores and self.model.leaderboard in self.model.game_state.observers:
+            self.model.game_state.detach(self.model.leaderboard)
+
+    def run(self, ticks):
+        start = time.perf_counter()
+        for _ in range(ticks):
+            if self.stress_enemies:
+                self.fill_traffic()
+            if not self.simulation.step(self.policy(self.model)):
+                self.crashes += 1
+                self.model.reset_game()
+        elapsed = time.perf_counter() - start
+        return {
+            "ticks": ticks,
+            "seconds": elapsed,
+            "ticks_per_second": ticks / elapsed if elapsed else float("inf"),
+            "ms_per_tick": elapsed * 1000 / ticks if ticks else 0.0,
+            "crashes": self.crashes
+        }
+
+    def fill_traffic(self):
+        enemy_cars = self.model.game_objects.enemy_cars
+        rows = 2 * self.stress_enemies // NUM_LANES + 1
+        rng = self.model.rng
+        for _ in range(self.stress_enemies - len(enemy_cars)):
+            lane = rng.spawn.randint(0, NUM_LANES - 1)
+            x = lane * LANE_WIDTH + (LANE_WIDTH - cd.ENEMY_CAR_WIDTH.value) // 2
+            y = -rng.spawn.randint(1, rows) * cd.ENEMY_CAR_HEIGHT.value
+            if not self.model.is_overlap(x, y):
+                strategy = rng.spawn.choice(self.model.movement_strategies())
+                enemy_cars.append(CarFactory.create_car(x=x, y=y, speed=ENEMY_CAR_SPEED, strategy=strategy, car_type='enemy'))
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the game simulation without a window.")
+    parser.add_argument("--ticks", type=int, default=10000)
+    parser.add_argument("--enemies", type=int, default=0, help="stress mode: keep this many enemy cars on the road")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the traffic; random if omitted")
+    args = parser.parse_args()
+    runner = HeadlessRunner(stress_enemies=args.enemies, seed=args.seed)
+    stats = runner.run(args.ticks)
+    print(f"seed {runner.model.rng.seed}: {stats['ticks']} ticks in {stats['seconds']:.2f}s "
+          f"({stats['ticks_per_second']:.0f} ticks/s, {stats['ms_per_tick']:.3f} ms/tick, {stats['crashes']} crashes)")
+    for name, counts in pool_stats().items():
+        print(f"{name} pool: {', '.join(f'{count} {key}' for key, count in counts.items())}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import pygame
+from .simulation import Input
+
+class KeyboardInput:
+    """
+    Turns the key events of each frame into one Input snapshot for the tick.
+    Held keys are tracked from KEYDOWN/KEYUP, and a key pressed and released
+    within a single frame still counts for that tick. Losing focus drops
+    everything held, since the matching KEYUP events never arrive.
+    """
+    def __init__(self, bindings):
+        self.bindings = {key: int(flag) for key, flag in bindings.items()}  # pygame key -> Input bit
+        self.held = 0
+        self.tapped = 0
+
+    def handle(self, event):
+        if event.type == pygame.KEYDOWN:
+            flag = self.bindings.get(event.key)
+            if flag is not None:
+                self.held |= flag
+                self.tapped |= flag
+        elif event.type == pygame.KEYUP:
+            flag = self.bindings.get(event.key)
+            if flag is not None:
+                self.held &= ~flag
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            self.clear()
+
+    def sync(self, pressed):
+        # Picks up keys already down, from pygame.key.get_pressed(), when
+        # another screen consumed their KEYDOWN events.
+        self.held = 0
+        for key, flag in self.bindings.items():
+            if pressed[key]:
+                self.held |= flag
+
+    def clear(self):
+        self.held = 0
+        self.tapped = 0
+
+    def snapshot(self):
+        inputs = Input(self.held | self.tapped)
+        self.tapped = 0
+        return inputs
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-import json
-import os
-from settings import LEADERBOARD_COUNT
+from settings import LEADERBOARD_COUNT, LEADERBOARD_FILE, LEGACY_LEADERBOARD_FILE, LEADERBOARD_BACKEND, ASYNC_LEADERBOARD_WRITES
+from .score_index import ScoreIndex
+from .leaderboard_storage import JsonLinesStorage, AsyncStorage
+from .background_writer import BackgroundWriter
 
 class Observer(ABC):
     @abstractmethod
@@ -9,44 +10,52 @@ class Observer(ABC):
         pass
 
 class Leaderboard(Observer):
-    def __init__(self):
-        self.scores = []
+    """
+    Keeps every result in a ScoreIndex and appends each new one to storage.
+    scores is the top LEADERBOARD_COUNT, best first.
+    """
+    def __init__(self, storage=None):
+        self.storage = storage if storage is not None else JsonLinesStorage(LEADERBOARD_FILE, LEGACY_LEADERBOARD_FILE)
+        self.index = ScoreIndex()
         self.load_scores()
-    
+
+    @property
+    def scores(self):
+        return self.index.top(LEADERBOARD_COUNT)
+
+    @scores.setter
+    def scores(self, scores):
+        self.index = ScoreIndex(scores)
+
     def load_scores(self):
-        try:
-            if os.path.exists('leaderboard.json'):
-                with open('leaderboard.json', 'r') as file:
-                    self.scores = json.load(file)
-            # Ensure we start with valid data
-            if not isinstance(self.scores, list):
-                self.scores = []
-        except:
-            self.scores = []
-    
+        self.index = ScoreIndex()
+        for name, score in self.storage.load():
+            try:
+                self.index.add(name, score)
+            except ValueError:
+                pass  # Skip malformed entries rather than losing the whole board
+
     def save_scores(self):
-        with open('leaderboard.json', 'w') as file:
-            json.dump(self.scores[:LEADERBOARD_COUNT], file)  # Only save top 5
-    
+        # Full rewrite; game overs only append.
+        self.storage.rewrite(self.index.top(len(self.index)))
+
     def update(self, player_name: str, score: int):
-        # Check if new score should be added
-        should_add = len(self.scores) < LEADERBOARD_COUNT  # Add if we have less than 5 scores
-        
-        if not should_add:
-            # Check if new score is higher than the lowest score
-            lowest_score = min(score for _, score in self.scores)
-            should_add = score > lowest_score
-        
-        if should_add:
-            # Add new score
-            self.scores.append([player_name, score])
-            # Sort by score in descending order
-            self.scores.sort(key=lambda x: x[1], reverse=True)
-            # Keep only top 5
-            self.scores = self.scores[:LEADERBOARD_COUNT]
-            # Save to file
-            self.save_scores()
-        
+        self.index.add(player_name, score)
+        self.storage.append(player_name, score)
+
+    def flush(self):
+        # Blocks until storage has every result; call before the process exits.
+        self.storage.flush()
+
+    def rank(self, score):
+        return self.index.rank(score)
+
+    def top(self, k):
+        return self.index.top(k)
+
+    def count(self):
+        return len(self.index)
+
     def display(self, screen, font):
         y_offset = 200
         screen.fill((255, 255, 255))  # White background
@@ -56,4 +65,14 @@ class Leaderboard(Observer):
         for i, (name, score) in enumerate(self.scores[:5]):  # Only display top 5
             text = font.render(f"#{i + 1}: {name} - {score} coins", True, (0, 0, 0))
             screen.blit(text, (300, y_offset))
-            y_offset += 50
\ No newline at end of file
+            y_offset += 50
+
+def create_leaderboard(backend=LEADERBOARD_BACKEND, async_writes=ASYNC_LEADERBOARD_WRITES):
+    writer = BackgroundWriter("leaderboard-writer") if async_writes else None
+    if backend == "sqlite":
+        from .sqlite_leaderboard import SqliteLeaderboard
+        return SqliteLeaderboard(writer=writer)
+    if backend == "json":
+        storage = JsonLinesStorage(LEADERBOARD_FILE, LEGACY_LEADERBOARD_FILE)
+        return Leaderboard(AsyncStorage(storage, writer) if writer else storage)
+    raise ValueError(f"unknown leaderboard backend {backend!r}")
@@ -0,0 +1,78 @@
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from .leaderboard import Leaderboard
+from .leaderboard_storage import JsonLinesStorage
+from .sqlite_leaderboard import SqliteLeaderboard
+
+def make_results(count, seed=0):
+    rng = random.Random(seed)
+    return [(f"player{number}", rng.randint(0, 500)) for number in range(count)]
+
+def timed(function, repeat=1):
+    # Median seconds per call.
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+def bench_json(directory, rows, writes, k):
+    path = os.path.join(directory, "leaderboard.jsonl")
+    JsonLinesStorage(path).rewrite(make_results(rows))
+    start = time.perf_counter()
+    leaderboard = Leaderboard(JsonLinesStorage(path))
+    open_seconds = time.perf_counter() - start
+    new_results = make_results(writes, seed=1)
+    write_seconds = timed(lambda: [leaderboard.update(name, score) for name, score in new_results])
+    return {
+        "open_ms": open_seconds * 1000,
+        "writes_per_second": writes / write_seconds,
+        "batched_writes_per_second": None,
+        "top_k_ms": timed(lambda: leaderboard.top(k), repeat=101) * 1000,
+        "rank_ms": timed(lambda: leaderboard.rank(250), repeat=101) * 1000
+    }
+
+def bench_sqlite(directory, rows, writes, k):
+    path = os.path.join(directory, "leaderboard.db")
+    SqliteLeaderboard(path).update_many(make_results(rows))
+    start = time.perf_counter()
+    leaderboard = SqliteLeaderboard(path)
+    open_seconds = time.perf_counter() - start
+    new_results = make_results(writes, seed=1)
+    write_seconds = timed(lambda: [leaderboard.update(name, score) for name, score in new_results])
+    batched_seconds = timed(lambda: leaderboard.update_many(new_results))
+    leaderboard.close()
+    leaderboard = SqliteLeaderboard(path)
+    return {
+        "open_ms": open_seconds * 1000,
+        "writes_per_second": writes / write_seconds,
+        "batched_writes_per_second": writes / batched_seconds,
+        "top_k_ms": timed(lambda: leaderboard.top(k), repeat=101) * 1000,
+        "rank_ms": timed(lambda: leaderboard.rank(250), repeat=101) * 1000
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the JSON and SQLite leaderboard backends.")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="results already stored")
+    parser.add_argument("--writes", type=int, default=2000, help="results recorded during the run")
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        results = {
+            "json": bench_json(directory, args.rows, args.writes, args.top),
+            "sqlite": bench_sqlite(directory, args.rows, args.writes, args.top)
+        }
+    print(f"{args.rows} stored results, {args.writes} writes, top {args.top}")
+    print(f"{'backend':8} {'open ms':>10} {'writes/s':>10} {'batched/s':>10} {'top-k ms':>10} {'rank ms':>10}")
+    for backend, stats in results.items():
+        batched = f"{stats['batched_writes_per_second']:10.0f}" if stats["batched_writes_per_second"] else f"{'-':>10}"
+        print(f"{backend:8} {stats['open_ms']:10.1f} {stats['writes_per_second']:10.0f} {batched} "
+              f"{stats['top_k_ms']:10.3f} {stats['rank_ms']:10.3f}")
+
+if __name__ == "__main__":
+    main()
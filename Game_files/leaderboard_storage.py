@@ -0,0 +1,108 @@
+import json
+import os
+import threading
+from .background_writer import BackgroundWriter
+
+class JsonLinesStorage:
+    """
+    Append-only log of results, one JSON [name, score] line each. A game over
+    appends a single line; the file is only rewritten by rewrite(), which
+    writes a temporary file and renames it over the log, so a crash leaves
+    either the old or the new log. A legacy leaderboard.json list is imported
+    the first time the log is created.
+    """
+    def __init__(self, path, legacy_path=None):
+        self.path = path
+        self.legacy_path = legacy_path
+
+    def load(self):
+        if not os.path.exists(self.path):
+            self.import_legacy()
+        results = []
+        try:
+            with open(self.path, 'r') as file:
+                for line in file:
+                    try:
+                        name, score = json.loads(line)
+                    except ValueError:
+                        continue  # A line cut short by a crash; the rest of the log is fine.
+                    results.append((name, score))
+        except OSError:
+            pass
+        return results
+
+    def import_legacy(self):
+        try:
+            with open(self.legacy_path, 'r') as file:
+                scores = json.load(file)
+        except (OSError, TypeError, ValueError):
+            return
+        if isinstance(scores, list):
+            self.rewrite((name, score) for name, score in scores)
+
+    def append(self, name, score):
+        self.append_many([(name, score)])
+
+    def append_many(self, results):
+        # One write call, so a batch lands together.
+        lines = "".join(json.dumps([name, score]) + "\n" for name, score in results)
+        if lines:
+            with open(self.path, 'a') as file:
+                file.write(lines)
+
+    def rewrite(self, results):
+        temporary_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary_path, 'w') as file:
+            for name, score in results:
+                file.write(json.dumps([name, score]) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, self.path)
+
+    def flush(self):
+        pass  # Writes finish before the calls return.
+
+class AsyncStorage:
+    """
+    Wraps a storage so appends and rewrites run on a BackgroundWriter and a
+    game over never waits on the disk. Appends queued while the writer is busy
+    go out in one append_many; a rewrite drops the queued appends, since the
+    results it writes already include them. load() and flush() wait for the
+    queue to drain.
+    """
+    def __init__(self, storage, writer=None):
+        self.storage = storage
+        self.writer = writer if writer is not None else BackgroundWriter("leaderboard-writer")
+        self.pending = []
+        self.lock = threading.Lock()
+
+    def load(self):
+        self.flush()
+        return self.storage.load()
+
+    def append(self, name, score):
+        self.append_many([(name, score)])
+
+    def append_many(self, results):
+        with self.lock:
+            self.pending.extend(results)
+        self.writer.submit("append", self.write_pending)
+
+    def rewrite(self, results):
+        results = list(results)
+        with self.lock:
+            self.pending.clear()
+        self.writer.submit("rewrite", lambda: self.storage.rewrite(results))
+
+    def write_pending(self):
+        with self.lock:
+            results, self.pending = self.pending, []
+        try:
+            self.storage.append_many(results)
+        except OSError:
+            with self.lock:
+                self.pending[:0] = results  # Retried by the next append
+            raise
+
+    def flush(self, timeout=None):
+        self.writer.flush(timeout)
@@ -0,0 +1,128 @@
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+from settings import SERVER_HOST, SERVER_PORT
+from .leaderboard import Leaderboard
+from .leaderboard_storage import JsonLinesStorage
+from .protocol import (frame, read_frame, StateMirror, HELLO, INPUT, WELCOME, STATE, GAME_OVER,
+                       HELLO_MESSAGE, INPUT_MESSAGE, WELCOME_MESSAGE)
+from .server import GameServer
+from .session import SessionRegistry
+from .simulation import Input
+
+INPUT_CHOICES = [Input.NONE, Input.LEFT, Input.RIGHT, Input.UP, Input.DOWN, Input.LEFT | Input.UP]
+
+class LoadClient:
+    """
+    Plays one connection with random held inputs, keeping a StateMirror and
+    recording when each state update arrived and how many bytes came in.
+    """
+    def __init__(self, number, seed=None):
+        self.name = f"load{number}"
+        self.rng = random.Random(seed)
+        self.mirror = StateMirror()
+        self.arrivals = []
+        self.bytes_received = 0
+        self.game_overs = 0
+        self.tick_rate = None
+
+    async def run(self, connect, seconds):
+        reader, writer = await connect()
+        loop = asyncio.get_running_loop()
+        try:
+            writer.write(frame(HELLO_MESSAGE.pack(HELLO) + self.name.encode()))
+            _, _, self.tick_rate = WELCOME_MESSAGE.unpack(await read_frame(reader))
+            deadline = loop.time() + seconds
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    message = await asyncio.wait_for(read_frame(reader), remaining)
+                except asyncio.TimeoutError:
+                    break
+                self.bytes_received += len(message) + 4
+                if message[0] == STATE:
+                    self.mirror.apply(message)
+                    self.arrivals.append(loop.time())
+                    if self.rng.random() < 0.05:
+                        writer.write(frame(INPUT_MESSAGE.pack(INPUT, self.rng.choice(INPUT_CHOICES))))
+                elif message[0] == GAME_OVER:
+                    self.game_overs += 1
+        finally:
+            writer.close()
+
+    def intervals(self):
+        return [later - earlier for earlier, later in zip(self.arrivals, self.arrivals[1:])]
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(int(fraction * len(values)), len(values) - 1)] if values else 0.0
+
+def summarize(clients, seconds):
+    period = 1 / clients[0].tick_rate
+    deviations = [abs(interval - period) * 1000 for client in clients for interval in client.intervals()]
+    bandwidth = [client.bytes_received / seconds for client in clients]
+    return {
+        "clients": len(clients),
+        "updates_per_second": statistics.mean(len(client.arrivals) for client in clients) / seconds,
+        "jitter_p50_ms": percentile(deviations, 0.5),
+        "jitter_p99_ms": percentile(deviations, 0.99),
+        "jitter_max_ms": max(deviations, default=0.0),
+        "bytes_per_second_mean": statistics.mean(bandwidth),
+        "bytes_per_second_max": max(bandwidth),
+        "game_overs": sum(client.game_overs for client in clients)
+    }
+
+async def run_load_test(client_count, seconds, connect, seed=0):
+    clients = [LoadClient(number, seed + number) for number in range(client_count)]
+    await asyncio.gather(*(client.run(connect, seconds) for client in clients))
+    return summarize(clients, seconds)
+
+async def run_with_local_server(client_count, seconds, directory, seed=0):
+    # Server and clients share one event loop, so the numbers include the clients' own work.
+    leaderboard = Leaderboard(JsonLinesStorage(os.path.join(directory, "leaderboard.jsonl")))
+    server = GameServer(SessionRegistry(leaderboard))
+    listener = await server.start(port=0)
+    port = listener.sockets[0].getsockname()[1]
+    serving = asyncio.create_task(server.serve())
+    try:
+        stats = await run_load_test(client_count, seconds, lambda: asyncio.open_connection(SERVER_HOST, port), seed)
+    finally:
+        serving.cancel()
+        await server.close()
+    stats["late_ticks"] = server.late_ticks
+    return stats
+
+def main():
+    parser = argparse.ArgumentParser(description="Open many client connections to the game server and measure them.")
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--host", default=SERVER_HOST)
+    parser.add_argument("--port", type=int, default=SERVER_PORT)
+    parser.add_argument("--unix", default=None, help="connect to a Unix socket path instead of TCP")
+    parser.add_argument("--local", action="store_true", help="start a server in this process")
+    args = parser.parse_args()
+    if args.local:
+        with tempfile.TemporaryDirectory() as directory:
+            stats = asyncio.run(run_with_local_server(args.clients, args.seconds, directory))
+    else:
+        if args.unix:
+            connect = lambda: asyncio.open_unix_connection(args.unix)
+        else:
+            connect = lambda: asyncio.open_connection(args.host, args.port)
+        stats = asyncio.run(run_load_test(args.clients, args.seconds, connect))
+    print(f"{stats['clients']} clients for {args.seconds:g}s: {stats['updates_per_second']:.1f} updates/s per client, "
+          f"{stats['game_overs']} game overs")
+    print(f"tick jitter: p50 {stats['jitter_p50_ms']:.2f} ms, p99 {stats['jitter_p99_ms']:.2f} ms, "
+          f"max {stats['jitter_max_ms']:.2f} ms")
+    print(f"bandwidth per client: mean {stats['bytes_per_second_mean'] / 1024:.1f} KB/s, "
+          f"max {stats['bytes_per_second_max'] / 1024:.1f} KB/s")
+    if "late_ticks" in stats:
+        print(f"server: {stats['late_ticks']} late ticks")
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,79 @@
 # memento.py
+import struct
+from array import array
+from .car_factory import CarFactory
+from .coin import Coin
+from .entity_store import EnemyCars, Coins
+from .strategy import StraightMovement, ZigZagMovement, ChaseMovement
+
+# Strategy classes by the code stored in a memento.
+STRATEGY_TYPES = (type(None), StraightMovement, ZigZagMovement, ChaseMovement)
+HEADER = struct.Struct("<IddiiIIIq")  # tick, player x/y, road offset, coins, near misses, enemy/coin totals, next entity id
+
 class Memento:
-    def __init__(self, player_car_x, player_car_y, enemy_cars, coins):
-        self.player_car_x = player_car_x
-        self.player_car_y = player_car_y
-        self.enemy_cars = enemy_cars[:]
-        self.coins = coins[:]
-
-    def get_state(self):
-        return (self.player_car_x, self.player_car_y, self.enemy_cars, self.coins)
\ No newline at end of file
+    """
+    Value snapshot of the game: a packed header plus one bytes field per column
+    (enemy x, y, speed, strategy, entity id, near-miss flag; coin x, y). It
+    shares nothing with the live model, so later moves cannot
+    change it.
+    """
+    __slots__ = ('tick', 'fields')
+
+    def __init__(self, tick, fields):
+        self.tick = tick
+        self.fields = tuple(fields)
+
+    @classmethod
+    def capture(cls, model, tick=0):
+        enemy_cars, coins = model.game_objects.enemy_cars, model.game_objects.coins
+        # Map the store's own strategy ids to memento codes in one translate pass.
+        codes = bytes(STRATEGY_TYPES.index(type(strategy)) for strategy in enemy_cars.strategies)
+        strategies = enemy_cars.strategy.tobytes().translate(codes.ljust(256, b"\0"))
+        tracked = enemy_cars.tracked
+        header = HEADER.pack(tick, model.player.car_x, model.player.car_y, model.game_objects.road_offset,
+                             model.game_state.coin_count, model.near_miss_interceptor.near_miss_count,
+                             len(enemy_cars), len(coins), enemy_cars.next_id)
+        return cls(tick, (
+            header,
+            enemy_cars.x.tobytes(),
+            enemy_cars.y.tobytes(),
+            enemy_cars.speed.tobytes(),
+            strategies,
+            enemy_cars.entity_id.tobytes(),
+            bytes(entity_id in tracked for entity_id in enemy_cars.entity_id),
+            coins.x.tobytes(),
+            coins.y.tobytes()
+        ))
+
+    def restore(self, model, restore_scores=True):
+        header, xs, ys, speeds, strategies, entity_ids, checked, coin_xs, coin_ys = self.fields
+        (_, model.player.car_x, model.player.car_y, model.game_objects.road_offset,
+         coin_count, near_miss_count, _, _, next_id) = HEADER.unpack(header)
+        if restore_scores:
+            model.game_state.coin_count = coin_count
+            model.near_miss_interceptor.near_miss_count = near_miss_count
+        # Near misses kept from after the save must not count again, so only
+        # cars that are still eligible now stay tracked.
+        eligible = None if restore_scores else set(model.game_objects.enemy_cars.tracked)
+        shared = (None,) + model.movement_strategies()
+        model.game_objects.enemy_cars.despawn_all()
+        model.game_objects.coins.despawn_all()
+        enemy_cars = EnemyCars(next_id=next_id)
+        ids = array('q')
+        ids.frombytes(entity_ids)
+        for x, y, speed, code, entity_id, check in zip(unpack_doubles(xs), unpack_doubles(ys), unpack_doubles(speeds),
+                                                       strategies, ids, checked):
+            car = CarFactory.create_car(x=x, y=y, speed=speed, strategy=shared[code], entity_id=entity_id, car_type='enemy')
+            enemy_cars.append(car)
+            if check and (eligible is None or entity_id in eligible):
+                enemy_cars.track(car)
+        model.game_objects.enemy_cars = enemy_cars
+        model.game_objects.coins = Coins(Coin.pool.acquire(x, y) for x, y in zip(unpack_doubles(coin_xs), unpack_doubles(coin_ys)))
+
+    def nbytes(self):
+        return sum(len(field) for field in self.fields)
+
+def unpack_doubles(data):
+    values = array('d')
+    values.frombytes(data)
+    return values
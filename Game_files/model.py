@@ -1,15 +1,17 @@
-import random
 import time
 from .car_factory import CarFactory
 from settings import *
 from .game_state import GameState
 from .memento import Memento
 from .caretaker import Caretaker
-from .interceptor import NearMissInterceptor, InterceptorDispatcher
+from .interceptor import NearMissInterceptor, InterceptorDispatcher, NEAR_MISS_BUFFER
 from settings import CarDimensions as cd
 from .coin import Coin
 from .strategy import StraightMovement, ZigZagMovement, ChaseMovement
-from .leaderboard import Leaderboard
+from .leaderboard import create_leaderboard
+from .entity_store import EnemyCars, Coins
+from .rng import RandomStreams
+from .spawn_scheduler import SpawnScheduler
 
 class Player:
     def __init__(self):
@@ -20,99 +22,122 @@ class Player:
 
 class GameObjects:
     def __init__(self):
-        self.enemy_cars = []
-        self.coins = []
+        self.enemy_cars = EnemyCars()
+        self.coins = Coins()
         self.road_offset = 0
 
 class GameModel:
-    def __init__(self):
+    def __init__(self, rng=None, game_state=None, leaderboard=None):
+        self.rng = rng if rng is not None else RandomStreams(RANDOM_SEED)
         self.player = Player()
         self.game_objects = GameObjects()
-        self.game_state = GameState()  # Singleton instance
+        self.game_state = game_state if game_state is not None else GameState()
         self.caretaker = Caretaker()
         self.interceptor_dispatcher = InterceptorDispatcher()
         self.near_miss_interceptor = NearMissInterceptor()
         self.interceptor_dispatcher.register_interceptor(self.near_miss_interceptor)
-        self.leaderboard = Leaderboard()
+        self.leaderboard = leaderboard if leaderboard is not None else create_leaderboard()
         self.game_state.attach(self.leaderboard)
-        self.enemy_cars_to_check = []  # List to track enemy cars for near misses
         
+        self.clock = time.time  # Replaced with simulated time by Simulation
         self.checkpoint_loaded_time = None
+        self.strategy_stream = None
+        self.strategies = ()
+        self.enemy_spawner = SpawnScheduler(ENEMY_SPAWN_CURVE, cd.ENEMY_CAR_WIDTH.value, cd.ENEMY_CAR_HEIGHT.value)
+        self.coin_spawner = SpawnScheduler(COIN_SPAWN_CURVE, cd.PLAYER_CAR_WIDTH.value, cd.PLAYER_CAR_HEIGHT.value)
+
+    def movement_strategies(self):
+        # Strategies are stateless apart from their random stream, so every car
+        # shares one of each. They are rebuilt if the streams are replaced.
+        if self.strategy_stream is not self.rng.strategy:
+            self.strategy_stream = self.rng.strategy
+            self.strategies = (StraightMovement(), ZigZagMovement(self.rng.strategy), ChaseMovement(self.rng.strategy))
+        return self.strategies
 
     def create_enemy_car(self):
-        max_attempts = 100
-        attempt = 0
-        while attempt < max_attempts:
-            lane = random.randint(0, NUM_LANES - 1)
-            x = lane * LANE_WIDTH + (LANE_WIDTH - cd.ENEMY_CAR_WIDTH.value) // 2
-            y = -cd.ENEMY_CAR_HEIGHT.value
-            if not self.is_overlap(x, y):
-                strategy = random.choice([StraightMovement(), ZigZagMovement(), ChaseMovement()])
-                return CarFactory.create_car(x=x, y=y, speed=ENEMY_CAR_SPEED, strategy=strategy, car_type='enemy')
-            attempt += 1
-        return None
+        # None when every lane is blocked at the top of the road.
+        position = self.enemy_spawner.pick(self.rng.spawn, self.game_objects.enemy_cars)
+        if position is None:
+            return None
+        strategy = self.rng.spawn.choice(self.movement_strategies())
+        return CarFactory.create_car(x=position[0], y=position[1], speed=ENEMY_CAR_SPEED, strategy=strategy, car_type='enemy')
 
     def is_overlap(self, x, y):
-        for enemy_car in self.game_objects.enemy_cars:
-            if (abs(x - enemy_car.x) < cd.ENEMY_CAR_WIDTH.value and
-                abs(y - enemy_car.y) < cd.ENEMY_CAR_HEIGHT.value):
-                return True
-        return False
+        return self.game_objects.enemy_cars.is_overlap(x, y, cd.ENEMY_CAR_WIDTH.value, cd.ENEMY_CAR_HEIGHT.value)
 
     def create_coin(self):
-        while True:
-            lane = random.randint(0, NUM_LANES - 1)
-            x = lane * LANE_WIDTH + (LANE_WIDTH - cd.PLAYER_CAR_WIDTH.value) // 2
-            y = -cd.PLAYER_CAR_HEIGHT.value
-            if not self.is_coin_overlap(x, y):
-                return Coin(x, y)
-
-    def is_coin_overlap(self, x, y):
-        return any(abs(x - enemy_car.x) < cd.PLAYER_CAR_WIDTH.value and abs(y - enemy_car.y) < cd.PLAYER_CAR_HEIGHT.value for enemy_car in self.game_objects.enemy_cars)
+        position = self.coin_spawner.pick(self.rng.coin, self.game_objects.enemy_cars)
+        return Coin.pool.acquire(*position) if position is not None else None
 
     def save_checkpoint(self):
         if self.game_state.coin_count >= CHECKPOINT_COIN_COUNT:
             self.game_state.coin_count -= CHECKPOINT_COIN_COUNT
-            memento = Memento(self.player.car_x, self.player.car_y, self.game_objects.enemy_cars, self.game_objects.coins)
-            self.caretaker.save_memento(memento)
+            self.caretaker.save_memento(Memento.capture(self))
 
     def load_checkpoint(self):
         memento = self.caretaker.get_last_memento()
         if memento:
-            self.player.car_x, self.player.car_y, enemy_car_states, self.game_objects.coins = memento.get_state()
-            self.game_objects.enemy_cars = [CarFactory.create_car(x=state.x, y=state.y, speed=state.speed, strategy=StraightMovement(), car_type='enemy') for state in enemy_car_states]
-            self.checkpoint_loaded_time = time.time()
+            # Coins and near misses earned since the save are kept.
+            memento.restore(self, restore_scores=False)
+            self.checkpoint_loaded_time = self.clock()
         return memento is not None
 
     def is_immunity_active(self):
         if self.checkpoint_loaded_time is None:
             return False, None
-        remaining_time = CHECKPOINT_IMMUNE_TIME - (time.time() - self.checkpoint_loaded_time)
+        remaining_time = CHECKPOINT_IMMUNE_TIME - (self.clock() - self.checkpoint_loaded_time)
         return remaining_time > 0, remaining_time
 
+    def check_collision(self, enemy_car):
+        return self.hits_player(enemy_car.x, enemy_car.y)
+
+    def hits_player(self, x, y):
+        return (self.player.car_y < y + cd.ENEMY_CAR_HEIGHT.value and
+                self.player.car_y + cd.PLAYER_CAR_HEIGHT.value > y and
+                self.player.car_x < x + cd.ENEMY_CAR_WIDTH.value and
+                self.player.car_x + cd.PLAYER_CAR_WIDTH.value > x)
+
     def check_near_misses(self):
-        for enemy_car in self.enemy_cars_to_check[:]:
-            self.interceptor_dispatcher.execute_interceptors((self.player.car_x, self.player.car_y), enemy_car)
-            if (enemy_car.x, enemy_car.y) in self.near_miss_interceptor.counted_vehicles:
-                self.enemy_cars_to_check.remove(enemy_car)
+        # Only tracked cars in the near-miss band around the player are looked
+        # at, so the cost depends on nearby traffic, not on all cars.
+        enemy_cars = self.game_objects.enemy_cars
+        if not enemy_cars.tracked:
+            return
+        player = (self.player.car_x, self.player.car_y)
+        nearby = [car for car in enemy_cars.query(player[0], player[1], cd.PLAYER_CAR_WIDTH.value + NEAR_MISS_BUFFER,
+                                                  cd.PLAYER_CAR_HEIGHT.value + NEAR_MISS_BUFFER)
+                  if car.entity_id in enemy_cars.tracked]
+        for enemy_car in nearby:
+            if self.interceptor_dispatcher.execute_interceptors(player, enemy_car):
+                enemy_cars.tracked.discard(enemy_car.entity_id)
 
     def remove_off_screen_enemy_cars(self):
-        self.game_objects.enemy_cars[:] = [car for car in self.game_objects.enemy_cars if car.y < SCREEN_HEIGHT]
+        self.game_objects.enemy_cars.remove_below(SCREEN_HEIGHT)
+
+    def scroll_road(self):
+        self.game_objects.road_offset = (self.game_objects.road_offset + ENEMY_CAR_SPEED) % (ROAD_LINE_HEIGHT + ROAD_LINE_GAP)
 
     def add_new_enemy_cars(self):
-        if random.randint(1, NEW_ENEMY_CAR_PROBABILITY) == 1:
+        if self.enemy_spawner.due(self.rng.spawn):
             new_car = self.create_enemy_car()
             if new_car:
+                self.enemy_spawner.spawned()
                 self.game_objects.enemy_cars.append(new_car)
-                self.enemy_cars_to_check.append(new_car)
+                self.game_objects.enemy_cars.track(new_car)
     
     def reset_game(self):
         self.player.selected_car = None
         self.player.car_x = SCREEN_WIDTH // 2 - cd.PLAYER_CAR_WIDTH.value // 2
         self.player.car_y = SCREEN_HEIGHT - cd.PLAYER_CAR_HEIGHT.value - 10
-        self.game_objects.enemy_cars = []
-        self.game_objects.coins = []
+        self.game_objects.enemy_cars.despawn_all()
+        self.game_objects.coins.despawn_all()
+        self.game_objects.enemy_cars = EnemyCars()
+        self.game_objects.coins = Coins()
         self.game_objects.road_offset = 0
         self.near_miss_interceptor.near_miss_count = 0
+        self.enemy_spawner.reset()
+        self.coin_spawner.reset()
+        self.caretaker.clear()
         self.game_state.coin_count = 0
-        self.game_state.is_running = True
\ No newline at end of file
+        self.game_state.is_running = True
+        self.checkpoint_loaded_time = None
\ No newline at end of file
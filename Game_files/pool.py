@@ -0,0 +1,53 @@
+from settings import POOL_MAX_SIZE
+
+POOLS = {}  # class name -> ObjectPool
+
+class ObjectPool:
+    """
+    Free list of released objects of one class. acquire() re-runs __init__ on
+    a released object when there is one and builds a new object otherwise.
+    release() is for objects nothing refers to any more, such as despawned
+    entities; beyond max_size they are left to the garbage collector.
+    """
+    def __init__(self, cls, max_size=POOL_MAX_SIZE):
+        self.cls = cls
+        self.max_size = max_size
+        self.free = []
+        self.created = 0
+        self.reused = 0
+        self.released = 0
+        self.discarded = 0
+        POOLS[cls.__name__] = self
+
+    def acquire(self, *args, **kwargs):
+        try:
+            obj = self.free.pop()
+        except IndexError:
+            self.created += 1
+            return self.cls(*args, **kwargs)
+        self.reused += 1
+        obj.__init__(*args, **kwargs)
+        return obj
+
+    def release(self, obj):
+        if len(self.free) < self.max_size:
+            self.free.append(obj)
+            self.released += 1
+        else:
+            self.discarded += 1
+
+    def stats(self):
+        return {
+            "created": self.created,
+            "reused": self.reused,
+            "released": self.released,
+            "discarded": self.discarded,
+            "available": len(self.free)
+        }
+
+def pool_stats():
+    return {name: pool.stats() for name, pool in POOLS.items()}
+
+def objects_created():
+    # Objects the pools had to build rather than reuse, over all classes.
+    return sum(pool.created for pool in POOLS.values())
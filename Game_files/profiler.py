@@ -0,0 +1,154 @@
+import contextlib
+import csv
+import functools
+import gc
+import json
+import threading
+import time
+from collections import deque
+from settings import PROFILER_ENABLED, PROFILER_WINDOW, PROFILER_TRACE_FRAMES, PROFILER_OVERLAY_INTERVAL
+
+NULL_SCOPE = contextlib.nullcontext()
+
+def percentile(ordered, fraction):
+    # Nearest-rank percentile of an already sorted list.
+    if not ordered:
+        return 0.0
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+class Scope:
+    __slots__ = ('profiler', 'name', 'start')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info):
+        self.profiler.record(self.name, time.perf_counter() - self.start)
+
+class FrameProfiler:
+    """
+    Named timing scopes summed per frame, with p50/p95/p99 over the last
+    window frames and a trace of per-frame times and entity counts for
+    export. Disabled, scope() hands back one shared null context and
+    instrument() leaves methods untouched, so the game pays nothing.
+    Scopes may be recorded from the simulation thread; a lock keeps them
+    from being lost while end_frame() swaps the frame out.
+    """
+    def __init__(self, enabled=PROFILER_ENABLED, window=PROFILER_WINDOW, trace_frames=PROFILER_TRACE_FRAMES):
+        self.enabled = enabled
+        self.window = window
+        self.windows = {}  # scope name -> deque of per-frame milliseconds
+        self.frame = {}  # scope name -> milliseconds so far this frame
+        self.frames = deque(maxlen=trace_frames)
+        self.frame_count = 0
+        self.frame_start = time.perf_counter()
+        self.counts = {}
+        self.overlay_visible = False
+        self.overlay = []
+        self.gc_start = None
+        self.lock = threading.RLock()  # Reentrant: a gc pass can record while end_frame() holds it
+
+    def scope(self, name):
+        return Scope(self, name) if self.enabled else NULL_SCOPE
+
+    def instrument(self, obj, method_name, name=None):
+        # Wraps obj.method_name in a scope on this instance only.
+        if not self.enabled:
+            return
+        method = getattr(obj, method_name)
+        scope_name = name or method_name
+
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.record(scope_name, time.perf_counter() - start)
+        setattr(obj, method_name, timed)
+
+    def watch_gc(self):
+        # Garbage collector passes are recorded as a "gc" scope.
+        if self.enabled and self.on_gc not in gc.callbacks:
+            gc.callbacks.append(self.on_gc)
+
+    def unwatch_gc(self):
+        if self.on_gc in gc.callbacks:
+            gc.callbacks.remove(self.on_gc)
+
+    def on_gc(self, phase, info):
+        if phase == "start":
+            self.gc_start = time.perf_counter()
+        elif self.gc_start is not None:
+            self.record("gc", time.perf_counter() - self.gc_start)
+            self.gc_start = None
+
+    def record(self, name, seconds):
+        with self.lock:
+            self.frame[name] = self.frame.get(name, 0.0) + seconds * 1000
+
+    def end_frame(self, **counts):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        with self.lock:
+            frame, self.frame = self.frame, {}
+        frame["frame"] = (now - self.frame_start) * 1000
+        self.frame_start = now
+        for name, milliseconds in frame.items():
+            samples = self.windows.get(name)
+            if samples is None:
+                samples = self.windows[name] = deque(maxlen=self.window)
+            samples.append(milliseconds)
+        self.counts = counts
+        self.frames.append((self.frame_count, frame, counts))
+        self.frame_count += 1
+        if self.overlay_visible and self.frame_count % PROFILER_OVERLAY_INTERVAL == 0:
+            self.overlay = self.overlay_lines()
+
+    def stats(self):
+        stats = {}
+        for name, samples in self.windows.items():
+            ordered = sorted(samples)
+            stats[name] = {
+                "p50": percentile(ordered, 0.50),
+                "p95": percentile(ordered, 0.95),
+                "p99": percentile(ordered, 0.99),
+                "max": ordered[-1],
+                "frames": len(ordered)
+            }
+        return stats
+
+    def toggle_overlay(self):
+        self.overlay_visible = self.enabled and not self.overlay_visible
+        self.overlay = self.overlay_lines() if self.overlay_visible else []
+
+    def overlay_lines(self):
+        # Refreshed every PROFILER_OVERLAY_INTERVAL frames, so the text cache sees few distinct strings.
+        lines = [f"{'ms':22} {'p50':>6} {'p95':>6} {'p99':>6}"]
+        for name, stats in sorted(self.stats().items(), key=lambda item: -item[1]["p95"]):
+            lines.append(f"{name:22} {stats['p50']:6.2f} {stats['p95']:6.2f} {stats['p99']:6.2f}")
+        lines.append("  ".join(f"{name} {count}" for name, count in self.counts.items()))
+        return lines
+
+    def export(self, path):
+        # CSV with one row per frame, or JSON with the summary too, by extension.
+        if path.endswith(".csv"):
+            scopes = sorted({name for _, frame, _ in self.frames for name in frame})
+            counters = sorted({name for _, _, counts in self.frames for name in counts})
+            with open(path, 'w', newline='') as file:
+                writer = csv.writer(file)
+                writer.writerow(["frame"] + [f"{name}_ms" for name in scopes] + counters)
+                for number, frame, counts in self.frames:
+                    writer.writerow([number] + [round(frame.get(name, 0.0), 4) for name in scopes] +
+                                    [counts.get(name, "") for name in counters])
+        else:
+            with open(path, 'w') as file:
+                json.dump({
+                    "stats": self.stats(),
+                    "frames": [{"frame": number, "ms": frame, "counts": counts} for number, frame, counts in self.frames]
+                }, file)
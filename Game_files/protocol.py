@@ -0,0 +1,77 @@
+import struct
+
+# Every message is a little-endian uint32 length followed by that many bytes,
+# the first of which is the message type.
+FRAME = struct.Struct("<I")
+HELLO, INPUT, WELCOME, STATE, GAME_OVER = range(1, 6)
+
+# Client -> server. HELLO is followed by the player name in UTF-8; INPUT holds
+# the Input flags to apply every tick until the next INPUT.
+HELLO_MESSAGE = struct.Struct("<B")
+INPUT_MESSAGE = struct.Struct("<BB")
+# Server -> client.
+WELCOME_MESSAGE = struct.Struct("<BIH")  # type, session id, tick rate
+STATE_HEADER = struct.Struct("<BIHhhHHHH")  # type, tick, coins, player x, player y, then entry counts
+ENTITY = struct.Struct("<Hhh")  # handle, x, y
+REMOVED = struct.Struct("<H")  # handle
+GAME_OVER_MESSAGE = struct.Struct("<BIH")  # type, tick, score
+
+def frame(body):
+    return FRAME.pack(len(body)) + body
+
+async def read_frame(reader):
+    size, = FRAME.unpack(await reader.readexactly(FRAME.size))
+    return await reader.readexactly(size)
+
+class DeltaEncoder:
+    """
+    Encodes a model as STATE messages for one client. Positions are sent as
+    whole pixels, keyed by each entity's store handle, and only entities whose
+    position changed since the last message are included, plus the handles
+    that are gone. reset() makes the next message a full state.
+    """
+    def __init__(self):
+        self.sent = [{}, {}]  # enemy cars, coins: handle -> (x, y) the client has
+
+    def reset(self):
+        for sent in self.sent:
+            sent.clear()
+
+    def encode(self, model, tick):
+        sections = []
+        counts = []
+        stores = (model.game_objects.enemy_cars, model.game_objects.coins)
+        for kind, store in enumerate(stores):
+            sent = self.sent[kind]
+            current = {handle: (int(x), int(y)) for handle, x, y in zip(store.handles, store.x, store.y)}
+            changed = [ENTITY.pack(handle, *position) for handle, position in current.items()
+                       if sent.get(handle) != position]
+            removed = [REMOVED.pack(handle) for handle in sent.keys() - current.keys()]
+            self.sent[kind] = current
+            counts += [len(changed), len(removed)]
+            sections += changed + removed
+        player = model.player
+        header = STATE_HEADER.pack(STATE, tick, min(model.game_state.coin_count, 0xFFFF),
+                                   int(player.car_x), int(player.car_y), *counts)
+        return header + b"".join(sections)
+
+class StateMirror:
+    """Client-side copy of a session, rebuilt from STATE messages."""
+    def __init__(self):
+        self.tick = 0
+        self.coin_count = 0
+        self.player = (0, 0)
+        self.enemy_cars = {}  # handle -> (x, y)
+        self.coins = {}
+
+    def apply(self, message):
+        _, self.tick, self.coin_count, player_x, player_y, *counts = STATE_HEADER.unpack_from(message)
+        self.player = (player_x, player_y)
+        offset = STATE_HEADER.size
+        for entities, changed, removed in ((self.enemy_cars, counts[0], counts[1]), (self.coins, counts[2], counts[3])):
+            for handle, x, y in ENTITY.iter_unpack(message[offset:offset + changed * ENTITY.size]):
+                entities[handle] = (x, y)
+            offset += changed * ENTITY.size
+            for handle, in REMOVED.iter_unpack(message[offset:offset + removed * REMOVED.size]):
+                del entities[handle]
+            offset += removed * REMOVED.size
@@ -0,0 +1,178 @@
+import argparse
+import copy
+import itertools
+import os
+import random
+import struct
+import time
+from settings import TICK_RATE, REPLAY_KEYFRAME_INTERVAL
+from .model import GameModel
+from .rng import RandomStreams
+from .simulation import Simulation, Input
+
+MAGIC = b"CRPL"
+VERSION = 2  # 2: lane-mask spawning draws differently from the streams
+HEADER = struct.Struct("<4sBQHI")  # magic, version, seed, tick rate, tick count
+RUN = struct.Struct("<BH")  # input bits, number of ticks
+MAX_RUN = 0xFFFF
+
+class Recording:
+    """
+    The Input bits the simulation consumed on every tick of one game, and the
+    seed its RandomStreams started from. Saved as a small header followed by
+    run-length encoded input bits, since keys are usually held for many ticks.
+    """
+    def __init__(self, seed, tick_rate=TICK_RATE, inputs=b""):
+        self.seed = seed
+        self.tick_rate = tick_rate
+        self.inputs = bytearray(inputs)
+
+    def __len__(self):
+        return len(self.inputs)
+
+    def append(self, inputs):
+        self.inputs.append(int(inputs))
+
+    def runs(self):
+        for value, group in itertools.groupby(self.inputs):
+            length = sum(1 for _ in group)
+            while length:
+                run = min(length, MAX_RUN)
+                yield value, run
+                length -= run
+
+    def to_bytes(self):
+        data = bytearray(HEADER.pack(MAGIC, VERSION, self.seed, self.tick_rate, len(self.inputs)))
+        for value, run in self.runs():
+            data += RUN.pack(value, run)
+        return bytes(data)
+
+    @classmethod
+    def from_bytes(cls, data):
+        magic, version, seed, tick_rate, ticks = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not a replay file or unsupported version")
+        inputs = bytearray()
+        for value, run in RUN.iter_unpack(data[HEADER.size:]):
+            inputs += bytes((value,)) * run
+        if len(inputs) != ticks:
+            raise ValueError(f"replay is truncated: expected {ticks} ticks, found {len(inputs)}")
+        return cls(seed, tick_rate, inputs)
+
+    def save(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'wb') as file:
+            file.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as file:
+            return cls.from_bytes(file.read())
+
+class Replayer:
+    """
+    Feeds a Recording back through a fresh GameModel without a window. The
+    state is snapshotted every keyframe_interval ticks so seek() only has to
+    simulate forward from the nearest keyframe.
+    """
+    def __init__(self, recording, keyframe_interval=REPLAY_KEYFRAME_INTERVAL):
+        self.recording = recording
+        self.keyframe_interval = keyframe_interval
+        self.model = GameModel(RandomStreams(recording.seed))
+        if self.model.leaderboard in self.model.game_state.observers:
+            self.model.game_state.detach(self.model.leaderboard)
+        self.model.game_state.reset()
+        self.simulation = Simulation(self.model, recording.tick_rate)
+        self.tick = 0
+        self.keyframes = {0: self.snapshot()}
+
+    def snapshot(self):
+        # One deepcopy call, so references between the parts (the memento,
+        # the strategies' random stream) survive.
+        # Strategies built without a stream hold the random module, which is shared.
+        model = self.model
+        return copy.deepcopy({
+            "player": (model.player.car_x, model.player.car_y),
+            "game_objects": model.game_objects,
+            "memento": model.caretaker.memento,
+            "near_misses": model.near_miss_interceptor.near_miss_count,
+            "spawners": (model.enemy_spawner, model.coin_spawner),
+            "game_state": (model.game_state.coin_count, model.game_state.is_running),
+            "checkpoint_loaded_time": model.checkpoint_loaded_time,
+            "rng": model.rng,
+            "commands": self.simulation.commands,
+            "tick": self.simulation.tick
+        }, {id(random): random})
+
+    def restore(self, keyframe):
+        state = copy.deepcopy(keyframe, {id(random): random})
+        model = self.model
+        model.player.car_x, model.player.car_y = state["player"]
+        model.game_objects.enemy_cars.despawn_all()
+        model.game_objects.coins.despawn_all()
+        model.game_objects = state["game_objects"]
+        model.caretaker.memento = state["memento"]
+        model.near_miss_interceptor.near_miss_count = state["near_misses"]
+        model.enemy_spawner, model.coin_spawner = state["spawners"]
+        model.game_state.coin_count, model.game_state.is_running = state["game_state"]
+        model.checkpoint_loaded_time = state["checkpoint_loaded_time"]
+        model.rng = state["rng"]
+        self.simulation.commands = state["commands"]
+        self.simulation.tick = state["tick"]
+
+    def finished(self):
+        return self.tick >= len(self.recording) or not self.model.game_state.is_running
+
+    def step(self):
+        self.simulation.step(Input(self.recording.inputs[self.tick]))
+        self.tick += 1
+        if self.tick % self.keyframe_interval == 0 and self.tick not in self.keyframes:
+            self.keyframes[self.tick] = self.snapshot()
+
+    def seek(self, tick):
+        tick = min(tick, len(self.recording))
+        start = max(keyframe for keyframe in self.keyframes if keyframe <= tick)
+        if tick < self.tick or start > self.tick:
+            self.restore(self.keyframes[start])
+            self.tick = start
+        while self.tick < tick and not self.finished():
+            self.step()
+
+    def run(self, ticks=None, slowest=5):
+        # Steps as fast as possible, timing every tick to find the spikes.
+        end = len(self.recording) if ticks is None else min(self.tick + ticks, len(self.recording))
+        start_tick = self.tick
+        tick_times = []
+        start = time.perf_counter()
+        while self.tick < end and not self.finished():
+            tick_start = time.perf_counter()
+            self.step()
+            tick_times.append((time.perf_counter() - tick_start, self.tick - 1))
+        elapsed = time.perf_counter() - start
+        ticks_run = self.tick - start_tick
+        return {
+            "ticks": ticks_run,
+            "seconds": elapsed,
+            "ticks_per_second": ticks_run / elapsed if elapsed else float("inf"),
+            "slowest": [(tick, seconds * 1000) for seconds, tick in sorted(tick_times, reverse=True)[:slowest]]
+        }
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded game without a window.")
+    parser.add_argument("path")
+    parser.add_argument("--seek", type=int, default=0, help="start replaying from this tick")
+    parser.add_argument("--ticks", type=int, default=None, help="stop after this many ticks")
+    args = parser.parse_args()
+    recording = Recording.load(args.path)
+    replayer = Replayer(recording)
+    replayer.seek(args.seek)
+    stats = replayer.run(args.ticks)
+    print(f"seed {recording.seed}: replayed {stats['ticks']} of {len(recording)} ticks in {stats['seconds']:.2f}s "
+          f"({stats['ticks_per_second']:.0f} ticks/s)")
+    for tick, ms in stats["slowest"]:
+        print(f"  tick {tick}: {ms:.3f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import random
+
+class RandomStreams:
+    """
+    Independent random.Random streams derived from a single seed. Each part of
+    the game draws from its own stream (spawn, coin, strategy), so a change in
+    how often one of them draws does not shift the others, and the same seed
+    always produces the same traffic.
+    """
+    names = ("spawn", "coin", "strategy")
+
+    def __init__(self, seed=None):
+        for name in self.names:
+            setattr(self, name, random.Random())
+        self.reseed(seed)
+
+    def reseed(self, seed=None):
+        # Seeds the existing streams in place, so holders such as strategies stay in sync.
+        if seed is None:
+            seed = random.SystemRandom().randrange(2 ** 32)
+        self.seed = seed
+        for name in self.names:
+            getattr(self, name).seed(f"{seed}/{name}")
+
+    def get_state(self):
+        return {name: getattr(self, name).getstate() for name in self.names}
+
+    def set_state(self, state):
+        for name in self.names:
+            getattr(self, name).setstate(state[name])
@@ -0,0 +1,43 @@
+import pygame
+import settings
+from settings import GREY, WHITE
+
+class RoadRenderer:
+    def __init__(self):
+        self.surface = None
+        self.layout = None
+
+    def current_layout(self, screen):
+        return (settings.NUM_LANES, settings.LANE_WIDTH, settings.ROAD_LINE_HEIGHT,
+                settings.ROAD_LINE_GAP, screen.get_size())
+
+    def build(self, screen):
+        width, height = screen.get_size()
+        period = settings.ROAD_LINE_HEIGHT + settings.ROAD_LINE_GAP
+        # A whole number of dash periods taller than the screen, so the layer tiles seamlessly.
+        road_height = (height // period + 1) * period
+        surface = pygame.Surface((width, road_height))
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        surface.fill(GREY)
+        for i in range(settings.NUM_LANES + 1):
+            lane_x = i * settings.LANE_WIDTH
+            for j in range(0, road_height, period):
+                pygame.draw.line(surface, WHITE, (lane_x, j), (lane_x, j + settings.ROAD_LINE_HEIGHT), 2)
+        self.surface = surface
+        self.line_rects = [pygame.Rect(i * settings.LANE_WIDTH - 1, 0, 4, height)
+                           for i in range(settings.NUM_LANES + 1)]
+
+    def draw(self, screen, road_offset):
+        layout = self.current_layout(screen)
+        if layout != self.layout:
+            self.build(screen)
+            self.layout = layout
+        width, height = screen.get_size()
+        road_height = self.surface.get_height()
+        offset = int(road_offset) % road_height
+        # The bottom of the layer wraps around to the top of the screen.
+        screen.blit(self.surface, (0, 0), (0, road_height - offset, width, offset))
+        screen.blit(self.surface, (0, offset), (0, 0, width, height - offset))
+        # Only the dashed lines differ between frames.
+        return list(self.line_rects)
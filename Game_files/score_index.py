@@ -0,0 +1,72 @@
+class ScoreIndex:
+    """
+    Every (name, score) result, indexed by score with a Fenwick tree of counts
+    per score value. Inserting and counting the results above a score take
+    O(log m), where m is the highest score seen; top(k) takes O(k log m).
+    Equal scores keep insertion order. Scores must be non-negative integers.
+    """
+    def __init__(self, results=()):
+        self.tree = [0] * 65  # tree[i] covers scores i - (i & -i) .. i - 1
+        self.names = {}  # score -> names in insertion order
+        self.total = 0
+        for name, score in results:
+            self.add(name, score)
+
+    def __len__(self):
+        return self.total
+
+    def add(self, name, score):
+        if not isinstance(score, int) or score < 0:
+            raise ValueError(f"score must be a non-negative integer, got {score!r}")
+        while score + 1 >= len(self.tree):
+            self.grow()
+        self.names.setdefault(score, []).append(name)
+        self.total += 1
+        position = score + 1
+        while position < len(self.tree):
+            self.tree[position] += 1
+            position += position & -position
+
+    def grow(self):
+        # Doubling rebuilds the tree in O(m); each score value is only grown past once.
+        counts = [0] * (2 * len(self.tree) - 1)
+        for score, names in self.names.items():
+            counts[score] = len(names)
+        self.tree = [0] * (len(counts) + 1)
+        for position, count in enumerate(counts, 1):
+            self.tree[position] += count
+            parent = position + (position & -position)
+            if parent < len(self.tree):
+                self.tree[parent] += self.tree[position]
+
+    def count_at_most(self, score):
+        position = min(score + 1, len(self.tree) - 1)
+        count = 0
+        while position > 0:
+            count += self.tree[position]
+            position -= position & -position
+        return count
+
+    def rank(self, score):
+        # 1-based position a result with this score would take; ties share a rank.
+        return self.total - self.count_at_most(score) + 1
+
+    def score_at(self, count):
+        # Smallest score with at least count results at or below it.
+        position, step = 0, 1 << (len(self.tree).bit_length() - 1)
+        while step:
+            if position + step < len(self.tree) and self.tree[position + step] < count:
+                position += step
+                count -= self.tree[position]
+            step >>= 1
+        return position
+
+    def top(self, k):
+        results = []
+        remaining = self.total
+        while remaining and len(results) < k:
+            score = self.score_at(remaining)
+            names = self.names[score]
+            results.extend([name, score] for name in names[:k - len(results)])
+            remaining -= len(names)
+        return results
@@ -0,0 +1,142 @@
+import argparse
+import asyncio
+from settings import TICK_RATE, SERVER_HOST, SERVER_PORT, SERVER_MAX_BUFFER
+from .protocol import (frame, read_frame, DeltaEncoder, HELLO, INPUT, WELCOME, GAME_OVER,
+                       INPUT_MESSAGE, WELCOME_MESSAGE, GAME_OVER_MESSAGE)
+from .session import SessionRegistry
+from .simulation import Input
+
+ALL_INPUTS = Input.LEFT | Input.RIGHT | Input.UP | Input.DOWN | Input.CHECKPOINT
+MAX_NAME_LENGTH = 32
+
+class ClientConnection:
+    def __init__(self, session, writer):
+        self.session = session
+        self.writer = writer
+        self.inputs = Input.NONE
+        self.encoder = DeltaEncoder()
+        self.bytes_sent = 0
+        self.skipped = 0
+
+class GameServer:
+    """
+    Hosts one authoritative session per connected client and steps them all
+    together at a fixed tick rate. Clients send HELLO and then INPUT messages;
+    after every tick each client gets a STATE delta. A client whose socket
+    buffer is backed up skips deltas until it drains; since the encoder only
+    records what was actually sent, the next delta brings it up to date. A
+    crash sends GAME_OVER and restarts the session.
+    """
+    def __init__(self, registry=None, tick_rate=TICK_RATE, max_buffer=SERVER_MAX_BUFFER):
+        self.registry = registry if registry is not None else SessionRegistry(tick_rate=tick_rate)
+        self.tick_rate = tick_rate
+        self.max_buffer = max_buffer
+        self.clients = {}  # session id -> ClientConnection
+        self.server = None
+        self.handlers = set()
+        self.ticks = 0
+        self.late_ticks = 0
+
+    async def start(self, host=SERVER_HOST, port=SERVER_PORT, path=None):
+        # A path listens on a Unix socket instead of TCP.
+        if path is not None:
+            self.server = await asyncio.start_unix_server(self.handle_client, path)
+        else:
+            self.server = await asyncio.start_server(self.handle_client, host, port)
+        return self.server
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+        for client in list(self.clients.values()):
+            client.writer.close()
+        # Let the handlers see their connections close and clean up.
+        await asyncio.gather(*self.handlers, return_exceptions=True)
+        if self.server is not None:
+            await self.server.wait_closed()
+
+    async def handle_client(self, reader, writer):
+        client = None
+        self.handlers.add(asyncio.current_task())
+        try:
+            hello = await read_frame(reader)
+            if hello[:1] != bytes([HELLO]):
+                return
+            name = hello[1:].decode("utf-8", "replace")[:MAX_NAME_LENGTH]
+            session = self.registry.create(name)
+            client = ClientConnection(session, writer)
+            self.clients[session.session_id] = client
+            writer.write(frame(WELCOME_MESSAGE.pack(WELCOME, session.session_id, self.tick_rate)))
+            while True:
+                message = await read_frame(reader)
+                if message[:1] == bytes([INPUT]) and len(message) == INPUT_MESSAGE.size:
+                    _, flags = INPUT_MESSAGE.unpack(message)
+                    client.inputs = Input(flags & ALL_INPUTS)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            if client is not None:
+                del self.clients[client.session.session_id]
+                self.registry.close(client.session.session_id)
+            writer.close()
+            self.handlers.discard(asyncio.current_task())
+
+    def tick(self):
+        inputs = {session_id: client.inputs for session_id, client in self.clients.items()}
+        for session_id in self.registry.step_all(inputs):
+            session = self.registry.get(session_id)
+            client = self.clients.get(session_id)
+            if client is not None:
+                score = min(session.model.game_state.coin_count, 0xFFFF)
+                self.send(client, frame(GAME_OVER_MESSAGE.pack(GAME_OVER, session.simulation.tick, score)))
+            session.restart()
+        for client in self.clients.values():
+            if client.writer.transport.get_write_buffer_size() > self.max_buffer:
+                client.skipped += 1
+                continue
+            session = client.session
+            self.send(client, frame(client.encoder.encode(session.model, session.simulation.tick)))
+        self.ticks += 1
+
+    def send(self, client, message):
+        client.writer.write(message)
+        client.bytes_sent += len(message)
+
+    async def serve(self, ticks=None):
+        # Ticks on a fixed schedule. When a tick overruns a whole period the
+        # schedule restarts from now instead of bursting to catch up.
+        loop = asyncio.get_running_loop()
+        period = 1 / self.tick_rate
+        next_tick = loop.time()
+        while ticks is None or self.ticks < ticks:
+            self.tick()
+            next_tick += period
+            delay = next_tick - loop.time()
+            if delay < -period:
+                self.late_ticks += 1
+                next_tick = loop.time()
+            await asyncio.sleep(max(delay, 0))
+
+async def run_server(host, port, path):
+    server = GameServer()
+    await server.start(host, port, path)
+    print(f"serving on {path or f'{host}:{port}'} at {server.tick_rate} ticks/s")
+    try:
+        await server.serve()
+    finally:
+        await server.close()
+        server.registry.leaderboard.flush()
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the game server.")
+    parser.add_argument("--host", default=SERVER_HOST)
+    parser.add_argument("--port", type=int, default=SERVER_PORT)
+    parser.add_argument("--unix", default=None, help="listen on this Unix socket path instead of TCP")
+    args = parser.parse_args()
+    try:
+        asyncio.run(run_server(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
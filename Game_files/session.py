@@ -0,0 +1,135 @@
+import argparse
+import gc
+import itertools
+import os
+import sys
+import tempfile
+import time
+import types
+from settings import TICK_RATE
+from .game_state import GameState
+from .leaderboard import Leaderboard, create_leaderboard
+from .leaderboard_storage import JsonLinesStorage
+from .model import GameModel
+from .rng import RandomStreams
+from .simulation import Simulation, Input
+
+# Shared by every session, so never counted against one.
+SHARED_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType)
+
+def deep_sizeof(root, shared=()):
+    # Bytes of everything reachable from root, leaving out the shared objects.
+    seen = {id(obj) for obj in shared}
+    stack = [root]
+    total = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, SHARED_TYPES):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        stack.extend(gc.get_referents(obj))
+    return total
+
+class GameSession:
+    """One game hosted by a SessionRegistry: its own model, state and simulation."""
+    def __init__(self, session_id, model, tick_rate=TICK_RATE):
+        self.session_id = session_id
+        self.model = model
+        self.simulation = Simulation(model, tick_rate)
+
+    @property
+    def is_running(self):
+        return self.model.game_state.is_running
+
+    def step(self, inputs=Input.NONE):
+        # Returns False on the tick the player crashes; a crashed session stays
+        # stopped until restart().
+        if not self.is_running:
+            return False
+        return self.simulation.step(inputs)
+
+    def restart(self):
+        self.model.reset_game()
+        self.simulation.tick = 0
+
+class SessionRegistry:
+    """
+    Hosts many independent games in one process. Sessions share nothing but
+    the leaderboard, which is attached as an observer to each session's
+    GameState, so every game over is recorded once.
+    """
+    def __init__(self, leaderboard=None, tick_rate=TICK_RATE):
+        self.leaderboard = leaderboard if leaderboard is not None else create_leaderboard()
+        self.tick_rate = tick_rate
+        self.sessions = {}  # session id -> GameSession
+        self.ids = itertools.count(1)
+
+    def __len__(self):
+        return len(self.sessions)
+
+    def __iter__(self):
+        return iter(self.sessions.values())
+
+    def create(self, player_name="", seed=None):
+        session_id = next(self.ids)
+        game_state = GameState(session_id)
+        game_state.set_player_name(player_name)
+        model = GameModel(RandomStreams(seed), game_state, self.leaderboard)
+        model.player.name = player_name
+        session = GameSession(session_id, model, self.tick_rate)
+        self.sessions[session_id] = session
+        return session
+
+    def get(self, session_id):
+        return self.sessions[session_id]
+
+    def close(self, session_id):
+        session = self.sessions.pop(session_id)
+        session.model.game_state.detach(self.leaderboard)
+
+    def step_all(self, inputs=None):
+        # Steps every running session once; inputs maps session id -> Input.
+        # Returns the ids of the sessions that crashed on this tick.
+        inputs = inputs or {}
+        crashed = []
+        for session_id, session in self.sessions.items():
+            if session.is_running and not session.step(inputs.get(session_id, Input.NONE)):
+                crashed.append(session_id)
+        return crashed
+
+    def memory_usage(self):
+        # Approximate bytes held by each session, not counting the leaderboard.
+        return {session_id: deep_sizeof(session, (self.leaderboard, self))
+                for session_id, session in self.sessions.items()}
+
+def main():
+    parser = argparse.ArgumentParser(description="Step many game sessions in one process.")
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--ticks", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=0, help="session n is seeded with seed + n")
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        # Results go to a throwaway log, not the real leaderboard.
+        leaderboard = Leaderboard(JsonLinesStorage(os.path.join(directory, "leaderboard.jsonl")))
+        run(SessionRegistry(leaderboard), args)
+
+def run(registry, args):
+    for number in range(args.sessions):
+        registry.create(f"session{number}", args.seed + number)
+    start = time.perf_counter()
+    crashes = 0
+    for _ in range(args.ticks):
+        crashed = registry.step_all()
+        crashes += len(crashed)
+        for session_id in crashed:
+            registry.get(session_id).restart()
+    elapsed = time.perf_counter() - start
+    usage = sorted(registry.memory_usage().values())
+    print(f"{args.sessions} sessions x {args.ticks} ticks in {elapsed:.2f}s "
+          f"({args.sessions * args.ticks / elapsed:.0f} session ticks/s, {crashes} crashes)")
+    print(f"memory per session: median {usage[len(usage) // 2] / 1024:.1f} KB, "
+          f"max {usage[-1] / 1024:.1f} KB, total {sum(usage) / 1024 ** 2:.1f} MB")
+
+if __name__ == "__main__":
+    main()
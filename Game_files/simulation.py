@@ -0,0 +1,108 @@
+from enum import IntFlag
+from settings import SCREEN_HEIGHT, ENEMY_CAR_SPEED, TICK_RATE, REWIND_CAPTURE_INTERVAL
+from .memento import Memento
+from .command import MoveLeftCommand, MoveRightCommand, MoveUpCommand, MoveDownCommand, CheckPointCommand
+
+class Input(IntFlag):
+    NONE = 0
+    LEFT = 1
+    RIGHT = 2
+    UP = 4
+    DOWN = 8
+    CHECKPOINT = 16
+
+class Simulation:
+    """
+    Advances a GameModel one fixed tick at a time. Nothing here touches pygame,
+    so the model can be stepped without a window and as fast as the CPU allows.
+    """
+    def __init__(self, model, tick_rate=TICK_RATE, capture_interval=REWIND_CAPTURE_INTERVAL):
+        self.model = model
+        self.tick_rate = tick_rate
+        self.capture_interval = capture_interval
+        self.tick = 0
+        # Keyed by plain int bits: masking with Input members goes through the enum machinery.
+        self.commands = {
+            Input.LEFT.value: MoveLeftCommand(),
+            Input.RIGHT.value: MoveRightCommand(),
+            Input.UP.value: MoveUpCommand(),
+            Input.DOWN.value: MoveDownCommand(),
+            Input.CHECKPOINT.value: CheckPointCommand()
+        }
+        # Timed effects such as checkpoint immunity run on simulated time.
+        self.model.clock = self.elapsed
+
+    def elapsed(self):
+        return self.tick / self.tick_rate
+
+    def step(self, inputs=Input.NONE):
+        # Returns False when the player crashed with no checkpoint to fall back on.
+        self.apply_inputs(inputs)
+        self.model.scroll_road()
+        self.model.check_near_misses()
+        self.model.remove_off_screen_enemy_cars()
+        self.model.add_new_enemy_cars()
+        alive = self.move_enemy_cars()
+        if alive:
+            self.move_coins()
+        self.tick += 1
+        if self.capture_interval and self.tick % self.capture_interval == 0:
+            self.model.caretaker.record(Memento.capture(self.model, self.tick))
+        return alive
+
+    def rewind(self, tick):
+        # Restores the newest snapshot at or before tick. The random streams are
+        # not part of a snapshot, so play continues with fresh traffic from there.
+        memento = self.model.caretaker.rewind(tick)
+        if memento is None:
+            return False
+        memento.restore(self.model)
+        self.tick = memento.tick
+        return True
+
+    def apply_inputs(self, inputs):
+        bits = int(inputs)
+        model = self.model
+        for flag, command in self.commands.items():
+            if bits & flag:
+                command.execute(model)
+            else:
+                command.reset()
+
+    def move_enemy_cars(self):
+        immunity_active, _ = self.model.is_immunity_active()
+        enemy_cars = self.model.game_objects.enemy_cars
+        player_x, coin_count = self.model.player.car_x, self.model.game_state.coin_count
+        # Read strategies and new positions straight from the store's columns.
+        xs, ys, strategy_ids, strategies = enemy_cars.x, enemy_cars.y, enemy_cars.strategy, enemy_cars.strategies
+        for index, enemy_car in enumerate(enemy_cars):
+            strategies[strategy_ids[index]].move(enemy_car, player_x, enemy_cars, coin_count)
+            x, y = xs[index], ys[index]
+            enemy_cars.index.update(enemy_car, x, y)
+            if not immunity_active and self.model.hits_player(x, y):
+                if self.model.load_checkpoint():
+                    return True
+                self.model.game_state.stop_game()
+                return False
+        return True
+
+    def move_coins(self):
+        # Collected and off-screen coins are swap-removed in place; the coin
+        # moved into the hole has not been stepped yet, so the index stays put.
+        coins = self.model.game_objects.coins
+        index = 0
+        while index < len(coins):
+            coin = coins[index]
+            coin.move(ENEMY_CAR_SPEED)
+            if coin.check_collision(self.model.player):
+                self.model.game_state.add_coin()
+                coins.despawn_at(index)
+            elif coin.y >= SCREEN_HEIGHT:
+                coins.despawn_at(index)
+            else:
+                index += 1
+        if self.model.coin_spawner.due(self.model.rng.coin):
+            coin = self.model.create_coin()
+            if coin:
+                self.model.coin_spawner.spawned()
+                coins.append(coin)
@@ -0,0 +1,55 @@
+from settings import LANE_WIDTH
+from settings import CarDimensions as cd
+
+class SpatialIndex:
+    """
+    Uniform grid of lane-wide, car-tall cells. Overlap queries only look at the
+    cells around the query box, so their cost depends on local traffic rather
+    than on the total number of cars.
+    """
+    def __init__(self, cell_width=LANE_WIDTH, cell_height=cd.ENEMY_CAR_HEIGHT.value):
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+        self.cells = {}  # (column, row) -> {car: None}, insertion ordered
+        self.car_cells = {}  # car -> (column, row)
+
+    def cell_of(self, x, y):
+        return (int(x // self.cell_width), int(y // self.cell_height))
+
+    def insert(self, car):
+        cell = self.cell_of(car.x, car.y)
+        self.car_cells[car] = cell
+        self.cells.setdefault(cell, {})[car] = None
+
+    def remove(self, car):
+        cell = self.car_cells.pop(car)
+        bucket = self.cells[cell]
+        del bucket[car]
+        if not bucket:
+            del self.cells[cell]
+
+    def update(self, car, x=None, y=None):
+        # x and y may be passed in when the caller already has them at hand.
+        if x is None:
+            x, y = car.x, car.y
+        cell = self.cell_of(x, y)
+        if self.car_cells.get(car) != cell:
+            self.remove(car)
+            self.insert(car)
+
+    def clear(self):
+        self.cells.clear()
+        self.car_cells.clear()
+
+    def query(self, x, y, width, height, exclude=None):
+        # Cars with |car.x - x| < width and |car.y - y| < height.
+        first_column, first_row = self.cell_of(x - width, y - height)
+        last_column, last_row = self.cell_of(x + width, y + height)
+        for column in range(first_column, last_column + 1):
+            for row in range(first_row, last_row + 1):
+                for car in self.cells.get((column, row), ()):
+                    if car is not exclude and abs(car.x - x) < width and abs(car.y - y) < height:
+                        yield car
+
+    def is_overlap(self, x, y, width, height, exclude=None):
+        return next(self.query(x, y, width, height, exclude), None) is not None
@@ -0,0 +1,68 @@
+from bisect import bisect_right
+from settings import SCREEN_WIDTH, NUM_LANES, LANE_WIDTH, SPAWN_QUEUE_LIMIT
+
+ALL_LANES = (1 << NUM_LANES) - 1
+
+class SpawnScheduler:
+    """
+    Decides when something spawns at the top of the road and in which lane.
+    The chance of a spawn on each tick is read off a curve of (tick, chance)
+    points, linear in between and flat beyond the ends. Free lanes are a
+    bitmask built from the cars in the spawn band only, and a lane is picked
+    uniformly among them. A spawn that finds every lane blocked waits in a
+    short queue; at most one is placed per tick.
+    """
+    def __init__(self, curve, width, height, queue_limit=SPAWN_QUEUE_LIMIT):
+        self.ticks = tuple(tick for tick, _ in curve)
+        self.rates = tuple(rate for _, rate in curve)
+        self.width = width
+        self.height = height
+        self.y = -height
+        self.lane_xs = tuple(lane * LANE_WIDTH + (LANE_WIDTH - width) // 2 for lane in range(NUM_LANES))
+        self.queue_limit = queue_limit
+        self.tick = 0
+        self.queued = 0
+
+    def reset(self):
+        self.tick = 0
+        self.queued = 0
+
+    def rate(self):
+        index = bisect_right(self.ticks, self.tick)
+        if index == 0:
+            return self.rates[0]
+        if index == len(self.ticks):
+            return self.rates[-1]
+        start, end = self.ticks[index - 1], self.ticks[index]
+        low, high = self.rates[index - 1], self.rates[index]
+        return low + (high - low) * (self.tick - start) / (end - start)
+
+    def due(self, rng):
+        # Advances one tick; True while a spawn is waiting for a lane.
+        # The roll is made even when the queue is full, so the stream stays in step.
+        if rng.random() < self.rate() and self.queued < self.queue_limit:
+            self.queued += 1
+        self.tick += 1
+        return self.queued > 0
+
+    def spawned(self):
+        self.queued = max(self.queued - 1, 0)
+
+    def free_lanes(self, enemy_cars):
+        # A car blocks every lane whose spawn spot it overlaps, which is at
+        # most the lane it is in and one on either side.
+        mask = ALL_LANES
+        for car in enemy_cars.query(SCREEN_WIDTH / 2, self.y, SCREEN_WIDTH, self.height):
+            lane = int(car.x // LANE_WIDTH)
+            for neighbour in range(max(lane - 1, 0), min(lane + 2, NUM_LANES)):
+                if abs(car.x - self.lane_xs[neighbour]) < self.width:
+                    mask &= ~(1 << neighbour)
+        return mask
+
+    def pick(self, rng, enemy_cars):
+        # Spawn position in a random free lane, or None when all are blocked.
+        mask = self.free_lanes(enemy_cars)
+        if not mask:
+            return None
+        lane = rng.choice([lane for lane in range(NUM_LANES) if mask >> lane & 1])
+        return self.lane_xs[lane], self.y
@@ -0,0 +1,120 @@
+import sqlite3
+import threading
+from settings import LEADERBOARD_COUNT, LEADERBOARD_DATABASE
+from .leaderboard import Observer
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS results (id INTEGER PRIMARY KEY, name TEXT NOT NULL, score INTEGER NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS results_by_score ON results (score DESC, id)",
+    # Results per score, so a rank query sums one row per distinct score.
+    "CREATE TABLE IF NOT EXISTS score_counts (score INTEGER PRIMARY KEY, count INTEGER NOT NULL)",
+    """CREATE TRIGGER IF NOT EXISTS count_result AFTER INSERT ON results BEGIN
+        INSERT INTO score_counts (score, count) VALUES (NEW.score, 1)
+        ON CONFLICT (score) DO UPDATE SET count = count + 1;
+    END"""
+)
+# Constant SQL strings, so sqlite3 reuses the prepared statements from its cache.
+INSERT = "INSERT INTO results (name, score) VALUES (?, ?)"
+TOP = "SELECT name, score FROM results ORDER BY score DESC, id LIMIT ?"
+COUNT_ABOVE = "SELECT COALESCE(SUM(count), 0) FROM score_counts WHERE score > ?"
+COUNT = "SELECT COALESCE(SUM(count), 0) FROM score_counts"
+
+class SqliteLeaderboard(Observer):
+    """
+    Leaderboard kept in a shared SQLite database, so several game processes
+    can record results at once. The database runs in WAL mode, so readers do
+    not block the writer. Results are buffered and inserted in one transaction
+    once batch_size of them are pending, and before every read. Given a
+    BackgroundWriter, the inserts run on its thread through a second
+    connection; reads still wait for them.
+    """
+    def __init__(self, path=LEADERBOARD_DATABASE, batch_size=1, writer=None):
+        self.batch_size = batch_size
+        self.writer = writer
+        self.pending = []
+        self.lock = threading.Lock()
+        self.connection = self.connect(path)
+        with self.connection:
+            for statement in SCHEMA:
+                self.connection.execute(statement)
+        self.write_connection = self.connect(path) if writer is not None else self.connection
+
+    @staticmethod
+    def connect(path):
+        connection = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    @property
+    def scores(self):
+        return self.top(LEADERBOARD_COUNT)
+
+    @scores.setter
+    def scores(self, scores):
+        self.flush()
+        with self.connection:
+            self.connection.execute("DELETE FROM results")
+            self.connection.execute("DELETE FROM score_counts")
+            self.connection.executemany(INSERT, scores)
+
+    def update(self, player_name: str, score: int):
+        with self.lock:
+            self.pending.append((player_name, score))
+            full = len(self.pending) >= self.batch_size
+        if full:
+            self.schedule()
+
+    def update_many(self, results):
+        with self.lock:
+            self.pending.extend(results)
+        self.flush()
+
+    def schedule(self):
+        if self.writer is None:
+            self.write_pending()
+        else:
+            self.writer.submit("insert", self.write_pending)
+
+    def write_pending(self):
+        with self.lock:
+            results, self.pending = self.pending, []
+        try:
+            if results:
+                with self.write_connection:
+                    self.write_connection.executemany(INSERT, results)
+        except sqlite3.Error:
+            with self.lock:
+                self.pending[:0] = results  # Retried by the next flush
+            raise
+
+    def flush(self):
+        if self.pending:
+            self.schedule()
+        if self.writer is not None:
+            self.writer.flush()
+
+    def load_scores(self):
+        # Reads always go to the database, so there is nothing to load.
+        self.flush()
+
+    def save_scores(self):
+        self.flush()
+
+    def top(self, k):
+        self.flush()
+        return [[name, score] for name, score in self.connection.execute(TOP, (k,))]
+
+    def rank(self, score):
+        self.flush()
+        return self.connection.execute(COUNT_ABOVE, (score,)).fetchone()[0] + 1
+
+    def count(self):
+        self.flush()
+        return self.connection.execute(COUNT).fetchone()[0]
+
+    def close(self):
+        self.flush()
+        if self.write_connection is not self.connection:
+            self.write_connection.close()
+        self.connection.close()
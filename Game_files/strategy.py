@@ -4,11 +4,15 @@ from settings import *
 from settings import CarDimensions as cd
 
 class MovementStrategy(ABC):
+    def __init__(self, rng=random):
+        # Anything with random() and choice(), normally RandomStreams.strategy.
+        self.rng = rng
+
     @abstractmethod
     def move(self, car, player_x, other_cars, coin_count):
         """
-        Move the car given the player's x position, list of other enemy cars,
-        and the player's coin count.
+        Move the car given the player's x position, the EnemyCars collection
+        (queried through its spatial index), and the player's coin count.
         """
         pass
 
@@ -24,17 +28,14 @@ class ZigZagMovement(MovementStrategy):
         # Only attempt lane changes if the player has 5 or more coins.
         if coin_count >= 5:
             # Lower chance of lane change for smoother, more predictable behavior.
-            if random.random() < 0.02:  # Was 0.05 before.
-                lane_change = random.choice([-1, 1])
+            if self.rng.random() < 0.02:  # Was 0.05 before.
+                lane_change = self.rng.choice([-1, 1])
                 target_x = car.x + lane_change * LANE_WIDTH
                 # Check boundaries.
                 if 0 <= target_x <= SCREEN_WIDTH - cd.ENEMY_CAR_WIDTH.value:
                     # Ensure no collision with other enemy cars.
-                    if not any(
-                        abs(other.x - target_x) < cd.ENEMY_CAR_WIDTH.value and
-                        abs(other.y - car.y) < cd.ENEMY_CAR_HEIGHT.value
-                        for other in other_cars if other != car
-                    ):
+                    if not other_cars.is_overlap(target_x, car.y, cd.ENEMY_CAR_WIDTH.value,
+                                                 cd.ENEMY_CAR_HEIGHT.value, exclude=car):
                         # Gradually adjust the car's x position for a smoother lane change.
                         car.x += (target_x - car.x) * 0.25  # Reduced from 0.5 to 0.25.
 
@@ -45,14 +46,11 @@ class ChaseMovement(MovementStrategy):
         # Only adjust lane toward the player when coin count is at least 5.
         if coin_count >= 5:
             # Lower chance to adjust lane.
-            if random.random() < 0.01:  # Was 0.02 before.
+            if self.rng.random() < 0.01:  # Was 0.02 before.
                 direction = 1 if player_x > car.x else -1
                 target_x = car.x + direction * LANE_WIDTH
                 if 0 <= target_x <= SCREEN_WIDTH - cd.ENEMY_CAR_WIDTH.value:
-                    if not any(
-                        abs(other.x - target_x) < cd.ENEMY_CAR_WIDTH.value and
-                        abs(other.y - car.y) < cd.ENEMY_CAR_HEIGHT.value
-                        for other in other_cars if other != car
-                    ):
+                    if not other_cars.is_overlap(target_x, car.y, cd.ENEMY_CAR_WIDTH.value,
+                                                 cd.ENEMY_CAR_HEIGHT.value, exclude=car):
                         # Gradually adjust the car's x position.
                         car.x += (target_x - car.x) * 0.25  # Reduced from 0.5 to 0.25.
@@ -0,0 +1,42 @@
+from collections import OrderedDict
+import pygame
+from settings import TEXT_CACHE_SIZE
+
+class FontRegistry:
+    def __init__(self):
+        self.fonts = {}  # (name, size) -> pygame.font.Font
+
+    def get(self, name=None, size=36):
+        font = self.fonts.get((name, size))
+        if font is None:
+            font = pygame.font.Font(name, size)
+            self.fonts[(name, size)] = font
+        return font
+
+class TextCache:
+    def __init__(self, fonts, max_entries=TEXT_CACHE_SIZE):
+        self.fonts = fonts
+        self.max_entries = max_entries
+        self.surfaces = OrderedDict()  # (font name, size, text, color) -> surface
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, text, color, size=36, font_name=None):
+        key = (font_name, size, text, tuple(color))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+        self.misses += 1
+        surface = self.fonts.get(font_name, size).render(text, True, color)
+        self.surfaces[key] = surface
+        if len(self.surfaces) > self.max_entries:
+            self.surfaces.popitem(last=False)  # Least recently used
+        return surface
+
+    def clear(self):
+        self.surfaces.clear()
+
+    def get_stats(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.surfaces)}
@@ -0,0 +1,60 @@
+import glob
+import pygame
+from settings import CarDimensions as cd
+
+def car_size():
+    return (cd.PLAYER_CAR_WIDTH.value, cd.PLAYER_CAR_HEIGHT.value)
+
+class TextureCache:
+    def __init__(self):
+        self.textures = {}  # (path, size) -> scaled surface
+        self.hits = 0
+        self.misses = 0
+        self.display_mode = None
+        self.dimensions = None
+
+    def get(self, path, size):
+        texture = self.textures.get((path, size))
+        if texture is None:
+            self.misses += 1
+            texture = self.load(path, size)
+            self.textures[(path, size)] = texture
+        else:
+            self.hits += 1
+        return texture
+
+    def load(self, path, size):
+        image = pygame.image.load(path)
+        # convert_alpha needs a display mode; headless callers keep the raw image.
+        if pygame.display.get_surface() is not None:
+            image = image.convert_alpha()
+        return pygame.transform.scale(image, size)
+
+    def preload(self, pattern="assets/*.png", size=None):
+        self.validate()
+        size = size or car_size()
+        for path in sorted(glob.glob(pattern)):
+            if (path, size) not in self.textures:
+                self.textures[(path, size)] = self.load(path, size)
+
+    def validate(self):
+        # Converted surfaces are tied to the display format and scaled to the
+        # car dimensions, so either changing makes every entry stale.
+        display_mode = self.current_display_mode()
+        dimensions = tuple(dimension.value for dimension in cd)
+        if display_mode != self.display_mode or dimensions != self.dimensions:
+            self.clear()
+            self.display_mode = display_mode
+            self.dimensions = dimensions
+
+    def current_display_mode(self):
+        surface = pygame.display.get_surface()
+        if surface is None:
+            return None
+        return (surface.get_size(), surface.get_bitsize(), surface.get_flags())
+
+    def clear(self):
+        self.textures.clear()
+
+    def get_stats(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self.textures)}
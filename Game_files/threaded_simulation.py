@@ -0,0 +1,137 @@
+import threading
+import time
+from collections import deque, namedtuple
+from settings import ROAD_LINE_HEIGHT, ROAD_LINE_GAP, INTERPOLATION_SNAP_DISTANCE
+from .simulation import Input
+
+class WorldSnapshot(namedtuple("WorldSnapshot", (
+        "tick", "published", "road_offset", "player", "enemy_cars", "coins",
+        "coin_count", "near_miss_count", "immunity_remaining", "is_running"))):
+    """
+    Immutable copy of everything the renderer draws. Entities are (handle, x, y)
+    tuples so positions can be matched up between two snapshots.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def capture(cls, model, tick):
+        enemy_cars = model.game_objects.enemy_cars
+        coins = model.game_objects.coins
+        immunity_active, remaining_time = model.is_immunity_active()
+        return cls(
+            tick, time.perf_counter(), model.game_objects.road_offset,
+            (model.player.car_x, model.player.car_y),
+            tuple(zip(enemy_cars.handles, enemy_cars.x, enemy_cars.y)),
+            tuple(zip(coins.handles, coins.x, coins.y)),
+            model.game_state.coin_count,
+            model.near_miss_interceptor.get_near_miss_count(),
+            remaining_time if immunity_active else None,
+            model.game_state.is_running)
+
+def blend_position(old, new, alpha):
+    # Positions that jumped further than the snap distance (a reused handle,
+    # a checkpoint restore) are drawn where they are now.
+    if abs(new[0] - old[0]) + abs(new[1] - old[1]) > INTERPOLATION_SNAP_DISTANCE:
+        return new
+    return (old[0] + (new[0] - old[0]) * alpha, old[1] + (new[1] - old[1]) * alpha)
+
+def blend_entities(previous, current, alpha):
+    before = {handle: (x, y) for handle, x, y in previous}
+    blended = []
+    for handle, x, y in current:
+        old = before.get(handle)
+        if old is not None:
+            x, y = blend_position(old, (x, y), alpha)
+        blended.append((handle, x, y))
+    return tuple(blended)
+
+def interpolate(previous, current, alpha):
+    # Snapshot alpha of the way from previous to current; the road offset wraps.
+    if previous is None or alpha >= 1:
+        return current
+    period = ROAD_LINE_HEIGHT + ROAD_LINE_GAP
+    road_offset = (previous.road_offset + (current.road_offset - previous.road_offset) % period * alpha) % period
+    return current._replace(road_offset=road_offset,
+                            player=blend_position(previous.player, current.player, alpha),
+                            enemy_cars=blend_entities(previous.enemy_cars, current.enemy_cars, alpha),
+                            coins=blend_entities(previous.coins, current.coins, alpha))
+
+class SnapshotBuffer:
+    """
+    Double buffer of the two newest snapshots. The simulation thread replaces
+    the pair with a single assignment, so readers never see a half-updated
+    pair and neither side takes a lock.
+    """
+    def __init__(self):
+        self.frames = (None, None)  # (previous, latest)
+
+    def publish(self, snapshot):
+        self.frames = (self.frames[1], snapshot)
+
+    def latest(self):
+        return self.frames
+
+class InputQueue:
+    """
+    Inputs from the event pump to the simulation thread. deque appends and
+    pops are atomic, so no lock is needed. take() combines everything pushed
+    since the last tick, so a key tapped between two ticks is not lost; with
+    nothing new, the last inputs stay held.
+    """
+    def __init__(self):
+        self.queue = deque()
+        self.held = Input.NONE
+
+    def push(self, inputs):
+        self.queue.append(inputs)
+
+    def take(self):
+        if self.queue:
+            inputs = Input.NONE
+            while self.queue:
+                inputs |= self.queue.popleft()
+            self.held = inputs
+        return self.held
+
+class SimulationThread(threading.Thread):
+    """
+    Steps a Simulation at its tick rate on a worker thread and publishes a
+    snapshot after every tick. The thread ends when the player crashes (and
+    sets crashed), the game stops or stop() is called. Inputs are appended to recording, if set.
+    """
+    def __init__(self, simulation, snapshots=None, inputs=None, recording=None):
+        super().__init__(name="simulation", daemon=True)
+        self.simulation = simulation
+        self.snapshots = snapshots if snapshots is not None else SnapshotBuffer()
+        self.inputs = inputs if inputs is not None else InputQueue()
+        self.recording = recording
+        self.stopping = threading.Event()
+        self.crashed = False
+        self.late_ticks = 0
+
+    def stop(self):
+        self.stopping.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join()
+
+    def run(self):
+        model = self.simulation.model
+        period = 1 / self.simulation.tick_rate
+        next_tick = time.perf_counter()
+        while not self.stopping.is_set() and model.game_state.is_running:
+            inputs = self.inputs.take()
+            if self.recording is not None:
+                self.recording.append(inputs)
+            alive = self.simulation.step(inputs)
+            self.snapshots.publish(WorldSnapshot.capture(model, self.simulation.tick))
+            if not alive:
+                self.crashed = True
+                return
+            next_tick += period
+            delay = next_tick - time.perf_counter()
+            if delay < -period:
+                # A whole tick behind: carry on from now rather than burst.
+                self.late_ticks += 1
+                next_tick = time.perf_counter()
+            elif delay > 0:
+                self.stopping.wait(delay)
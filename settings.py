@@ -29,6 +29,11 @@ NEW_ENEMY_CAR_PROBABILITY = 20
 # Coin settings
 NEW_COIN_PROBABILITY = 50
 
+# Spawn settings: (ticks into the game, chance per tick) points, linear in between
+ENEMY_SPAWN_CURVE = ((0, 1 / NEW_ENEMY_CAR_PROBABILITY),)
+COIN_SPAWN_CURVE = ((0, 1 / NEW_COIN_PROBABILITY),)
+SPAWN_QUEUE_LIMIT = 3  # Spawns held back while every lane is blocked; more are dropped
+
 # Road animation settings
 ROAD_LINE_HEIGHT = 20
 ROAD_LINE_GAP = 20
@@ -37,8 +42,51 @@ ROAD_LINE_GAP = 20
 CHECKPOINT_COIN_COUNT = 5
 CHECKPOINT_IMMUNE_TIME = 5  # 3 seconds
 
+# Simulation settings
+TICK_RATE = 60  # Fixed simulation ticks per second
+RANDOM_SEED = None  # Fixed seed for reproducible traffic; None picks a new one each run
+POOL_MAX_SIZE = 1024  # Despawned entities of each class kept for reuse
+GC_FREEZE_AFTER_LOAD = True  # Exclude everything alive after startup from garbage collection passes
+
+# Rewind settings
+REWIND_CAPTURE_INTERVAL = 10  # Ticks between snapshots kept for rewinding
+REWIND_CAPACITY = 360  # Snapshots kept; one minute at 60 ticks per second
+REWIND_KEYFRAME_INTERVAL = 12  # Every n-th snapshot is stored whole, the rest as deltas
+
+# Replay settings
+RECORD_REPLAYS = False  # Save the inputs of every game for headless replay
+REPLAY_DIRECTORY = "replays"
+REPLAY_KEYFRAME_INTERVAL = 600  # Ticks between snapshots used for seeking
+
+# Rendering settings
+DIRTY_RECT_RENDERING = False  # Push only changed screen areas instead of flipping
+THREADED_SIMULATION = False  # Step the model on a worker thread and draw interpolated snapshots
+INTERPOLATION_SNAP_DISTANCE = 100  # Pixels an entity may move in one tick and still be interpolated
+PROFILER_ENABLED = False  # Time named scopes each frame; F3 toggles the overlay
+PROFILER_WINDOW = 600  # Frames the p50/p95/p99 figures cover
+PROFILER_TRACE_FRAMES = 10000  # Frames kept for the exported trace
+PROFILER_OVERLAY_INTERVAL = 30  # Frames between overlay refreshes
+PROFILER_TRACE_FILE = "profile.json"  # Written at exit; a .csv name exports CSV instead
+MENU_IDLE_TIMEOUT = 1000  # Milliseconds a menu sleeps waiting for input before checking again
+CURSOR_BLINK_INTERVAL = 0.5  # Seconds the name-entry cursor stays on, then off
+TEXT_CACHE_SIZE = 256  # Rendered text surfaces kept before evicting the least recently used
+
 # Leaderboard settings
 LEADERBOARD_COUNT = 5
+LEADERBOARD_FILE = "leaderboard.jsonl"  # Append-only log of every result
+LEGACY_LEADERBOARD_FILE = "leaderboard.json"  # Old top-5 file, imported once
+LEADERBOARD_BACKEND = "json"  # "json" for the log file, "sqlite" for a database shared between processes
+LEADERBOARD_DATABASE = "leaderboard.db"
+ASYNC_LEADERBOARD_WRITES = True  # Write results on a background thread instead of at game over
+
+# Benchmarks
+BENCHMARK_BASELINE = "benchmark_baseline.json"
+BENCHMARK_THRESHOLD = 0.2  # Slowdown against the baseline reported as a regression
+
+# Game server
+SERVER_HOST = "127.0.0.1"
+SERVER_PORT = 8765
+SERVER_MAX_BUFFER = 64 * 1024  # Bytes queued for a client before its state updates are skipped
 
 class CarDimensions(Enum):
     PLAYER_CAR_WIDTH = LANE_WIDTH * 0.8
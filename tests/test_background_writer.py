@@ -0,0 +1,51 @@
+import threading
+import unittest
+from Game_files.background_writer import BackgroundWriter
+
+class TestBackgroundWriter(unittest.TestCase):
+    def setUp(self):
+        self.writer = BackgroundWriter()
+        self.gate = threading.Event()
+        self.ran = []
+
+    def blocked_job(self):
+        self.gate.wait(5)
+        self.ran.append("blocked")
+
+    def test_runs_jobs_in_order(self):
+        for key in ("a", "b", "c"):
+            self.writer.submit(key, lambda key=key: self.ran.append(key))
+        self.writer.flush(5)
+        self.assertEqual(self.ran, ["a", "b", "c"])
+        self.assertIsNone(self.writer.thread)
+
+    def test_coalesces_queued_jobs(self):
+        self.writer.submit("block", self.blocked_job)
+        self.writer.submit("a", lambda: self.ran.append("a1"))
+        self.writer.submit("b", lambda: self.ran.append("b"))
+        self.writer.submit("a", lambda: self.ran.append("a2"))
+        self.gate.set()
+        self.writer.flush(5)
+        self.assertEqual(self.ran, ["blocked", "b", "a2"])
+
+    def test_submit_does_not_wait(self):
+        self.writer.submit("block", self.blocked_job)
+        self.assertEqual(self.ran, [])
+        with self.assertRaises(TimeoutError):
+            self.writer.flush(0.01)
+        self.gate.set()
+        self.writer.flush(5)
+        self.assertEqual(self.ran, ["blocked"])
+
+    def test_flush_raises_job_error(self):
+        def fail():
+            raise OSError("disk full")
+        self.writer.submit("fail", fail)
+        self.writer.submit("after", lambda: self.ran.append("after"))
+        with self.assertRaises(OSError):
+            self.writer.flush(5)
+        self.assertEqual(self.ran, ["after"])
+        self.writer.flush(5)
+
+if __name__ == '__main__':
+    unittest.main()
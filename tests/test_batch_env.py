@@ -0,0 +1,98 @@
+import random
+import unittest
+import numpy as np
+from Game_files.model import GameModel
+from Game_files.simulation import Simulation, Input
+from Game_files.batch_env import BatchEnv, CHASE
+from Game_files.rng import RandomStreams
+from settings import LANE_WIDTH
+
+class FixedRolls:
+    def random(self):
+        return 0.0
+
+    def choice(self, options):
+        return options[-1]
+
+class TestBatchEnv(unittest.TestCase):
+    def run_single_and_batch(self, seed, ticks, coin_count):
+        actions = random.Random(seed).choices([0, Input.LEFT, Input.RIGHT, Input.UP, Input.DOWN], k=ticks)
+        model = GameModel(RandomStreams(seed))
+        model.game_state.detach(model.leaderboard)
+        model.game_state.reset()
+        model.game_state.coin_count = coin_count
+        simulation = Simulation(model)
+        env = BatchEnv(2, seed=seed)
+        env.coin_count[:] = coin_count
+        for action in actions:
+            alive = simulation.step(action)
+            _, _, dones, _ = env.step([action, 0])
+            self.assertEqual(dones[0], not alive)
+            if not alive:
+                return
+            count = env.enemy_count[0]
+            self.assertEqual([(car.x, car.y) for car in model.game_objects.enemy_cars],
+                             list(zip(env.enemy_x[0, :count].tolist(), env.enemy_y[0, :count].tolist())))
+            total = env.coin_total[0]
+            # Coin order does not affect the game, and the two sides compact differently.
+            self.assertEqual(sorted((coin.x, coin.y) for coin in model.game_objects.coins),
+                             sorted(zip(env.coin_x[0, :total].tolist(), env.coin_y[0, :total].tolist())))
+            self.assertEqual((model.player.car_x, model.player.car_y), (env.player_x[0], env.player_y[0]))
+            self.assertEqual(model.game_state.coin_count, env.coin_count[0])
+            self.assertEqual(model.near_miss_interceptor.get_near_miss_count(), env.near_miss_count[0])
+
+    def test_matches_single_game(self):
+        for seed in range(3):
+            self.run_single_and_batch(seed, 400, 0)
+
+    def test_matches_single_game_with_lane_changes(self):
+        for seed in range(3):
+            self.run_single_and_batch(seed, 400, 5)
+
+    def test_lane_changes_are_deterministic(self):
+        first, second = BatchEnv(8, seed=3), BatchEnv(8, seed=3)
+        first.coin_count[:] = second.coin_count[:] = 5
+        moved = False
+        for _ in range(300):
+            before = first.enemy_x.copy()
+            first.step(0)
+            second.step(0)
+            live = first.enemy_live()
+            moved = moved or bool(((first.enemy_x != before) & live).any())
+            np.testing.assert_array_equal(first.enemy_x[live], second.enemy_x[live])
+        self.assertTrue(moved)
+
+    def test_lane_change_is_blocked_by_neighbour(self):
+        env = BatchEnv(1)
+        env.coin_count[:] = 5
+        env.enemy_count[0] = 2
+        env.enemy_strategy[0, :2] = CHASE
+        env.enemy_x[0, :2] = [env.player_x[0] - LANE_WIDTH, env.player_x[0] - 2 * LANE_WIDTH]
+        env.enemy_y[0, :2] = 0
+        env.rngs[0].strategy = FixedRolls()
+        env.move_enemy_cars()
+        # The front car chases into a free lane; the one behind it is blocked by it.
+        self.assertGreater(env.enemy_x[0, 0], env.player_x[0] - LANE_WIDTH)
+        self.assertEqual(env.enemy_x[0, 1], env.player_x[0] - 2 * LANE_WIDTH)
+
+    def test_step_returns_arrays(self):
+        env = BatchEnv(4)
+        observations, rewards, dones, info = env.step(np.zeros(4, dtype=np.int64))
+        self.assertEqual(observations["player"].shape, (4, 2))
+        self.assertEqual(rewards.shape, (4,))
+        self.assertEqual(dones.shape, (4,))
+        self.assertEqual(info["coins"].shape, (4,))
+
+    def test_crash_resets_game(self):
+        env = BatchEnv(2)
+        env.enemy_x[1, 0] = env.player_x[1]
+        env.enemy_y[1, 0] = env.player_y[1] - 5
+        env.enemy_count[1] = 1
+        env.coin_count[1] = 3
+        _, _, dones, _ = env.step(0)
+        self.assertFalse(dones[0])
+        self.assertTrue(dones[1])
+        self.assertEqual(env.coin_count[1], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,25 @@
+import unittest
+from Game_files.benchmark import WORKLOADS, run, compare
+
+class TestBenchmark(unittest.TestCase):
+    def test_runs_workloads(self):
+        report = run(["tick_10_enemies", "checkpoint_save_restore"], scale=0.01, repeat=1)
+        self.assertEqual(set(report["results"]), {"tick_10_enemies", "checkpoint_save_restore"})
+        for stats in report["results"].values():
+            self.assertGreater(stats["ops_per_second"], 0)
+            self.assertGreaterEqual(stats["peak_kib_per_op"], 0)
+        self.assertEqual(report["results"]["tick_10_enemies"]["unit"], "ticks")
+
+    def test_covers_requested_workloads(self):
+        for name in ("tick_10_enemies", "tick_100_enemies", "tick_1000_enemies", "spawn_heavy",
+                     "near_miss_heavy", "render_100_enemies", "leaderboard_update", "checkpoint_save_restore"):
+            self.assertIn(name, WORKLOADS)
+
+    def test_compare_flags_slowdowns(self):
+        baseline = {"results": {"fast": {"ops_per_second": 1000}, "slow": {"ops_per_second": 1000}}}
+        report = {"results": {"fast": {"ops_per_second": 850}, "slow": {"ops_per_second": 700},
+                              "new": {"ops_per_second": 1}}}
+        self.assertEqual(compare(report, baseline, threshold=0.2), [("slow", 1000, 700)])
+
+if __name__ == '__main__':
+    unittest.main()
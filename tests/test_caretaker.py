@@ -0,0 +1,134 @@
+import unittest
+from Game_files.model import GameModel
+from Game_files.caretaker import Caretaker
+from Game_files.memento import Memento
+from Game_files.headless import HeadlessRunner
+from Game_files.simulation import Simulation
+from Game_files.strategy import ZigZagMovement, ChaseMovement
+from Game_files.coin import Coin
+from Game_files.car_factory import CarFactory
+from settings import CHECKPOINT_COIN_COUNT
+from settings import CarDimensions as cd
+
+def state_of(model):
+    enemy_cars = model.game_objects.enemy_cars
+    return ([(car.x, car.y, car.speed, type(car.strategy), car.entity_id) for car in enemy_cars],
+            [(coin.x, coin.y) for coin in model.game_objects.coins],
+            sorted(enemy_cars.tracked),
+            enemy_cars.next_id,
+            (model.player.car_x, model.player.car_y, model.game_objects.road_offset),
+            model.near_miss_interceptor.near_miss_count)
+
+class TestMemento(unittest.TestCase):
+    def setUp(self):
+        self.runner = HeadlessRunner(seed=3, stress_enemies=40)
+        self.runner.simulation.capture_interval = 0
+        self.runner.run(120)
+        self.model = self.runner.model
+
+    def test_restore_round_trip(self):
+        expected = state_of(self.model)
+        memento = Memento.capture(self.model, 120)
+        self.runner.run(60)
+        memento.restore(self.model)
+        self.assertEqual(state_of(self.model), expected)
+
+    def test_snapshot_does_not_follow_live_cars(self):
+        memento = Memento.capture(self.model)
+        fields = memento.fields
+        self.runner.run(30)
+        self.assertEqual(memento.fields, fields)
+
+    def test_checkpoint_keeps_strategies(self):
+        model = GameModel()
+        model.game_state.coin_count = CHECKPOINT_COIN_COUNT
+        for strategy in (ZigZagMovement(), ChaseMovement()):
+            model.game_objects.enemy_cars.append(model.create_enemy_car())
+            model.game_objects.enemy_cars[-1].strategy = strategy
+        expected = [(car.x, car.y, type(car.strategy)) for car in model.game_objects.enemy_cars]
+        model.game_objects.coins.append(Coin(10, 20))
+        model.save_checkpoint()
+        for car in model.game_objects.enemy_cars:
+            car.y += 100
+        model.game_state.coin_count = 3
+        self.assertTrue(model.load_checkpoint())
+        self.assertEqual([(car.x, car.y, type(car.strategy)) for car in model.game_objects.enemy_cars], expected)
+        self.assertEqual(model.game_state.coin_count, 3)
+        self.assertEqual([(coin.x, coin.y) for coin in model.game_objects.coins], [(10, 20)])
+
+    def test_checkpoint_does_not_count_near_miss_twice(self):
+        model = GameModel()
+        model.game_state.coin_count = CHECKPOINT_COIN_COUNT
+        car = CarFactory.create_car(x=model.player.car_x + cd.PLAYER_CAR_WIDTH.value, y=model.player.car_y,
+                                    speed=0, strategy=None, car_type='enemy')
+        model.game_objects.enemy_cars.append(car)
+        model.game_objects.enemy_cars.track(car)
+        model.save_checkpoint()
+        model.check_near_misses()
+        self.assertEqual(model.near_miss_interceptor.get_near_miss_count(), 1)
+        self.assertTrue(model.load_checkpoint())
+        model.check_near_misses()
+        self.assertEqual(model.near_miss_interceptor.get_near_miss_count(), 1)
+
+class TestCaretaker(unittest.TestCase):
+    def test_rewind_to_any_recorded_tick(self):
+        runner = HeadlessRunner(seed=4, stress_enemies=30)
+        runner.model.caretaker = Caretaker(capacity=20, keyframe_interval=5)
+        runner.simulation.capture_interval = 0
+        runner.model.checkpoint_loaded_time = float("inf")  # Immune, so a crash cannot reset the buffer
+        expected = {}
+        for tick in range(0, 150, 10):
+            runner.run(10)
+            memento = Memento.capture(runner.model, tick)
+            runner.model.caretaker.record(memento)
+            expected[tick] = memento.fields
+        for tick, fields in expected.items():
+            self.assertEqual(runner.model.caretaker.rewind(tick).fields, fields)
+        self.assertEqual(runner.model.caretaker.rewind(15).tick, 10)
+        self.assertIsNone(runner.model.caretaker.rewind(-1))
+
+    def test_ring_buffer_is_fixed_size(self):
+        model = GameModel()
+        caretaker = Caretaker(capacity=8, keyframe_interval=4)
+        for tick in range(30):
+            caretaker.record(Memento.capture(model, tick))
+        # Ticks 22 and 23 are deltas against the overwritten keyframe at 20.
+        self.assertEqual(caretaker.ticks(), list(range(24, 30)))
+        self.assertEqual(len(caretaker.entries), 8)
+        self.assertIsNone(caretaker.rewind(23))
+        self.assertEqual(caretaker.rewind(24).tick, 24)
+
+    def test_rewind_to_oldest_tick_after_wraparound(self):
+        model = GameModel()
+        caretaker = Caretaker(capacity=12, keyframe_interval=4)
+        for tick in range(30):
+            caretaker.record(Memento.capture(model, tick))
+            for listed in caretaker.ticks():
+                self.assertEqual(caretaker.rewind(listed).tick, listed)
+        self.assertEqual(caretaker.ticks()[0], 20)
+
+    def test_reports_footprint(self):
+        runner = HeadlessRunner(seed=5, stress_enemies=50)
+        runner.run(300)
+        stats = runner.model.caretaker.get_stats()
+        self.assertEqual(stats["bytes"], runner.model.caretaker.nbytes())
+        self.assertGreater(stats["entries"], stats["keyframes"])
+        self.assertLess(stats["bytes"], stats["raw_bytes"])
+
+    def test_simulation_rewind(self):
+        model = GameModel()
+        model.game_state.detach(model.leaderboard)
+        model.game_state.reset()
+        simulation = Simulation(model, capture_interval=5)
+        states = {}
+        for _ in range(40):
+            if not simulation.step():
+                break
+            states[simulation.tick] = state_of(model)
+        tick = max(tick for tick in states if tick % 5 == 0)
+        self.assertTrue(simulation.rewind(tick + 2))
+        self.assertEqual(simulation.tick, tick)
+        self.assertEqual(state_of(model), states[tick])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -24,36 +24,37 @@ class TestCommands(unittest.TestCase):
     def setUp(self):
         self.player = MockPlayer()
         self.model = GameModel()
+        self.model.player = self.player
         self.model.game_state = MockGameState()
 
     def test_move_left(self):
         command = MoveLeftCommand()
-        command.execute(player=self.player)
+        command.execute(self.model)
         self.assertEqual(self.player.car_x, SCREEN_WIDTH // 2 - PLAYER_CAR_SPEED)
 
     def test_move_right(self):
         command = MoveRightCommand()
-        command.execute(player=self.player)
+        command.execute(self.model)
         self.assertEqual(self.player.car_x, SCREEN_WIDTH // 2 + PLAYER_CAR_SPEED)
 
     def test_move_up(self):
         command = MoveUpCommand()
-        command.execute(player=self.player)
+        command.execute(self.model)
         self.assertEqual(self.player.car_y, SCREEN_HEIGHT // 2 - PLAYER_CAR_SPEED)
 
     def test_move_down(self):
         command = MoveDownCommand()
-        command.execute(player=self.player)
+        command.execute(self.model)
         self.assertEqual(self.player.car_y, SCREEN_HEIGHT // 2 + PLAYER_CAR_SPEED)
 
     def test_checkpoint_command(self):
         command = CheckPointCommand()
-        command.execute(model=self.model)
+        command.execute(self.model)
         self.assertEqual(self.model.game_state.coin_count, 5)
 
     def test_checkpoint_command_reset(self):
         command = CheckPointCommand()
-        command.execute(model=self.model)
+        command.execute(self.model)
         command.reset()
         self.assertFalse(command.key_pressed)
 
@@ -0,0 +1,32 @@
+import unittest
+import pygame
+from Game_files.dirty_rects import DirtyRectTracker
+
+class TestDirtyRectTracker(unittest.TestCase):
+    def setUp(self):
+        self.tracker = DirtyRectTracker((0, 0, 100, 100))
+
+    def test_first_frame_pushes_full_screen(self):
+        pushed = self.tracker.collect([pygame.Rect(0, 0, 10, 10)])
+        self.assertEqual(pushed, [pygame.Rect(0, 0, 100, 100)])
+        self.assertEqual(self.tracker.last_fraction, 1.0)
+
+    def test_includes_previous_frame_rects(self):
+        self.tracker.collect([pygame.Rect(0, 0, 10, 10)])
+        pushed = self.tracker.collect([pygame.Rect(20, 20, 10, 10)])
+        self.assertEqual(pushed, [pygame.Rect(0, 0, 10, 10), pygame.Rect(20, 20, 10, 10)])
+        self.assertAlmostEqual(self.tracker.last_fraction, 0.02)
+
+    def test_clips_to_screen(self):
+        self.tracker.collect([])
+        pushed = self.tracker.collect([pygame.Rect(95, -5, 10, 10), pygame.Rect(200, 200, 5, 5)])
+        self.assertEqual(pushed, [pygame.Rect(95, 0, 5, 5)])
+
+    def test_invalidate(self):
+        self.tracker.collect([])
+        self.tracker.invalidate()
+        self.assertEqual(self.tracker.collect([]), [pygame.Rect(0, 0, 100, 100)])
+        self.assertAlmostEqual(self.tracker.average_fraction(), 1.0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+from Game_files.car_factory import CarFactory
+from Game_files.coin import Coin
+from Game_files.entity_store import EnemyCars, Coins
+from Game_files.strategy import StraightMovement, ZigZagMovement
+
+def make_enemy(x, y, strategy=None):
+    return CarFactory.create_car(car_type='enemy', x=x, y=y, speed=5, strategy=strategy)
+
+class TestEntityStore(unittest.TestCase):
+    def test_view_reads_and_writes_columns(self):
+        coins = Coins()
+        coin = Coin(10, 20)
+        coins.append(coin)
+        coin.move(5)
+        self.assertEqual(coins.y[0], 25)
+        coins.x[0] = 40
+        self.assertEqual(coin.x, 40)
+
+    def test_swap_remove_keeps_columns_packed(self):
+        coins = Coins(Coin(x, 0) for x in range(4))
+        first = coins[0]
+        coins.remove(coins[1])
+        self.assertEqual(list(coins.x), [0, 3, 2])
+        self.assertEqual([coin.x for coin in coins], [0, 3, 2])
+        self.assertIs(coins[0], first)
+
+    def test_removed_view_keeps_its_values(self):
+        coins = Coins()
+        coin = Coin(10, 20)
+        coins.append(coin)
+        coin.y = 30
+        coins.remove(coin)
+        self.assertIsNone(coin.store)
+        self.assertEqual((coin.x, coin.y), (10, 30))
+        coins.append(coin)
+        self.assertEqual(coins.y[0], 30)
+
+    def test_handles_are_reused(self):
+        coins = Coins([Coin(0, 0), Coin(1, 0)])
+        handle = coins[0].handle
+        coins.remove_at(0)
+        coins.append(Coin(2, 0))
+        self.assertEqual(coins[1].handle, handle)
+        self.assertEqual(len(coins.views), 2)
+
+    def test_remove_below(self):
+        coins = Coins(Coin(0, y) for y in (0, 800, 10, 900, 20))
+        coins.remove_below(700)
+        self.assertEqual(sorted(coins.y), [0, 10, 20])
+
+    def test_view_cannot_be_in_two_stores(self):
+        coin = Coin(0, 0)
+        Coins([coin])
+        with self.assertRaises(ValueError):
+            Coins([coin])
+
+class TestEnemyCars(unittest.TestCase):
+    def test_index_follows_store_changes(self):
+        enemy_cars = EnemyCars()
+        first, second = make_enemy(100, 100), make_enemy(300, 300)
+        enemy_cars.append(first)
+        enemy_cars.append(second)
+        self.assertTrue(enemy_cars.is_overlap(100, 100, 5, 5))
+        enemy_cars[:] = [car for car in enemy_cars if car is not first]
+        self.assertFalse(enemy_cars.is_overlap(100, 100, 5, 5))
+        self.assertTrue(enemy_cars.is_overlap(300, 300, 5, 5))
+        enemy_cars.remove(second)
+        self.assertEqual(enemy_cars.index.car_cells, {})
+
+    def test_moved(self):
+        enemy_cars = EnemyCars([make_enemy(100, 100)])
+        enemy_cars[0].x = 400
+        enemy_cars.moved(enemy_cars[0])
+        self.assertTrue(enemy_cars.is_overlap(400, 100, 5, 5))
+
+    def test_strategies_are_stored_by_id(self):
+        enemy_cars = EnemyCars([make_enemy(0, 0, StraightMovement()), make_enemy(100, 0, ZigZagMovement()),
+                                make_enemy(200, 0, StraightMovement()), make_enemy(300, 0)])
+        self.assertEqual(list(enemy_cars.strategy), [1, 2, 1, 0])
+        self.assertIs(enemy_cars[0].strategy, enemy_cars[2].strategy)
+        self.assertIsNone(enemy_cars[3].strategy)
+
+    def test_entity_ids_are_stable_and_unique(self):
+        enemy_cars = EnemyCars([make_enemy(x, 0) for x in (0, 100, 200)])
+        last = enemy_cars[2]
+        enemy_cars.remove_at(0)
+        enemy_cars.append(make_enemy(300, 0))
+        self.assertEqual(last.entity_id, 2)
+        self.assertEqual(sorted(enemy_cars.entity_id), [1, 2, 3])
+
+    def test_despawn_stops_tracking(self):
+        enemy_cars = EnemyCars()
+        car = make_enemy(0, 900)
+        enemy_cars.append(car)
+        enemy_cars.track(car)
+        enemy_cars.remove_below(700)
+        self.assertEqual(enemy_cars.tracked, set())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import tempfile
+import unittest
+import pygame
+from Game_files.UI import UI
+from Game_files.game_controller import GameController, MENU_EVENTS
+from Game_files.leaderboard import Leaderboard
+from Game_files.leaderboard_storage import JsonLinesStorage
+from Game_files.model import GameModel
+from Game_files.rng import RandomStreams
+
+class CountingUI(UI):
+    def __init__(self, screen):
+        super().__init__(screen)
+        self.leaderboard_draws = 0
+
+    def display_leaderboard(self, leaderboard, current_score):
+        self.leaderboard_draws += 1
+        super().display_leaderboard(leaderboard, current_score)
+
+class TestMenuIdle(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        screen = pygame.display.set_mode((800, 700))
+        self.directory = tempfile.TemporaryDirectory()
+        leaderboard = Leaderboard(JsonLinesStorage(os.path.join(self.directory.name, "leaderboard.jsonl")))
+        model = GameModel(RandomStreams(0), leaderboard=leaderboard)
+        model.game_state.detach(leaderboard)
+        self.controller = GameController(model, CountingUI(screen),
+                                         record_replays=False, threaded=False)
+
+    def tearDown(self):
+        pygame.time.set_timer(pygame.QUIT, 0)
+        pygame.event.set_allowed(None)
+        pygame.event.clear()
+        self.directory.cleanup()
+
+    def test_menu_draws_once_then_waits(self):
+        self.assertEqual(self.controller.menu_events("menu", MENU_EVENTS, 10), [])
+        self.assertIsNone(self.controller.menu_events("menu", MENU_EVENTS, 10))
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a))
+        self.assertEqual([event.type for event in self.controller.menu_events("menu", MENU_EVENTS, 10)],
+                         [pygame.KEYDOWN])
+
+    def test_filtered_events_are_dropped(self):
+        self.controller.allow_events(MENU_EVENTS)
+        self.assertTrue(pygame.event.get_blocked(pygame.JOYBUTTONDOWN))
+        self.assertFalse(pygame.event.get_blocked(pygame.MOUSEBUTTONDOWN))
+
+    def test_game_over_redraws_only_on_input(self):
+        pygame.time.set_timer(pygame.QUIT, 200, 1)
+        self.controller.handle_collision()
+        self.assertEqual(self.controller.view.leaderboard_draws, 1)
+
+    def test_replay_button_resets_game(self):
+        self.controller.model.game_state.stop_game()
+        self.controller.allow_events(MENU_EVENTS)
+        pygame.time.set_timer(pygame.QUIT, 1000, 1)  # Ends the wait if the click is lost
+        pygame.event.post(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(300, 525), button=1))
+        self.controller.menu_screen = "game over"
+        self.controller.handle_collision()
+        self.assertTrue(self.controller.model.game_state.is_running)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,7 @@ import unittest
 from Game_files.model import GameModel
 from Game_files.car_factory import CarFactory
 from Game_files.coin import Coin
-from settings import SCREEN_WIDTH, SCREEN_HEIGHT, CarDimensions as cd
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, ROAD_LINE_HEIGHT, ROAD_LINE_GAP, CarDimensions as cd
 import time
 
 class TestGameModel(unittest.TestCase):
@@ -51,5 +51,31 @@ class TestGameModel(unittest.TestCase):
         self.model.add_new_enemy_cars()
         self.assertGreaterEqual(len(self.model.game_objects.enemy_cars), initial_count)
 
+    def add_tracked_car(self, x, y):
+        car = CarFactory.create_car(car_type='enemy', x=x, y=y, speed=5, strategy=None)
+        self.model.game_objects.enemy_cars.append(car)
+        self.model.game_objects.enemy_cars.track(car)
+        return car
+
+    def test_near_miss_counts_each_car_once(self):
+        player = self.model.player
+        car = self.add_tracked_car(player.car_x + cd.PLAYER_CAR_WIDTH.value, player.car_y)
+        self.model.check_near_misses()
+        self.model.check_near_misses()
+        self.assertEqual(self.model.near_miss_interceptor.get_near_miss_count(), 1)
+        self.assertNotIn(car.entity_id, self.model.game_objects.enemy_cars.tracked)
+
+    def test_near_miss_ignores_far_cars(self):
+        far = self.add_tracked_car(0, 0)
+        self.model.check_near_misses()
+        self.assertEqual(self.model.near_miss_interceptor.get_near_miss_count(), 0)
+        self.assertIn(far.entity_id, self.model.game_objects.enemy_cars.tracked)
+
+    def test_scroll_road_wraps(self):
+        for _ in range(ROAD_LINE_HEIGHT + ROAD_LINE_GAP):
+            self.model.scroll_road()
+            self.assertLess(self.model.game_objects.road_offset, ROAD_LINE_HEIGHT + ROAD_LINE_GAP)
+        self.assertEqual(self.model.game_objects.road_offset, 0)
+
 if __name__ == '__main__':
     unittest.main()
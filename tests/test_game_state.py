@@ -36,5 +36,11 @@ class TestGameState(unittest.TestCase):
         self.assertEqual(observer.player_name, "")
         self.assertEqual(observer.score, 0)
 
+    def test_instances_are_independent(self):
+        other = GameState()
+        self.game_state.add_coin()
+        self.assertEqual(other.coin_count, 0)
+        self.assertIsNot(other.observers, self.game_state.observers)
+
 if __name__ == '__main__':
     unittest.main()
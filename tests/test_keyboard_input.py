@@ -0,0 +1,48 @@
+import unittest
+import pygame
+from Game_files.keyboard_input import KeyboardInput
+from Game_files.simulation import Input, Simulation
+from Game_files.model import GameModel
+from settings import PLAYER_CAR_SPEED
+
+BINDINGS = {pygame.K_LEFT: Input.LEFT, pygame.K_s: Input.CHECKPOINT}
+
+def key_event(kind, key):
+    return pygame.event.Event(kind, key=key)
+
+class TestKeyboardInput(unittest.TestCase):
+    def setUp(self):
+        self.keyboard = KeyboardInput(BINDINGS)
+
+    def test_held_key_stays_in_snapshots(self):
+        self.keyboard.handle(key_event(pygame.KEYDOWN, pygame.K_LEFT))
+        self.assertEqual(self.keyboard.snapshot(), Input.LEFT)
+        self.assertEqual(self.keyboard.snapshot(), Input.LEFT)
+        self.keyboard.handle(key_event(pygame.KEYUP, pygame.K_LEFT))
+        self.assertEqual(self.keyboard.snapshot(), Input.NONE)
+
+    def test_tap_within_a_frame_counts_once(self):
+        self.keyboard.handle(key_event(pygame.KEYDOWN, pygame.K_s))
+        self.keyboard.handle(key_event(pygame.KEYUP, pygame.K_s))
+        self.assertEqual(self.keyboard.snapshot(), Input.CHECKPOINT)
+        self.assertEqual(self.keyboard.snapshot(), Input.NONE)
+
+    def test_focus_loss_releases_keys(self):
+        self.keyboard.handle(key_event(pygame.KEYDOWN, pygame.K_LEFT))
+        self.keyboard.handle(pygame.event.Event(pygame.WINDOWFOCUSLOST))
+        self.assertEqual(self.keyboard.snapshot(), Input.NONE)
+
+    def test_unbound_keys_are_ignored(self):
+        self.keyboard.handle(key_event(pygame.KEYDOWN, pygame.K_a))
+        self.assertEqual(self.keyboard.snapshot(), Input.NONE)
+
+    def test_snapshot_moves_player_once_per_tick(self):
+        model = GameModel()
+        simulation = Simulation(model)
+        start = model.player.car_x
+        self.keyboard.handle(key_event(pygame.KEYDOWN, pygame.K_LEFT))
+        simulation.apply_inputs(self.keyboard.snapshot())
+        self.assertEqual(model.player.car_x, start - PLAYER_CAR_SPEED)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,11 @@
+import json
+import os
+import tempfile
+import threading
+import time
 import unittest
 from Game_files.leaderboard import Leaderboard
+from Game_files.leaderboard_storage import JsonLinesStorage, AsyncStorage
 from settings import LEADERBOARD_COUNT
 
 class TestLeaderboard(unittest.TestCase):
@@ -34,5 +40,107 @@ class TestLeaderboard(unittest.TestCase):
         self.assertIn(["test_player", 10], self.leaderboard.scores)
         self.assertNotIn(["test_player", 5], self.leaderboard.scores)
 
+class TestLeaderboardHistory(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "leaderboard.jsonl")
+        self.legacy_path = os.path.join(self.directory.name, "leaderboard.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def make_leaderboard(self):
+        return Leaderboard(JsonLinesStorage(self.path, self.legacy_path))
+
+    def test_keeps_every_result(self):
+        leaderboard = self.make_leaderboard()
+        for score in range(LEADERBOARD_COUNT + 3):
+            leaderboard.update(f"player{score}", score)
+        reloaded = self.make_leaderboard()
+        self.assertEqual(len(reloaded.index), LEADERBOARD_COUNT + 3)
+        self.assertEqual(reloaded.scores, leaderboard.scores)
+        self.assertEqual(reloaded.rank(0), LEADERBOARD_COUNT + 3)
+
+    def test_update_appends_without_rewriting(self):
+        leaderboard = self.make_leaderboard()
+        leaderboard.update("first", 3)
+        with open(self.path) as file:
+            before = file.read()
+        leaderboard.update("second", 9)
+        with open(self.path) as file:
+            after = file.read()
+        self.assertTrue(after.startswith(before))
+        self.assertEqual(after[len(before):], json.dumps(["second", 9]) + "\n")
+
+    def test_skips_torn_last_line(self):
+        with open(self.path, 'w') as file:
+            file.write('["kept", 4]\n["torn", ')
+        self.assertEqual(self.make_leaderboard().scores, [["kept", 4]])
+
+    def test_imports_legacy_file(self):
+        with open(self.legacy_path, 'w') as file:
+            json.dump([["old", 12], ["older", 7]], file)
+        self.assertEqual(self.make_leaderboard().scores, [["old", 12], ["older", 7]])
+        self.assertTrue(os.path.exists(self.path))
+
+    def test_rewrite_replaces_atomically(self):
+        storage = JsonLinesStorage(self.path)
+        storage.rewrite([("first", 3)])
+        storage.rewrite([("second", 9)])
+        self.assertEqual(storage.load(), [("second", 9)])
+        self.assertEqual(os.listdir(self.directory.name), ["leaderboard.jsonl"])
+
+class SlowStorage(JsonLinesStorage):
+    def __init__(self, path, gate):
+        super().__init__(path)
+        self.gate = gate
+        self.writes = 0
+
+    def append_many(self, results):
+        self.gate.wait(5)
+        self.writes += 1
+        super().append_many(results)
+
+class TestAsyncStorage(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "leaderboard.jsonl")
+        self.gate = threading.Event()
+        self.storage = SlowStorage(self.path, self.gate)
+        self.leaderboard = Leaderboard(AsyncStorage(self.storage))
+
+    def tearDown(self):
+        self.gate.set()
+        self.leaderboard.flush()
+        self.directory.cleanup()
+
+    def test_update_does_not_wait_for_storage(self):
+        start = time.perf_counter()
+        self.leaderboard.update("first", 3)
+        self.assertLess(time.perf_counter() - start, 1)
+        self.assertEqual(self.leaderboard.scores, [["first", 3]])
+        self.assertFalse(os.path.exists(self.path))
+        self.gate.set()
+        self.leaderboard.flush()
+        self.assertEqual(JsonLinesStorage(self.path).load(), [("first", 3)])
+
+    def test_coalesces_queued_appends(self):
+        for score in range(5):
+            self.leaderboard.update(f"player{score}", score)
+        self.gate.set()
+        self.leaderboard.flush()
+        self.assertLessEqual(self.storage.writes, 2)
+        self.assertEqual(len(JsonLinesStorage(self.path).load()), 5)
+
+    def test_rewrite_supersedes_queued_appends(self):
+        self.leaderboard.update("first", 3)
+        self.leaderboard.update("second", 9)
+        self.leaderboard.save_scores()
+        self.leaderboard.update("third", 5)
+        self.gate.set()
+        self.leaderboard.load_scores()
+        self.assertEqual(self.leaderboard.top(5), [["second", 9], ["third", 5], ["first", 3]])
+        self.assertEqual(self.leaderboard.count(), 3)
+
 if __name__ == '__main__':
     unittest.main()
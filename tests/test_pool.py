@@ -0,0 +1,46 @@
+import unittest
+from Game_files.pool import ObjectPool
+from Game_files.coin import Coin
+from Game_files.entity_store import Coins
+from Game_files.model import GameModel
+
+class Point:
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+class TestObjectPool(unittest.TestCase):
+    def test_released_objects_are_reused(self):
+        pool = ObjectPool(Point)
+        first = pool.acquire(1, 2)
+        pool.release(first)
+        second = pool.acquire(3, 4)
+        self.assertIs(second, first)
+        self.assertEqual((second.x, second.y), (3, 4))
+        self.assertEqual(pool.stats(), {"created": 1, "reused": 1, "released": 1, "discarded": 0, "available": 0})
+
+    def test_max_size_bounds_the_free_list(self):
+        pool = ObjectPool(Point, max_size=1)
+        pool.release(Point(0, 0))
+        pool.release(Point(1, 1))
+        self.assertEqual(len(pool.free), 1)
+        self.assertEqual(pool.discarded, 1)
+
+    def test_despawned_entities_return_to_their_pool(self):
+        coins = Coins([Coin.pool.acquire(0, 0), Coin.pool.acquire(0, 900)])
+        despawned = coins[1]
+        coins.remove_below(700)
+        self.assertIs(Coin.pool.acquire(5, 5), despawned)
+        self.assertIsNone(despawned.store)
+        self.assertEqual(len(coins), 1)
+
+    def test_strategies_are_shared(self):
+        model = GameModel()
+        cars = [model.create_enemy_car() for _ in range(10)]
+        strategies = {id(car.strategy) for car in cars if car}
+        self.assertLessEqual(strategies, {id(strategy) for strategy in model.movement_strategies()})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import csv
+import gc
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from Game_files.profiler import FrameProfiler, NULL_SCOPE, percentile
+
+class Worker:
+    def work(self, value):
+        return value * 2
+
+class TestFrameProfiler(unittest.TestCase):
+    def setUp(self):
+        self.profiler = FrameProfiler(enabled=True, window=100, trace_frames=50)
+
+    def test_disabled_costs_nothing(self):
+        profiler = FrameProfiler(enabled=False)
+        worker = Worker()
+        profiler.instrument(worker, "work")
+        self.assertNotIn("work", vars(worker))
+        self.assertIs(profiler.scope("flip"), NULL_SCOPE)
+        profiler.end_frame(enemy_cars=3)
+        self.assertEqual(profiler.stats(), {})
+        profiler.toggle_overlay()
+        self.assertFalse(profiler.overlay_visible)
+
+    def test_instrument_times_calls(self):
+        worker = Worker()
+        self.profiler.instrument(worker, "work")
+        self.assertEqual(worker.work(4), 8)
+        worker.work(5)
+        self.profiler.end_frame()
+        self.assertEqual(self.profiler.stats()["work"]["frames"], 1)
+        self.assertIn("frame", self.profiler.stats())
+
+    def test_scopes_sum_per_frame(self):
+        self.profiler.record("draw_road", 0.001)
+        self.profiler.record("draw_road", 0.002)
+        self.profiler.end_frame(enemy_cars=4)
+        self.assertAlmostEqual(self.profiler.stats()["draw_road"]["p50"], 3.0)
+        self.assertEqual(self.profiler.counts, {"enemy_cars": 4})
+
+    def test_records_from_another_thread_are_kept(self):
+        profiler = FrameProfiler(enabled=True, window=100000, trace_frames=10)
+        def tick():
+            for _ in range(20000):
+                profiler.record("tick", 0.001)
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # Switch threads often enough to hit the race
+        try:
+            worker = threading.Thread(target=tick)
+            worker.start()
+            while worker.is_alive():
+                profiler.end_frame()
+            worker.join()
+        finally:
+            sys.setswitchinterval(interval)
+        profiler.end_frame()
+        self.assertAlmostEqual(sum(profiler.windows["tick"]), 20000.0, places=3)
+
+    def test_percentiles_over_window(self):
+        for milliseconds in range(1, 201):
+            self.profiler.record("tick", milliseconds / 1000)
+            self.profiler.end_frame()
+        stats = self.profiler.stats()["tick"]
+        self.assertEqual(stats["frames"], 100)
+        self.assertAlmostEqual(stats["p50"], 151)
+        self.assertAlmostEqual(stats["p99"], 200)
+        self.assertEqual(percentile([], 0.5), 0.0)
+        self.assertEqual(len(self.profiler.frames), 50)
+
+    def test_gc_passes_are_recorded(self):
+        self.profiler.watch_gc()
+        try:
+            gc.collect()
+        finally:
+            self.profiler.unwatch_gc()
+        self.profiler.end_frame()
+        self.assertIn("gc", self.profiler.stats())
+        self.assertNotIn(self.profiler.on_gc, gc.callbacks)
+
+    def test_overlay_lines(self):
+        self.profiler.record("draw_road", 0.002)
+        self.profiler.end_frame(coins=2)
+        self.profiler.toggle_overlay()
+        self.assertTrue(self.profiler.overlay_visible)
+        self.assertTrue(any(line.startswith("draw_road") for line in self.profiler.overlay))
+        self.assertEqual(self.profiler.overlay[-1], "coins 2")
+
+    def test_export(self):
+        for frame in range(3):
+            self.profiler.record("flip", 0.001)
+            self.profiler.end_frame(enemy_cars=frame)
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = os.path.join(directory, "profile.csv")
+            json_path = os.path.join(directory, "profile.json")
+            self.profiler.export(csv_path)
+            self.profiler.export(json_path)
+            with open(csv_path) as file:
+                rows = list(csv.DictReader(file))
+            with open(json_path) as file:
+                trace = json.load(file)
+        self.assertEqual([row["enemy_cars"] for row in rows], ["0", "1", "2"])
+        self.assertAlmostEqual(float(rows[0]["flip_ms"]), 1.0)
+        self.assertEqual(len(trace["frames"]), 3)
+        self.assertIn("flip", trace["stats"])
+
+if __name__ == '__main__':
+    unittest.main()
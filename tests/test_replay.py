@@ -0,0 +1,98 @@
+import os
+import random
+import tempfile
+import unittest
+from Game_files.model import GameModel
+from Game_files.rng import RandomStreams
+from Game_files.simulation import Simulation, Input
+from Game_files.replay import Recording, Replayer, HEADER, RUN
+from Game_files.car import Enemy
+from Game_files.coin import Coin
+
+def record_game(seed, ticks):
+    model = GameModel(RandomStreams(seed))
+    if model.leaderboard in model.game_state.observers:
+        model.game_state.detach(model.leaderboard)
+    model.game_state.reset()
+    simulation = Simulation(model)
+    recording = Recording(seed)
+    keys = random.Random(seed)
+    for _ in range(ticks):
+        inputs = keys.choice([Input.NONE, Input.LEFT, Input.RIGHT, Input.UP | Input.LEFT, Input.DOWN])
+        recording.append(inputs)
+        if not simulation.step(inputs):
+            break
+    return recording, state_of(model)
+
+def state_of(model):
+    return ([(car.x, car.y) for car in model.game_objects.enemy_cars],
+            [(coin.x, coin.y) for coin in model.game_objects.coins],
+            (model.player.car_x, model.player.car_y),
+            model.game_state.coin_count,
+            model.near_miss_interceptor.get_near_miss_count())
+
+class TestRecording(unittest.TestCase):
+    def test_round_trip(self):
+        recording = Recording(1234, 60, [0, 0, 1, 1, 1, 5, 0])
+        loaded = Recording.from_bytes(recording.to_bytes())
+        self.assertEqual((loaded.seed, loaded.tick_rate, loaded.inputs), (1234, 60, recording.inputs))
+
+    def test_run_length_encoding(self):
+        recording = Recording(1, inputs=[Input.LEFT] * 1000 + [Input.NONE] * 70000)
+        self.assertEqual(list(recording.runs()), [(1, 1000), (0, 65535), (0, 4465)])
+        self.assertEqual(len(recording.to_bytes()), HEADER.size + 3 * RUN.size)
+
+    def test_rejects_other_files(self):
+        with self.assertRaises(ValueError):
+            Recording.from_bytes(b"JUNK" + bytes(HEADER.size))
+        data = Recording(1, inputs=[1, 2, 3]).to_bytes()
+        with self.assertRaises(ValueError):
+            Recording.from_bytes(data[:-RUN.size])
+
+    def test_save_and_load(self):
+        recording = Recording(99, inputs=[1, 2, 2])
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "replays", "game.rpl")
+            recording.save(path)
+            self.assertEqual(Recording.load(path).inputs, recording.inputs)
+
+class TestReplayer(unittest.TestCase):
+    def test_replay_reproduces_game(self):
+        for seed in range(3):
+            recording, final_state = record_game(seed, 600)
+            replayer = Replayer(recording)
+            stats = replayer.run()
+            self.assertEqual(stats["ticks"], len(recording))
+            self.assertEqual(state_of(replayer.model), final_state)
+
+    def test_seek_matches_playing_through(self):
+        recording, _ = record_game(1, 300)
+        ticks = len(recording)
+        expected = Replayer(recording)
+        expected.run(ticks // 2)
+        replayer = Replayer(recording, keyframe_interval=25)
+        replayer.run()
+        replayer.seek(ticks // 2)
+        self.assertEqual(replayer.tick, ticks // 2)
+        self.assertEqual(state_of(replayer.model), state_of(expected.model))
+        self.assertGreater(len(replayer.keyframes), 1)
+
+    def test_seek_releases_replaced_entities(self):
+        recording, _ = record_game(1, 300)
+        replayer = Replayer(recording, keyframe_interval=25)
+        replayer.run()
+        objects = replayer.model.game_objects
+        views = len(objects.enemy_cars) + len(objects.coins)
+        released = Enemy.pool.released + Enemy.pool.discarded + Coin.pool.released + Coin.pool.discarded
+        replayer.seek(len(recording) // 2)
+        self.assertEqual(Enemy.pool.released + Enemy.pool.discarded + Coin.pool.released + Coin.pool.discarded,
+                         released + views)
+        self.assertEqual(len(objects.enemy_cars), 0)
+
+    def test_reports_slowest_ticks(self):
+        recording, _ = record_game(2, 100)
+        stats = Replayer(recording).run(slowest=3)
+        self.assertEqual(len(stats["slowest"]), min(3, len(recording)))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+from Game_files.rng import RandomStreams
+from Game_files.headless import HeadlessRunner
+
+class TestRandomStreams(unittest.TestCase):
+    def test_same_seed_same_numbers(self):
+        first, second = RandomStreams(42), RandomStreams(42)
+        for name in RandomStreams.names:
+            self.assertEqual([getattr(first, name).random() for _ in range(5)],
+                             [getattr(second, name).random() for _ in range(5)])
+
+    def test_streams_are_independent(self):
+        first, second = RandomStreams(42), RandomStreams(42)
+        for _ in range(10):
+            first.coin.random()
+        self.assertEqual(first.spawn.random(), second.spawn.random())
+        self.assertNotEqual(first.spawn.random(), first.strategy.random())
+
+    def test_random_seed_is_recorded(self):
+        streams = RandomStreams()
+        self.assertEqual(RandomStreams(streams.seed).spawn.random(), streams.spawn.random())
+
+    def test_state_round_trip(self):
+        streams = RandomStreams(1)
+        state = streams.get_state()
+        numbers = [streams.coin.random() for _ in range(3)]
+        streams.set_state(state)
+        self.assertEqual([streams.coin.random() for _ in range(3)], numbers)
+
+    def test_seeded_runs_are_identical(self):
+        def traffic(seed):
+            runner = HeadlessRunner(seed=seed, stress_enemies=30)
+            runner.run(300)
+            cars = [(car.x, car.y) for car in runner.model.game_objects.enemy_cars]
+            return cars, runner.crashes, runner.model.game_state.coin_count
+        self.assertEqual(traffic(5), traffic(5))
+
+if __name__ == '__main__':
+    unittest.main()
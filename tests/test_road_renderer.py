@@ -0,0 +1,36 @@
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import unittest
+import pygame
+from Game_files.road_renderer import RoadRenderer
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, LANE_WIDTH, ROAD_LINE_HEIGHT, ROAD_LINE_GAP, WHITE, GREY
+
+class TestRoadRenderer(unittest.TestCase):
+    def setUp(self):
+        self.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.road = RoadRenderer()
+
+    def test_builds_once(self):
+        self.road.draw(self.screen, 0)
+        surface = self.road.surface
+        self.road.draw(self.screen, 10)
+        self.assertIs(self.road.surface, surface)
+        self.assertGreater(surface.get_height(), SCREEN_HEIGHT)
+
+    def test_rebuilds_on_screen_size_change(self):
+        self.road.draw(self.screen, 0)
+        surface = self.road.surface
+        self.road.draw(pygame.Surface((400, 300)), 0)
+        self.assertIsNot(self.road.surface, surface)
+
+    def test_offset_scrolls_lines(self):
+        self.road.draw(self.screen, 0)
+        self.assertEqual(self.screen.get_at((LANE_WIDTH, 5))[:3], WHITE)
+        self.road.draw(self.screen, ROAD_LINE_HEIGHT)
+        self.assertEqual(self.screen.get_at((LANE_WIDTH, 5))[:3], GREY)
+        self.assertEqual(self.screen.get_at((LANE_WIDTH, ROAD_LINE_HEIGHT + 5))[:3], WHITE)
+        self.road.draw(self.screen, ROAD_LINE_HEIGHT + ROAD_LINE_GAP)
+        self.assertEqual(self.screen.get_at((LANE_WIDTH, 5))[:3], WHITE)
+
+if __name__ == '__main__':
+    unittest.main()
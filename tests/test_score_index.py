@@ -0,0 +1,37 @@
+import random
+import unittest
+from Game_files.score_index import ScoreIndex
+
+class TestScoreIndex(unittest.TestCase):
+    def test_matches_sorted_list(self):
+        rng = random.Random(7)
+        index, results = ScoreIndex(), []
+        for number in range(500):
+            result = (f"player{number}", rng.randint(0, 300))
+            index.add(*result)
+            results.append(result)
+        ranked = sorted(results, key=lambda result: result[1], reverse=True)
+        self.assertEqual(index.top(20), [list(result) for result in ranked[:20]])
+        self.assertEqual(index.top(1000), [list(result) for result in ranked])
+        for score in (0, 17, 150, 299, 300, 1000):
+            self.assertEqual(index.rank(score), 1 + sum(1 for _, other in results if other > score))
+
+    def test_ties_keep_insertion_order(self):
+        index = ScoreIndex([("a", 3), ("b", 5), ("c", 3)])
+        self.assertEqual(index.top(3), [["b", 5], ["a", 3], ["c", 3]])
+        self.assertEqual(index.rank(3), 2)
+
+    def test_grows_past_initial_range(self):
+        index = ScoreIndex([("low", 1), ("high", 10 ** 5)])
+        self.assertEqual(index.top(1), [["high", 10 ** 5]])
+        self.assertEqual(index.rank(2), 2)
+        self.assertEqual(len(index), 2)
+
+    def test_rejects_invalid_scores(self):
+        with self.assertRaises(ValueError):
+            ScoreIndex().add("x", -1)
+        with self.assertRaises(ValueError):
+            ScoreIndex().add("x", 2.5)
+
+if __name__ == '__main__':
+    unittest.main()
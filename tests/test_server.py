@@ -0,0 +1,104 @@
+import asyncio
+import os
+import random
+import tempfile
+import unittest
+from Game_files.leaderboard import Leaderboard
+from Game_files.leaderboard_storage import JsonLinesStorage
+from Game_files.load_client import run_load_test
+from Game_files.model import GameModel
+from Game_files.protocol import (DeltaEncoder, StateMirror, frame, read_frame, ENTITY, STATE_HEADER,
+                                 HELLO, INPUT, WELCOME, STATE, HELLO_MESSAGE, INPUT_MESSAGE, WELCOME_MESSAGE)
+from Game_files.rng import RandomStreams
+from Game_files.server import GameServer
+from Game_files.session import SessionRegistry
+from Game_files.simulation import Simulation, Input
+
+def positions(store):
+    return {handle: (int(x), int(y)) for handle, x, y in zip(store.handles, store.x, store.y)}
+
+class TestDeltaEncoder(unittest.TestCase):
+    def test_mirror_tracks_model(self):
+        model = GameModel(RandomStreams(11))
+        model.game_state.detach(model.leaderboard)
+        simulation = Simulation(model)
+        encoder, mirror = DeltaEncoder(), StateMirror()
+        rng = random.Random(3)
+        for _ in range(600):
+            if not simulation.step(rng.choice(list(Input))):
+                model.reset_game()
+            mirror.apply(encoder.encode(model, simulation.tick))
+            self.assertEqual(mirror.enemy_cars, positions(model.game_objects.enemy_cars))
+            self.assertEqual(mirror.coins, positions(model.game_objects.coins))
+        self.assertEqual(mirror.tick, simulation.tick)
+        self.assertEqual(mirror.player, (int(model.player.car_x), int(model.player.car_y)))
+
+    def test_sends_only_changes(self):
+        model = GameModel(RandomStreams(1))
+        encoder = DeltaEncoder()
+        encoder.encode(model, 0)
+        model.game_objects.road_offset += 1
+        self.assertEqual(len(encoder.encode(model, 1)), STATE_HEADER.size)
+        encoder.reset()
+        self.assertEqual(len(encoder.encode(model, 1)), STATE_HEADER.size + len(model.game_objects.enemy_cars) * ENTITY.size
+                         + len(model.game_objects.coins) * ENTITY.size)
+
+class TestGameServer(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        leaderboard = Leaderboard(JsonLinesStorage(os.path.join(self.directory.name, "leaderboard.jsonl")))
+        self.server = GameServer(SessionRegistry(leaderboard))
+        listener = await self.server.start(port=0)
+        self.port = listener.sockets[0].getsockname()[1]
+
+    async def asyncTearDown(self):
+        await self.server.close()
+        self.directory.cleanup()
+
+    async def join(self, name):
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        writer.write(frame(HELLO_MESSAGE.pack(HELLO) + name.encode()))
+        message_type, session_id, tick_rate = WELCOME_MESSAGE.unpack(await read_frame(reader))
+        self.assertEqual(message_type, WELCOME)
+        return reader, writer, session_id
+
+    async def test_inputs_and_state(self):
+        reader, writer, session_id = await self.join("driver")
+        session = self.server.registry.get(session_id)
+        self.assertEqual(session.model.game_state.player_name, "driver")
+        session.model.checkpoint_loaded_time = float("inf")  # Immune, so the test never crashes
+        start_x = session.model.player.car_x
+        writer.write(frame(INPUT_MESSAGE.pack(INPUT, Input.LEFT)))
+        await writer.drain()
+        while session.model.player.car_x == start_x:
+            self.server.tick()
+            await asyncio.sleep(0.001)
+        mirror = StateMirror()
+        while mirror.player[0] != int(session.model.player.car_x) or mirror.tick != session.simulation.tick:
+            message = await read_frame(reader)
+            self.assertEqual(message[0], STATE)
+            mirror.apply(message)
+        self.assertEqual(mirror.enemy_cars, positions(session.model.game_objects.enemy_cars))
+        writer.close()
+
+    async def test_disconnect_closes_session(self):
+        _, writer, session_id = await self.join("leaving")
+        self.assertEqual(len(self.server.registry), 1)
+        writer.close()
+        await writer.wait_closed()
+        for _ in range(100):
+            if not self.server.clients:
+                break
+            await asyncio.sleep(0.01)
+        self.assertEqual(len(self.server.registry), 0)
+
+    async def test_load_test_client(self):
+        serving = asyncio.create_task(self.server.serve())
+        stats = await run_load_test(5, 0.5, lambda: asyncio.open_connection("127.0.0.1", self.port))
+        serving.cancel()
+        self.assertEqual(stats["clients"], 5)
+        self.assertGreater(stats["updates_per_second"], 0)
+        self.assertGreater(stats["bytes_per_second_mean"], 0)
+
+if __name__ == '__main__':
+    unittest.main()
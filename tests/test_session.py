@@ -0,0 +1,81 @@
+import os
+import tempfile
+import unittest
+from Game_files.car_factory import CarFactory
+from Game_files.leaderboard import Leaderboard
+from Game_files.leaderboard_storage import JsonLinesStorage
+from Game_files.model import GameModel
+from Game_files.rng import RandomStreams
+from Game_files.session import SessionRegistry, deep_sizeof
+from Game_files.simulation import Simulation
+from Game_files.strategy import StraightMovement
+from settings import ENEMY_CAR_SPEED
+
+class TestSessionRegistry(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        storage = JsonLinesStorage(os.path.join(self.directory.name, "leaderboard.jsonl"))
+        self.registry = SessionRegistry(Leaderboard(storage))
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def crash(self, session):
+        model = session.model
+        enemy = CarFactory.create_car(car_type='enemy', x=model.player.car_x, y=model.player.car_y - ENEMY_CAR_SPEED,
+                                      speed=ENEMY_CAR_SPEED, strategy=StraightMovement())
+        model.game_objects.enemy_cars.append(enemy)
+
+    def test_sessions_have_separate_state(self):
+        first = self.registry.create("first", seed=1)
+        second = self.registry.create("second", seed=2)
+        first.model.game_state.add_coin()
+        self.assertEqual(first.model.game_state.coin_count, 1)
+        self.assertEqual(second.model.game_state.coin_count, 0)
+        self.assertEqual(second.model.game_state.player_name, "second")
+        self.assertEqual(len(self.registry), 2)
+
+    def test_matches_a_lone_game(self):
+        for number in range(20):
+            self.registry.create(f"player{number}", seed=number)
+        for _ in range(300):
+            for session_id in self.registry.step_all():
+                self.registry.get(session_id).restart()
+        lone = GameModel(RandomStreams(7), leaderboard=self.registry.leaderboard)
+        lone.game_state.detach(self.registry.leaderboard)
+        simulation = Simulation(lone)
+        for _ in range(300):
+            if not simulation.step():
+                lone.reset_game()
+        hosted = self.registry.get(8).model
+        self.assertEqual(list(hosted.game_objects.enemy_cars.y), list(lone.game_objects.enemy_cars.y))
+        self.assertEqual(hosted.game_state.coin_count, lone.game_state.coin_count)
+
+    def test_crash_records_result_once(self):
+        crashing = self.registry.create("crasher", seed=3)
+        self.registry.create("survivor", seed=4)
+        crashing.model.game_state.coin_count = 6
+        self.crash(crashing)
+        self.assertEqual(self.registry.step_all(), [crashing.session_id])
+        self.assertFalse(crashing.is_running)
+        self.assertEqual(self.registry.step_all(), [])
+        self.assertEqual(self.registry.leaderboard.scores, [["crasher", 6]])
+        crashing.restart()
+        self.assertTrue(crashing.is_running)
+
+    def test_close_detaches_leaderboard(self):
+        session = self.registry.create("leaving")
+        self.registry.close(session.session_id)
+        self.assertNotIn(self.registry.leaderboard, session.model.game_state.observers)
+        self.assertEqual(len(self.registry), 0)
+
+    def test_memory_usage_excludes_leaderboard(self):
+        for score in range(2000):
+            self.registry.leaderboard.index.add("padding", score)
+        session = self.registry.create("measured", seed=5)
+        usage = self.registry.memory_usage()[session.session_id]
+        self.assertGreater(usage, 0)
+        self.assertLess(usage, deep_sizeof(self.registry.leaderboard))
+
+if __name__ == '__main__':
+    unittest.main()
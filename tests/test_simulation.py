@@ -0,0 +1,64 @@
+import subprocess
+import sys
+import unittest
+from Game_files.model import GameModel
+from Game_files.car_factory import CarFactory
+from Game_files.coin import Coin
+from Game_files.simulation import Simulation, Input
+from Game_files.strategy import StraightMovement
+from Game_files.headless import HeadlessRunner
+from settings import PLAYER_CAR_SPEED, ENEMY_CAR_SPEED, CHECKPOINT_COIN_COUNT
+
+class TestSimulation(unittest.TestCase):
+    def setUp(self):
+        self.model = GameModel()
+        self.model.game_state.detach(self.model.leaderboard)
+        self.model.game_state.reset()
+        self.simulation = Simulation(self.model)
+
+    def add_enemy_on_player(self):
+        enemy = CarFactory.create_car(car_type='enemy', x=self.model.player.car_x, y=self.model.player.car_y - ENEMY_CAR_SPEED,
+                                      speed=ENEMY_CAR_SPEED, strategy=StraightMovement())
+        self.model.game_objects.enemy_cars.append(enemy)
+
+    def test_step_advances_tick(self):
+        self.assertTrue(self.simulation.step())
+        self.assertEqual(self.simulation.tick, 1)
+        self.assertAlmostEqual(self.model.clock(), 1 / self.simulation.tick_rate)
+
+    def test_inputs_move_player(self):
+        x, y = self.model.player.car_x, self.model.player.car_y
+        self.simulation.step(Input.LEFT | Input.UP)
+        self.assertEqual(self.model.player.car_x, x - PLAYER_CAR_SPEED)
+        self.assertEqual(self.model.player.car_y, y - PLAYER_CAR_SPEED)
+
+    def test_crash_stops_game(self):
+        self.add_enemy_on_player()
+        self.assertFalse(self.simulation.step())
+        self.assertFalse(self.model.game_state.is_running)
+
+    def test_crash_restores_checkpoint(self):
+        self.model.game_state.coin_count = CHECKPOINT_COIN_COUNT
+        self.simulation.step(Input.CHECKPOINT)
+        self.add_enemy_on_player()
+        self.assertTrue(self.simulation.step())
+        self.assertTrue(self.model.game_state.is_running)
+        self.assertTrue(self.model.is_immunity_active()[0])
+
+    def test_collects_coins(self):
+        self.model.game_objects.coins.append(Coin(self.model.player.car_x, self.model.player.car_y))
+        self.simulation.step()
+        self.assertEqual(self.model.game_state.coin_count, 1)
+
+    def test_headless_runner(self):
+        stats = HeadlessRunner(self.model).run(500)
+        self.assertEqual(stats["ticks"], 500)
+        self.assertGreater(stats["ticks_per_second"], 0)
+
+    def test_does_not_import_pygame(self):
+        code = "import sys, Game_files.simulation, Game_files.headless; print('pygame' in sys.modules)"
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), "False")
+
+if __name__ == '__main__':
+    unittest.main()
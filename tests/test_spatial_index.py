@@ -0,0 +1,39 @@
+import random
+import unittest
+from Game_files.car_factory import CarFactory
+from Game_files.spatial_index import SpatialIndex
+from settings import SCREEN_WIDTH, SCREEN_HEIGHT, CarDimensions as cd
+
+def make_enemy(x, y):
+    return CarFactory.create_car(car_type='enemy', x=x, y=y, speed=5, strategy=None)
+
+class TestSpatialIndex(unittest.TestCase):
+    def test_query_matches_full_scan(self):
+        rng = random.Random(3)
+        index = SpatialIndex()
+        cars = [make_enemy(rng.uniform(0, SCREEN_WIDTH), rng.uniform(-300, SCREEN_HEIGHT)) for _ in range(200)]
+        for car in cars:
+            index.insert(car)
+        width, height = cd.ENEMY_CAR_WIDTH.value, cd.ENEMY_CAR_HEIGHT.value
+        for _ in range(100):
+            x, y = rng.uniform(0, SCREEN_WIDTH), rng.uniform(-300, SCREEN_HEIGHT)
+            expected = {car for car in cars if abs(car.x - x) < width and abs(car.y - y) < height}
+            self.assertEqual(set(index.query(x, y, width, height)), expected)
+
+    def test_update_moves_car_between_cells(self):
+        index = SpatialIndex()
+        car = make_enemy(10, 10)
+        index.insert(car)
+        car.y += 500
+        index.update(car)
+        self.assertFalse(index.is_overlap(10, 10, 5, 5))
+        self.assertTrue(index.is_overlap(10, 510, 5, 5))
+
+    def test_exclude(self):
+        index = SpatialIndex()
+        car = make_enemy(10, 10)
+        index.insert(car)
+        self.assertFalse(index.is_overlap(10, 10, 5, 5, exclude=car))
+
+if __name__ == '__main__':
+    unittest.main()
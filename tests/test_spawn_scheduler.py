@@ -0,0 +1,60 @@
+import random
+import unittest
+from Game_files.car_factory import CarFactory
+from Game_files.entity_store import EnemyCars
+from Game_files.model import GameModel
+from Game_files.spawn_scheduler import SpawnScheduler
+from settings import NUM_LANES, CarDimensions as cd
+
+WIDTH, HEIGHT = cd.ENEMY_CAR_WIDTH.value, cd.ENEMY_CAR_HEIGHT.value
+
+class AlwaysSpawn:
+    def random(self):
+        return 0.0
+
+    def choice(self, options):
+        return options[0]
+
+def fill_spawn_band(enemy_cars, scheduler):
+    for x in scheduler.lane_xs:
+        enemy_cars.append(CarFactory.create_car(car_type='enemy', x=x, y=scheduler.y, speed=5, strategy=None))
+
+class TestSpawnScheduler(unittest.TestCase):
+    def test_rate_follows_curve(self):
+        scheduler = SpawnScheduler(((100, 0.1), (200, 0.3)), WIDTH, HEIGHT)
+        for tick, rate in ((0, 0.1), (100, 0.1), (150, 0.2), (200, 0.3), (1000, 0.3)):
+            scheduler.tick = tick
+            self.assertAlmostEqual(scheduler.rate(), rate)
+
+    def test_free_lanes_match_overlap_checks(self):
+        rng = random.Random(4)
+        for _ in range(50):
+            scheduler = SpawnScheduler(((0, 1),), WIDTH, HEIGHT)
+            enemy_cars = EnemyCars(CarFactory.create_car(car_type='enemy', x=rng.uniform(0, 800 - WIDTH),
+                                                         y=rng.uniform(-3 * HEIGHT, HEIGHT), speed=5, strategy=None)
+                                   for _ in range(8))
+            expected = sum(1 << lane for lane, x in enumerate(scheduler.lane_xs)
+                           if not enemy_cars.is_overlap(x, scheduler.y, WIDTH, HEIGHT))
+            self.assertEqual(scheduler.free_lanes(enemy_cars), expected)
+
+    def test_blocked_spawns_wait_in_queue(self):
+        scheduler = SpawnScheduler(((0, 1),), WIDTH, HEIGHT, queue_limit=2)
+        enemy_cars = EnemyCars()
+        fill_spawn_band(enemy_cars, scheduler)
+        self.assertEqual(scheduler.free_lanes(enemy_cars), 0)
+        for _ in range(5):
+            self.assertTrue(scheduler.due(AlwaysSpawn()))
+            self.assertIsNone(scheduler.pick(AlwaysSpawn(), enemy_cars))
+        self.assertEqual(scheduler.queued, 2)
+        enemy_cars.remove(enemy_cars[NUM_LANES - 1])
+        self.assertEqual(scheduler.free_lanes(enemy_cars), 1 << (NUM_LANES - 1))
+        self.assertEqual(scheduler.pick(AlwaysSpawn(), enemy_cars), (scheduler.lane_xs[-1], scheduler.y))
+
+    def test_full_road_does_not_stall(self):
+        model = GameModel()
+        fill_spawn_band(model.game_objects.enemy_cars, model.enemy_spawner)
+        self.assertIsNone(model.create_enemy_car())
+        self.assertIsNone(model.create_coin())
+
+if __name__ == '__main__':
+    unittest.main()
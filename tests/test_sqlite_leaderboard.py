@@ -0,0 +1,78 @@
+import os
+import random
+import tempfile
+import unittest
+from Game_files.background_writer import BackgroundWriter
+from Game_files.leaderboard import Leaderboard, create_leaderboard
+from Game_files.sqlite_leaderboard import SqliteLeaderboard
+from Game_files.score_index import ScoreIndex
+from settings import LEADERBOARD_COUNT
+
+class TestSqliteLeaderboard(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "leaderboard.db")
+        self.leaderboard = SqliteLeaderboard(self.path)
+
+    def tearDown(self):
+        self.leaderboard.close()
+        self.directory.cleanup()
+
+    def test_update(self):
+        self.leaderboard.update("test_player", 10)
+        self.assertIn(["test_player", 10], self.leaderboard.scores)
+
+    def test_uses_wal(self):
+        mode = self.leaderboard.connection.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+    def test_matches_score_index(self):
+        rng = random.Random(2)
+        results = [(f"player{number}", rng.randint(0, 50)) for number in range(300)]
+        self.leaderboard.update_many(results)
+        index = ScoreIndex(results)
+        self.assertEqual(self.leaderboard.top(25), index.top(25))
+        self.assertEqual(self.leaderboard.scores, index.top(LEADERBOARD_COUNT))
+        for score in (0, 10, 50, 60):
+            self.assertEqual(self.leaderboard.rank(score), index.rank(score))
+        self.assertEqual(self.leaderboard.count(), 300)
+
+    def test_batches_until_read(self):
+        self.leaderboard.batch_size = 10
+        other = SqliteLeaderboard(self.path)
+        for score in range(3):
+            self.leaderboard.update("batched", score)
+        self.assertEqual(other.count(), 0)
+        self.assertEqual(self.leaderboard.count(), 3)
+        self.assertEqual(other.count(), 3)
+        other.close()
+
+    def test_shared_between_connections(self):
+        other = SqliteLeaderboard(self.path)
+        self.leaderboard.update("first", 4)
+        other.update("second", 9)
+        self.assertEqual(self.leaderboard.scores, [["second", 9], ["first", 4]])
+        other.close()
+
+    def test_replace_scores(self):
+        self.leaderboard.update("old", 50)
+        self.leaderboard.scores = [["test_player", 5]]
+        self.assertEqual(self.leaderboard.scores, [["test_player", 5]])
+        self.assertEqual(self.leaderboard.rank(4), 2)
+
+    def test_background_writes(self):
+        leaderboard = SqliteLeaderboard(self.path, writer=BackgroundWriter())
+        for score in range(20):
+            leaderboard.update("async", score)
+        self.assertEqual(leaderboard.count(), 20)
+        leaderboard.close()
+        self.assertEqual(self.leaderboard.count(), 20)
+
+class TestCreateLeaderboard(unittest.TestCase):
+    def test_backends(self):
+        self.assertIsInstance(create_leaderboard("json"), Leaderboard)
+        with self.assertRaises(ValueError):
+            create_leaderboard("csv")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+import pygame
+from Game_files.text_cache import FontRegistry, TextCache
+from settings import BLACK, GOLD
+
+class TestTextCache(unittest.TestCase):
+    def setUp(self):
+        pygame.font.init()
+        self.fonts = FontRegistry()
+        self.text = TextCache(self.fonts, max_entries=2)
+
+    def test_font_registry_reuses_fonts(self):
+        self.assertIs(self.fonts.get(None, 36), self.fonts.get(None, 36))
+        self.assertIsNot(self.fonts.get(None, 36), self.fonts.get(None, 72))
+
+    def test_render_is_cached(self):
+        first = self.text.render("Coins: 1", BLACK)
+        second = self.text.render("Coins: 1", BLACK)
+        self.assertIs(first, second)
+        self.assertEqual(self.text.get_stats(), {"hits": 1, "misses": 1, "entries": 1})
+
+    def test_key_includes_color_and_size(self):
+        surface = self.text.render("Coins: 1", BLACK)
+        self.assertIsNot(self.text.render("Coins: 1", GOLD), surface)
+        self.assertIsNot(self.text.render("Coins: 1", BLACK, 60), surface)
+
+    def test_evicts_least_recently_used(self):
+        self.text.render("a", BLACK)
+        self.text.render("b", BLACK)
+        self.text.render("a", BLACK)
+        self.text.render("c", BLACK)
+        self.assertIn((None, 36, "a", BLACK), self.text.surfaces)
+        self.assertNotIn((None, 36, "b", BLACK), self.text.surfaces)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,37 @@
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import unittest
+import pygame
+from Game_files.texture_cache import TextureCache, car_size
+
+class TestTextureCache(unittest.TestCase):
+    def setUp(self):
+        pygame.display.init()
+        pygame.display.set_mode((100, 100))
+        self.cache = TextureCache()
+
+    def tearDown(self):
+        pygame.display.quit()
+
+    def test_get_counts_hits_and_misses(self):
+        first = self.cache.get("assets/enemy.png", (10, 20))
+        second = self.cache.get("assets/enemy.png", (10, 20))
+        self.assertIs(first, second)
+        self.assertEqual(first.get_size(), (10, 20))
+        self.assertEqual(self.cache.misses, 1)
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_preload(self):
+        self.cache.preload("assets/*.png")
+        self.assertEqual(self.cache.get_stats()["entries"], 4)
+        self.cache.get("assets/ferrari.png", car_size())
+        self.assertEqual(self.cache.misses, 0)
+
+    def test_display_mode_change_evicts(self):
+        self.cache.preload("assets/*.png")
+        pygame.display.set_mode((200, 100))
+        self.cache.validate()
+        self.assertEqual(self.cache.get_stats()["entries"], 0)
+
+if __name__ == '__main__':
+    unittest.main()
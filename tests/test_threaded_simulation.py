@@ -0,0 +1,104 @@
+import unittest
+from Game_files.car_factory import CarFactory
+from Game_files.model import GameModel
+from Game_files.rng import RandomStreams
+from Game_files.simulation import Simulation, Input
+from Game_files.strategy import StraightMovement
+from Game_files.threaded_simulation import (WorldSnapshot, SnapshotBuffer, InputQueue, SimulationThread,
+                                            interpolate)
+from settings import ENEMY_CAR_SPEED, ROAD_LINE_HEIGHT, ROAD_LINE_GAP
+
+class TestSnapshots(unittest.TestCase):
+    def setUp(self):
+        self.model = GameModel(RandomStreams(4))
+        self.model.game_state.detach(self.model.leaderboard)
+        self.simulation = Simulation(self.model)
+        for _ in range(120):
+            self.simulation.step()
+
+    def test_capture_copies_model(self):
+        snapshot = WorldSnapshot.capture(self.model, self.simulation.tick)
+        enemy_cars = self.model.game_objects.enemy_cars
+        self.assertEqual([(x, y) for _, x, y in snapshot.enemy_cars], list(zip(enemy_cars.x, enemy_cars.y)))
+        self.simulation.step()
+        self.assertEqual(snapshot.tick, 120)
+        with self.assertRaises(AttributeError):
+            snapshot.tick = 0
+
+    def test_interpolates_between_ticks(self):
+        previous = WorldSnapshot.capture(self.model, self.simulation.tick)
+        self.simulation.step(Input.LEFT)
+        current = WorldSnapshot.capture(self.model, self.simulation.tick)
+        halfway = interpolate(previous, current, 0.5)
+        self.assertAlmostEqual(halfway.player[0], (previous.player[0] + current.player[0]) / 2)
+        before = {handle: y for handle, _, y in previous.enemy_cars}
+        for handle, _, y in halfway.enemy_cars:
+            if handle in before:
+                self.assertAlmostEqual(y, before[handle] + ENEMY_CAR_SPEED / 2)
+        self.assertIs(interpolate(previous, current, 1), current)
+        self.assertIs(interpolate(None, current, 0.5), current)
+
+    def test_road_offset_wraps(self):
+        period = ROAD_LINE_HEIGHT + ROAD_LINE_GAP
+        snapshot = WorldSnapshot.capture(self.model, 0)
+        previous = snapshot._replace(road_offset=period - 2)
+        current = snapshot._replace(road_offset=2)
+        self.assertAlmostEqual(interpolate(previous, current, 0.75).road_offset, 1)
+
+    def test_snaps_far_jumps(self):
+        snapshot = WorldSnapshot.capture(self.model, 0)
+        previous = snapshot._replace(enemy_cars=((0, 100.0, 700.0),))
+        current = snapshot._replace(enemy_cars=((0, 100.0, -40.0),))
+        self.assertEqual(interpolate(previous, current, 0.5).enemy_cars, ((0, 100.0, -40.0),))
+
+    def test_buffer_keeps_two_newest(self):
+        buffer = SnapshotBuffer()
+        for tick in range(3):
+            buffer.publish(tick)
+        self.assertEqual(buffer.latest(), (1, 2))
+
+class TestInputQueue(unittest.TestCase):
+    def test_combines_and_holds(self):
+        queue = InputQueue()
+        self.assertEqual(queue.take(), Input.NONE)
+        queue.push(Input.LEFT)
+        queue.push(Input.NONE)
+        queue.push(Input.UP)
+        self.assertEqual(queue.take(), Input.LEFT | Input.UP)
+        self.assertEqual(queue.take(), Input.LEFT | Input.UP)
+        queue.push(Input.NONE)
+        self.assertEqual(queue.take(), Input.NONE)
+
+class TestSimulationThread(unittest.TestCase):
+    def setUp(self):
+        self.model = GameModel(RandomStreams(9))
+        self.model.game_state.detach(self.model.leaderboard)
+        self.simulation = Simulation(self.model, tick_rate=1000)
+
+    def test_steps_and_publishes(self):
+        thread = SimulationThread(self.simulation)
+        start_x = self.model.player.car_x
+        self.model.checkpoint_loaded_time = float("inf")  # Immune, so it never crashes
+        thread.inputs.push(Input.RIGHT)
+        thread.start()
+        while self.simulation.tick < 50:
+            thread.stopping.wait(0.001)
+        thread.stop()
+        self.assertFalse(thread.is_alive())
+        _, latest = thread.snapshots.latest()
+        self.assertEqual(latest.tick, self.simulation.tick)
+        self.assertGreater(latest.player[0], start_x)
+
+    def test_ends_on_crash(self):
+        player = self.model.player
+        self.model.game_objects.enemy_cars.append(CarFactory.create_car(
+            car_type='enemy', x=player.car_x, y=player.car_y - ENEMY_CAR_SPEED, speed=ENEMY_CAR_SPEED,
+            strategy=StraightMovement()))
+        thread = SimulationThread(self.simulation)
+        thread.start()
+        thread.join(5)
+        self.assertTrue(thread.crashed)
+        self.assertFalse(thread.snapshots.latest()[1].is_running)
+
+if __name__ == '__main__':
+    unittest.main()
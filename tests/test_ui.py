@@ -0,0 +1,57 @@
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import unittest
+import pygame
+from Game_files.UI import UI
+
+class FakeLeaderboard:
+    def __init__(self, scores):
+        self.scores = scores
+
+class TestScreenCache(unittest.TestCase):
+    def setUp(self):
+        pygame.init()
+        self.screen = pygame.display.set_mode((800, 700))
+        self.ui = UI(self.screen)
+
+    def tearDown(self):
+        pygame.display.quit()
+
+    def background(self, name):
+        return self.ui.screens[name][1]
+
+    def test_leaderboard_rebuilt_only_when_contents_change(self):
+        leaderboard = FakeLeaderboard([["amy", 5]])
+        self.ui.display_leaderboard(leaderboard, 3)
+        first = self.background("leaderboard")
+        self.ui.display_leaderboard(leaderboard, 3)
+        self.assertIs(self.background("leaderboard"), first)
+        leaderboard.scores.append(["bob", 4])
+        self.ui.display_leaderboard(leaderboard, 3)
+        self.assertIsNot(self.background("leaderboard"), first)
+
+    def test_name_input_keeps_background_while_typing(self):
+        self.ui.draw_name_input("a")
+        first = self.background("name input")
+        self.ui.draw_name_input("ab")
+        self.assertIs(self.background("name input"), first)
+
+    def test_cached_screen_matches_display(self):
+        self.ui.draw_car_selection()
+        self.assertEqual(self.screen.get_at((400, 90)), self.background("car selection").get_at((400, 90)))
+
+    def test_display_size_change_rebuilds(self):
+        self.ui.draw_car_selection()
+        first = self.background("car selection")
+        self.ui.screen = pygame.display.set_mode((400, 300))
+        self.ui.draw_car_selection()
+        self.assertEqual(self.background("car selection").get_size(), (400, 300))
+        self.assertIsNot(self.background("car selection"), first)
+
+    def test_card_click_uses_card_boxes(self):
+        box_x, box_y, box_width, box_height = self.ui.car_card_boxes()[1]
+        self.assertEqual(self.ui.handle_car_selection_click((box_x + box_width, box_y)), "lambo")
+        self.assertIsNone(self.ui.handle_car_selection_click((0, 0)))
+
+if __name__ == '__main__':
+    unittest.main()